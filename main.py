@@ -3,12 +3,10 @@ from __future__ import annotations
 import os
 import sys
 
-import flet as ft
-
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "src")))
 
-from werewolf_gm.main import main
+from werewolf_gm.main import run
 
 
 if __name__ == "__main__":
-    ft.app(main)
+    run()
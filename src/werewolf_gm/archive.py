@@ -0,0 +1,362 @@
+"""Columnar archive of finished games, one file per month.
+
+A file is ``MAGIC`` followed by blocks of up to ``BLOCK_GAMES`` games. A block stores
+each column as its own zlib stream of a little-endian ``array``: per-game columns
+(``finished``, ``victory``, ``days``, ``seats``) and per-seat columns (``name``,
+``role``, ``died`` = death day or -1, ``reason``, ``order``), seats laid out game
+after game. Names are indices into the block's ``names`` table. Readers memory-map
+the file and only inflate the columns they ask for.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import struct
+import sys
+import time
+import zlib
+from array import array
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import accumulate
+from pathlib import Path
+from typing import Iterable, Iterator, Sequence
+
+from werewolf_gm.domain import DeathReason, Game, Role, VictoryState
+
+ARCHIVE_ENV = "WEREWOLF_GM_ARCHIVE"
+MAGIC = b"WGA1"
+BLOCK_MAGIC = b"WGB1"
+BLOCK_GAMES = 1024
+SUFFIX = ".wga"
+
+# Stored codes are positions in these tuples, so new members must only be appended.
+VICTORY_CODES: tuple[VictoryState, ...] = tuple(VictoryState)
+ROLE_CODES: tuple[Role, ...] = tuple(Role)
+REASON_CODES: tuple[DeathReason | None, ...] = (None, *DeathReason)
+
+GAME_COLUMNS = {"finished": "q", "victory": "B", "days": "H", "seats": "H"}
+SEAT_COLUMNS = {"name": "I", "role": "B", "died": "h", "reason": "B", "order": "H"}
+_NAMES = "names"
+
+_BLOCK_HEADER = struct.Struct("<4sIIH")
+_COLUMN_HEADER = struct.Struct("<8scII")
+_DEATH_ORDER = {DeathReason.EXECUTED: 0, DeathReason.ATTACKED: 1, DeathReason.OTHER: 2}
+
+
+def default_directory() -> Path:
+    """``$WEREWOLF_GM_ARCHIVE`` or ``~/.werewolf_gm/archive``."""
+    return Path(os.environ.get(ARCHIVE_ENV) or Path.home() / ".werewolf_gm" / "archive")
+
+
+def archive_path(directory: str | Path, finished_at: float) -> Path:
+    return Path(directory) / f"{datetime.fromtimestamp(finished_at):%Y-%m}{SUFFIX}"
+
+
+@dataclass(slots=True, frozen=True)
+class ArchivedGame:
+    """One finished game in archive form; ``order[i]`` is 1 for the first death, 0 if alive."""
+
+    finished_at: int
+    victory: VictoryState
+    days: int
+    names: tuple[str, ...]
+    roles: tuple[Role, ...]
+    death_days: tuple[int | None, ...]
+    reasons: tuple[DeathReason | None, ...]
+    order: tuple[int, ...]
+
+    @classmethod
+    def of(cls, game: Game, finished_at: float | None = None) -> ArchivedGame:
+        """Snapshot ``game``; deaths on one day are ordered execution, attack, other."""
+        players = game.players
+        dead = sorted(
+            (index for index, player in enumerate(players) if not player.is_alive),
+            key=lambda index: (
+                players[index].death_day or 0,
+                _DEATH_ORDER.get(players[index].death_reason, len(_DEATH_ORDER)),
+                index,
+            ),
+        )
+        order = [0] * len(players)
+        for rank, index in enumerate(dead, start=1):
+            order[index] = rank
+        return cls(
+            finished_at=int(time.time() if finished_at is None else finished_at),
+            victory=game.victory.state,
+            days=game.day,
+            names=tuple(player.name for player in players),
+            roles=tuple(player.role for player in players),
+            death_days=tuple(None if player.is_alive else player.death_day for player in players),
+            reasons=tuple(player.death_reason for player in players),
+            order=tuple(order),
+        )
+
+
+def _to_le(values: array) -> bytes:
+    if sys.byteorder == "big" and values.itemsize > 1:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def _from_le(typecode: str, data: bytes) -> array:
+    values = array(typecode)
+    values.frombytes(data)
+    if sys.byteorder == "big" and values.itemsize > 1:
+        values.byteswap()
+    return values
+
+
+def _encode_block(games: Sequence[ArchivedGame]) -> bytes:
+    columns = {name: array(code) for name, code in {**GAME_COLUMNS, **SEAT_COLUMNS}.items()}
+    names: dict[str, int] = {}
+    for game in games:
+        columns["finished"].append(game.finished_at)
+        columns["victory"].append(VICTORY_CODES.index(game.victory))
+        columns["days"].append(game.days)
+        columns["seats"].append(len(game.roles))
+        for name in game.names:
+            columns["name"].append(names.setdefault(name, len(names)))
+        columns["role"].extend(ROLE_CODES.index(role) for role in game.roles)
+        columns["died"].extend(-1 if day is None else day for day in game.death_days)
+        columns["reason"].extend(REASON_CODES.index(reason) for reason in game.reasons)
+        columns["order"].extend(game.order)
+    columns[_NAMES] = array("B", "\0".join(names).encode())
+
+    headers: list[bytes] = []
+    payloads: list[bytes] = []
+    for name, values in columns.items():
+        raw = _to_le(values)
+        packed = zlib.compress(raw, 6)
+        headers.append(_COLUMN_HEADER.pack(name.encode(), values.typecode.encode(), len(raw), len(packed)))
+        payloads.append(packed)
+    seats = len(columns["role"])
+    return b"".join([_BLOCK_HEADER.pack(BLOCK_MAGIC, len(games), seats, len(columns)), *headers, *payloads])
+
+
+@dataclass(slots=True)
+class _Block:
+    games: int
+    seats: int
+    start: int
+    end: int
+    # name -> (typecode, offset, compressed size)
+    columns: dict[str, tuple[str, int, int]] = field(default_factory=dict)
+
+
+def _scan_blocks(data: bytes | mmap.mmap) -> list[_Block]:
+    if data[: len(MAGIC)] != MAGIC:
+        raise ValueError("Not a game archive")
+    blocks: list[_Block] = []
+    offset = len(MAGIC)
+    while offset < len(data):
+        magic, games, seats, count = _BLOCK_HEADER.unpack_from(data, offset)
+        if magic != BLOCK_MAGIC:
+            raise ValueError(f"Corrupt archive block at byte {offset}")
+        block = _Block(games=games, seats=seats, start=offset, end=0)
+        offset += _BLOCK_HEADER.size
+        payload = offset + count * _COLUMN_HEADER.size
+        for _ in range(count):
+            name, typecode, _, packed = _COLUMN_HEADER.unpack_from(data, offset)
+            block.columns[name.rstrip(b"\0").decode()] = (typecode.decode(), payload, packed)
+            offset += _COLUMN_HEADER.size
+            payload += packed
+        block.end = offset = payload
+        blocks.append(block)
+    return blocks
+
+
+def _read_column(data: bytes | mmap.mmap, block: _Block, name: str) -> array:
+    typecode, offset, packed = block.columns[name]
+    return _from_le(typecode, zlib.decompress(data[offset : offset + packed]))
+
+
+def _block_names(data: bytes | mmap.mmap, block: _Block) -> list[str]:
+    blob = _read_column(data, block, _NAMES).tobytes()
+    return blob.decode().split("\0") if blob else []
+
+
+def _decode_block(data: bytes | mmap.mmap, block: _Block) -> list[ArchivedGame]:
+    columns = {name: _read_column(data, block, name) for name in (*GAME_COLUMNS, *SEAT_COLUMNS)}
+    table = _block_names(data, block)
+    games: list[ArchivedGame] = []
+    start = 0
+    for index in range(block.games):
+        end = start + columns["seats"][index]
+        seats = range(start, end)
+        games.append(
+            ArchivedGame(
+                finished_at=columns["finished"][index],
+                victory=VICTORY_CODES[columns["victory"][index]],
+                days=columns["days"][index],
+                names=tuple(table[columns["name"][seat]] for seat in seats),
+                roles=tuple(ROLE_CODES[columns["role"][seat]] for seat in seats),
+                death_days=tuple(None if columns["died"][seat] < 0 else columns["died"][seat] for seat in seats),
+                reasons=tuple(REASON_CODES[columns["reason"][seat]] for seat in seats),
+                order=tuple(columns["order"][seat] for seat in seats),
+            )
+        )
+        start = end
+    return games
+
+
+def write_games(path: str | Path, games: Iterable[ArchivedGame]) -> None:
+    """Append ``games`` to the archive file at ``path``.
+
+    A partly filled last block is decoded and written again together with the new
+    games, so blocks stay close to ``BLOCK_GAMES`` no matter how games trickle in. Full
+    blocks are copied as they are, but the whole file is read and written to a new file
+    that atomically replaces it, so each call costs O(file size) I/O. Monthly files stay
+    small (about 14 bytes per game), and in exchange a crash never leaves a torn file
+    and open readers keep a valid memory map.
+    """
+    path = Path(path)
+    pending = list(games)
+    if not pending:
+        return
+    data = path.read_bytes() if path.exists() else MAGIC
+    blocks = _scan_blocks(data)
+    keep = len(data)
+    if blocks and blocks[-1].games < BLOCK_GAMES:
+        keep = blocks[-1].start
+        pending = _decode_block(data, blocks[-1]) + pending
+    parts = [data[:keep]]
+    for start in range(0, len(pending), BLOCK_GAMES):
+        parts.append(_encode_block(pending[start : start + BLOCK_GAMES]))
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(path.name + ".tmp")
+    temporary.write_bytes(b"".join(parts))
+    os.replace(temporary, path)
+
+
+def append_game(directory: str | Path, game: Game, finished_at: float | None = None) -> Path:
+    """Archive ``game`` in the file for the month it finished."""
+    archived = ArchivedGame.of(game, finished_at)
+    path = archive_path(directory, archived.finished_at)
+    write_games(path, [archived])
+    return path
+
+
+class ArchiveReader:
+    """Column access to one archive file through a read-only memory map."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        with self.path.open("rb") as stream:
+            self._map = mmap.mmap(stream.fileno(), 0, access=mmap.ACCESS_READ)
+        self._blocks = _scan_blocks(self._map)
+        self.games = sum(block.games for block in self._blocks)
+        self.seats = sum(block.seats for block in self._blocks)
+
+    def __enter__(self) -> ArchiveReader:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._map.close()
+
+    def column(self, name: str) -> array:
+        """Every value of ``name`` across the file (per game or per seat).
+
+        ``name`` indices are local to a block; use :meth:`seat_names` for names.
+        """
+        values = array(GAME_COLUMNS.get(name) or SEAT_COLUMNS[name])
+        for block in self._blocks:
+            values.extend(_read_column(self._map, block, name))
+        return values
+
+    def seat_offsets(self) -> list[int]:
+        """Start of each game's seats in the per-seat columns, plus the total at the end."""
+        return [0, *accumulate(self.column("seats"))]
+
+    def seat_names(self) -> list[str]:
+        names: list[str] = []
+        for block in self._blocks:
+            table = _block_names(self._map, block)
+            names.extend(table[index] for index in _read_column(self._map, block, "name"))
+        return names
+
+    def iter_games(self, start: int = 0) -> Iterator[ArchivedGame]:
+        """Whole games from index ``start`` on, decoded block by block (slower than column scans)."""
+        for block in self._blocks:
+            if start >= block.games:
+                start -= block.games
+                continue
+            yield from _decode_block(self._map, block)[start:]
+            start = 0
+
+
+def open_archives(directory: str | Path) -> list[ArchiveReader]:
+    """Readers for every month in ``directory``, oldest first."""
+    return [ArchiveReader(path) for path in sorted(Path(directory).glob(f"*{SUFFIX}"))]
+
+
+@dataclass(slots=True)
+class ArchiveStats:
+    games: int = 0
+    total_days: int = 0
+    victories: Counter[VictoryState] = field(default_factory=Counter)
+    # Role counts as "werewolf×2 seer×1 ..." -> (games, villager wins).
+    compositions: dict[str, list[int]] = field(default_factory=dict)
+    first_deaths: Counter[Role] = field(default_factory=Counter)
+
+    @property
+    def average_days(self) -> float:
+        return self.total_days / self.games if self.games else 0.0
+
+    def format(self) -> str:
+        lines = [f"games: {self.games}, average days: {self.average_days:.2f}"]
+        lines.extend(f"{state.value}: {count}" for state, count in self.victories.most_common())
+        lines.append("compositions (games, villager win rate):")
+        for key, (games, villager_wins) in sorted(self.compositions.items(), key=lambda item: -item[1][0]):
+            lines.append(f"  {key}: {games}, {villager_wins / games:.0%}")
+        first_deaths = ", ".join(f"{role.value} {count}" for role, count in self.first_deaths.most_common())
+        lines.append(f"first death: {first_deaths}")
+        return "\n".join(lines)
+
+
+def _composition_label(key: bytes) -> str:
+    counts = Counter(key)
+    return " ".join(f"{ROLE_CODES[code].value}×{counts[code]}" for code in sorted(counts))
+
+
+def archive_stats(readers: Iterable[ArchiveReader]) -> ArchiveStats:
+    """Win rates, day counts, compositions and first deaths from column scans only."""
+    stats = ArchiveStats()
+    villager_code = VICTORY_CODES.index(VictoryState.VILLAGER_WIN)
+    compositions: dict[bytes, list[int]] = {}
+    first_deaths: Counter[int] = Counter()
+    for reader in readers:
+        victory = reader.column("victory").tobytes()
+        roles = reader.column("role").tobytes()
+        order = reader.column("order")
+        first = array(order.typecode, [1]).tobytes()
+        order_bytes = order.tobytes()
+        offsets = reader.seat_offsets()
+
+        stats.games += reader.games
+        stats.total_days += sum(reader.column("days"))
+        for code, count in Counter(victory).items():
+            stats.victories[VICTORY_CODES[code]] += count
+        for index in range(reader.games):
+            key = bytes(sorted(roles[offsets[index] : offsets[index + 1]]))
+            entry = compositions.get(key)
+            if entry is None:
+                entry = compositions[key] = [0, 0]
+            entry[0] += 1
+            entry[1] += victory[index] == villager_code
+        position = order_bytes.find(first)
+        while position != -1:
+            if not position % order.itemsize:
+                first_deaths[roles[position // order.itemsize]] += 1
+            position = order_bytes.find(first, position + 1)
+
+    stats.compositions = {_composition_label(key): entry for key, entry in compositions.items()}
+    stats.first_deaths = Counter({ROLE_CODES[code]: count for code, count in first_deaths.items()})
+    return stats
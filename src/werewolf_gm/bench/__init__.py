@@ -0,0 +1 @@
+"""Benchmarks runnable with ``python -m werewolf_gm bench``; stdlib only, no services."""
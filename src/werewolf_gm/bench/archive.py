@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import random
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+
+from werewolf_gm.archive import ArchiveStats, ArchivedGame, archive_path, archive_stats, open_archives, write_games
+from werewolf_gm.simulation import simulate_game
+
+# Distinct simulated games; larger archives repeat them (the scan cost is the same).
+DISTINCT_GAMES = 500
+MONTH_SECONDS = 30 * 24 * 3600
+
+
+@dataclass(slots=True)
+class ArchiveBench:
+    games: int
+    months: int
+    size_bytes: int
+    write_seconds: float
+    scan_seconds: float
+    stats: ArchiveStats
+
+    def format(self) -> str:
+        return (
+            f"{self.games} games in {self.months} monthly files, {self.size_bytes / 1024:.0f} KiB "
+            f"({self.size_bytes / max(self.games, 1):.1f} B/game)\n"
+            f"write: {self.write_seconds * 1000:.0f} ms, stats scan: {self.scan_seconds * 1000:.1f} ms"
+        )
+
+
+def sample_games(games: int, *, months: int = 12, seed: int = 0) -> list[ArchivedGame]:
+    """``games`` finished games at 5-15 players spread evenly over ``months``."""
+    rng = random.Random(seed)
+    distinct = [
+        simulate_game(rng.randint(5, 15), seed=seed + index).game for index in range(min(games, DISTINCT_GAMES))
+    ]
+    start = 1_700_000_000
+    step = months * MONTH_SECONDS / max(games, 1)
+    return [ArchivedGame.of(distinct[index % len(distinct)], start + index * step) for index in range(games)]
+
+
+def run_archive_bench(directory: str | Path, games: int = 20_000, *, months: int = 12, seed: int = 0) -> ArchiveBench:
+    """Write a sample archive to ``directory`` and time a full stats scan over it."""
+    by_month: dict[Path, list[ArchivedGame]] = defaultdict(list)
+    for game in sample_games(games, months=months, seed=seed):
+        by_month[archive_path(directory, game.finished_at)].append(game)
+
+    started_at = time.perf_counter()
+    for path, month_games in by_month.items():
+        write_games(path, month_games)
+    write_seconds = time.perf_counter() - started_at
+
+    started_at = time.perf_counter()
+    readers = open_archives(directory)
+    stats = archive_stats(readers)
+    scan_seconds = time.perf_counter() - started_at
+    for reader in readers:
+        reader.close()
+    return ArchiveBench(
+        games=stats.games,
+        months=len(readers),
+        size_bytes=sum(path.stat().st_size for path in by_month),
+        write_seconds=write_seconds,
+        scan_seconds=scan_seconds,
+        stats=stats,
+    )
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from werewolf_gm.replay import GameOutcome, GameRecord
+
+
+@dataclass(slots=True)
+class CorpusReport:
+    """Replay of a record corpus: throughput plus every game whose outcome changed."""
+
+    games: int = 0
+    commands: int = 0
+    seconds: float = 0.0
+    unchecked: int = 0
+    mismatches: list[str] = field(default_factory=list)
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.seconds if self.seconds else 0.0
+
+    @property
+    def commands_per_second(self) -> float:
+        return self.commands / self.seconds if self.seconds else 0.0
+
+    def format(self) -> str:
+        lines = [
+            f"games: {self.games} ({self.commands} commands, {self.unchecked} without outcome)",
+            f"replay: {self.seconds * 1000:.1f} ms, {self.games_per_second:.0f} games/s, "
+            f"{self.commands_per_second:.0f} commands/s",
+        ]
+        lines.extend(f"mismatch: {line}" for line in self.mismatches)
+        return "\n".join(lines)
+
+
+def _describe(outcome: GameOutcome) -> str:
+    return f"{outcome.victory.value} day {outcome.day} {outcome.phase.value} #{outcome.fingerprint:016x}"
+
+
+def replay_corpus(
+    records: Iterable[GameRecord],
+    *,
+    repeat: int = 1,
+    use_player_table: bool = False,
+) -> CorpusReport:
+    """Replay every record ``repeat`` times and compare the end state with its outcome.
+
+    Only the replay itself (building the game and applying the commands) is timed.
+    """
+    records = list(records)
+    report = CorpusReport()
+    for round_index in range(repeat):
+        for index, record in enumerate(records):
+            started_at = time.perf_counter()
+            game = record.new_game()
+            if use_player_table:
+                game.use_player_table()
+            game.apply(record.commands)
+            report.seconds += time.perf_counter() - started_at
+            report.games += 1
+            report.commands += len(record.commands)
+            if round_index:
+                continue
+            if record.outcome is None:
+                report.unchecked += 1
+                continue
+            actual = GameOutcome.of(game)
+            if actual != record.outcome:
+                label = f"#{index}" if record.seed is None else f"#{index} (seed {record.seed})"
+                report.mismatches.append(f"{label}: expected {_describe(record.outcome)}, got {_describe(actual)}")
+    return report
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import itertools
+import random
+from typing import Callable, Sequence
+
+from werewolf_gm.domain import DeathReason, Game, GamePhase, Role
+from werewolf_gm.simulation import build_game
+
+from .timing import Case, Results, measure
+
+DEFAULT_SIZES = (5, 50, 500, 5000)
+# Consuming cases fork the game once per op; this bounds the forks alive at once.
+FORKS_PER_BATCH = 1_000
+
+
+def day_one_game(player_count: int, *, seed: int = 0, use_player_table: bool = False) -> Game:
+    """A started game with the default village, advanced to the first DAY."""
+    game = build_game(player_count, rng=random.Random(seed))
+    if use_player_table:
+        game.use_player_table()
+    game.start_game()
+    while game.phase is not GamePhase.DAY:
+        game.proceed_to_next_phase()
+    return game
+
+
+def _citizen_ids(game: Game) -> list[int]:
+    return [player.id for player in game.alive_players_by_role(Role.CITIZEN)]
+
+
+def _get_player(game: Game) -> Case[int]:
+    ids = itertools.cycle([player.id for player in game.players])
+    return Case(make_state=ids.__next__, op=game.get_player)
+
+
+def _refresh_victory(game: Game) -> Case[Game]:
+    return Case(make_state=lambda: game, op=Game.refresh_victory)
+
+
+def _proceed_to_next_phase(game: Game) -> Case[Game]:
+    # Nobody dies, so this cycles DAY -> ... -> NIGHT_WEREWOLF -> DAY forever.
+    return Case(make_state=lambda: game, op=Game.proceed_to_next_phase)
+
+
+def _kill_player(game: Game) -> Case[tuple[Game, int]]:
+    victims = itertools.cycle(_citizen_ids(game))
+    return Case(
+        make_state=lambda: (game.fork(), next(victims)),
+        op=lambda state: state[0].kill_player(state[1], DeathReason.EXECUTED),
+        max_ops=FORKS_PER_BATCH,
+    )
+
+
+def _resolve_night_actions(game: Game) -> Case[Game]:
+    while game.phase is not GamePhase.NIGHT_WEREWOLF:
+        game.proceed_to_next_phase()
+    victim_id, guarded_id = _citizen_ids(game)[:2]
+    game.set_guard_target(guarded_id)
+    game.set_attack_target(victim_id)
+    return Case(make_state=game.fork, op=Game.resolve_night_actions, max_ops=FORKS_PER_BATCH)
+
+
+DOMAIN_BENCHMARKS: dict[str, Callable[[Game], Case]] = {
+    "get_player": _get_player,
+    "refresh_victory": _refresh_victory,
+    "proceed_to_next_phase": _proceed_to_next_phase,
+    "kill_player": _kill_player,
+    "resolve_night_actions": _resolve_night_actions,
+}
+
+
+def run_domain_benchmarks(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    *,
+    names: Sequence[str] | None = None,
+    use_player_table: bool = False,
+    min_seconds: float = 0.02,
+    repeat: int = 5,
+) -> Results:
+    """Time each domain operation on a fresh day-1 game of every size."""
+    results: Results = {}
+    for name in names or DOMAIN_BENCHMARKS:
+        build_case = DOMAIN_BENCHMARKS[name]
+        results[name] = {
+            size: measure(
+                build_case(day_one_game(size, use_player_table=use_player_table)),
+                min_seconds=min_seconds,
+                repeat=repeat,
+            )
+            for size in sizes
+        }
+    return results
@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import random
+import resource
+import statistics
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Sequence
+
+from werewolf_gm.ui.app import WerewolfApp
+
+from .ui import FakePage, scenario_steps
+
+DEFAULT_SESSION_COUNTS = (1, 10, 50, 100, 200, 400)
+# A session is over budget once clicks wait this long for the loop (p99).
+DEFAULT_BUDGET_MS = 100.0
+
+
+class AsyncFakePage(FakePage):
+    """``FakePage`` whose ``run_task`` really schedules the coroutine, so timers tick."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.tasks: list[asyncio.Task[Any]] = []
+
+    def run_task(self, handler: Callable[..., Any], *args: Any) -> asyncio.Task[Any]:
+        super().run_task(handler, *args)
+        task = asyncio.get_running_loop().create_task(handler(*args))
+        self.tasks.append(task)
+        return task
+
+
+@dataclass(slots=True)
+class LoadResult:
+    sessions: int
+    interactions: int = 0
+    timer_ticks: int = 0
+    handler_ms: list[float] = field(default_factory=list)
+    response_ms: list[float] = field(default_factory=list)
+    loop_lag_ms: list[float] = field(default_factory=list)
+    peak_rss_mb: float = 0.0
+
+    @property
+    def handler_p50_ms(self) -> float:
+        return _percentile(self.handler_ms, 50)
+
+    @property
+    def handler_p99_ms(self) -> float:
+        return _percentile(self.handler_ms, 99)
+
+    @property
+    def response_p99_ms(self) -> float:
+        return _percentile(self.response_ms, 99)
+
+    @property
+    def loop_lag_p99_ms(self) -> float:
+        return _percentile(self.loop_lag_ms, 99)
+
+    def within_budget(self, budget_ms: float = DEFAULT_BUDGET_MS) -> bool:
+        return self.response_p99_ms <= budget_ms and self.loop_lag_p99_ms <= budget_ms
+
+
+def _percentile(values: list[float], percent: int) -> float:
+    if not values:
+        return 0.0
+    if len(values) == 1:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[percent - 1]
+
+
+def current_rss_mb() -> float:
+    """Resident set size now (Linux), falling back to the peak reported by getrusage."""
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            pages = int(statm.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except (OSError, ValueError, IndexError):
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and kilobytes elsewhere.
+        return peak / 2**20 if sys.platform == "darwin" else peak / 1024
+
+
+async def _run_session(
+    result: LoadResult,
+    rng: random.Random,
+    *,
+    until: float,
+    players: int,
+    think_seconds: float,
+    timer_interval: float,
+) -> None:
+    loop = asyncio.get_running_loop()
+    await asyncio.sleep(rng.uniform(0, think_seconds))
+    while loop.time() < until:
+        page = AsyncFakePage()
+        app = WerewolfApp(page)  # type: ignore[arg-type]
+        app.timer_interval_seconds = timer_interval
+        try:
+            for _, action in scenario_steps(app, players, rng):
+                due_at = time.perf_counter()
+                action()
+                finished_at = time.perf_counter()
+                result.interactions += 1
+                result.handler_ms.append((finished_at - due_at) * 1000)
+                think = rng.expovariate(1 / think_seconds)
+                if loop.time() + think >= until:
+                    return
+                await asyncio.sleep(think)
+                # Late wakeups count towards the next click's response time.
+                lateness = time.perf_counter() - finished_at - think
+                result.response_ms.append(max(0.0, lateness) * 1000 + result.handler_ms[-1])
+        finally:
+            app.state.timer_running = False
+            for task in page.tasks:
+                task.cancel()
+            stats = app.commands.stats.get("timer_tick")
+            if stats is not None:
+                result.timer_ticks += stats.count
+
+
+async def _monitor(result: LoadResult, *, until: float, interval: float) -> None:
+    loop = asyncio.get_running_loop()
+    while loop.time() < until:
+        started_at = loop.time()
+        await asyncio.sleep(interval)
+        result.loop_lag_ms.append(max(0.0, loop.time() - started_at - interval) * 1000)
+        result.peak_rss_mb = max(result.peak_rss_mb, current_rss_mb())
+
+
+async def run_sessions(
+    sessions: int,
+    *,
+    duration: float = 20.0,
+    players: int = 9,
+    think_seconds: float = 0.5,
+    timer_interval: float = 1.0,
+    seed: int = 0,
+) -> LoadResult:
+    """Run ``sessions`` apps on this loop for ``duration`` seconds of clicks and timer ticks."""
+    result = LoadResult(sessions=sessions)
+    until = asyncio.get_running_loop().time() + duration
+    rng = random.Random(seed)
+    await asyncio.gather(
+        _monitor(result, until=until, interval=0.01),
+        *(
+            _run_session(
+                result,
+                random.Random(rng.random()),
+                until=until,
+                players=players,
+                think_seconds=think_seconds,
+                timer_interval=timer_interval,
+            )
+            for _ in range(sessions)
+        ),
+    )
+    return result
+
+
+def run_load(session_counts: Sequence[int] = DEFAULT_SESSION_COUNTS, **options: Any) -> list[LoadResult]:
+    return [asyncio.run(run_sessions(count, **options)) for count in session_counts]
+
+
+def session_limit(results: Sequence[LoadResult], *, budget_ms: float = DEFAULT_BUDGET_MS) -> int | None:
+    """Largest session count that stayed within budget, or None if none did."""
+    limit = None
+    for result in sorted(results, key=lambda result: result.sessions):
+        if not result.within_budget(budget_ms):
+            break
+        limit = result.sessions
+    return limit
+
+
+def format_load(results: Sequence[LoadResult], *, budget_ms: float = DEFAULT_BUDGET_MS) -> str:
+    header = (
+        f"{'sessions':>8}{'clicks':>8}{'ticks':>8}{'p50 ms':>9}{'p99 ms':>9}"
+        f"{'resp p99':>10}{'lag p99':>9}{'rss MB':>8}  "
+    )
+    lines = [header, "-" * len(header)]
+    for result in results:
+        lines.append(
+            f"{result.sessions:>8}{result.interactions:>8}{result.timer_ticks:>8}"
+            f"{result.handler_p50_ms:>9.2f}{result.handler_p99_ms:>9.2f}{result.response_p99_ms:>10.1f}"
+            f"{result.loop_lag_p99_ms:>9.1f}{result.peak_rss_mb:>8.0f}  {'ok' if result.within_budget(budget_ms) else 'OVER'}"
+        )
+    limit = session_limit(results, budget_ms=budget_ms)
+    if limit is None:
+        lines.append(f"per-process limit: below {min(result.sessions for result in results)} sessions")
+    else:
+        lines.append(f"per-process limit: about {limit} sessions (p99 response and loop lag <= {budget_ms:.0f} ms)")
+    return "\n".join(lines)
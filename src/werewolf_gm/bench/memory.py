@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import gc
+import os
+import random
+import statistics
+import sys
+import tracemalloc
+import warnings
+from dataclasses import dataclass, field
+
+from werewolf_gm.ui.app import WerewolfApp
+
+from .ui import FakePage, scenario_steps
+
+# Steady-state growth above this is reported as a leak.
+DEFAULT_TOLERANCE_KIB_PER_GAME = 1.0
+
+
+@dataclass(slots=True)
+class MemoryReport:
+    """Traced Python memory while one ``WerewolfApp`` plays game after game.
+
+    ``retained_kib[i]`` is what is still allocated after game ``i`` finished (and the
+    app went back to setup via ``reset_game``) and a full collection ran.
+    """
+
+    players: int
+    warmup_games: int
+    session_kib: float = 0.0
+    retained_kib: list[float] = field(default_factory=list)
+    top_sites: list[str] = field(default_factory=list)
+
+    @property
+    def growth_kib_per_game(self) -> float:
+        """Least-squares slope of retained memory over the games after warm-up."""
+        samples = self.retained_kib[self.warmup_games :]
+        if len(samples) < 2:
+            return 0.0
+        return statistics.linear_regression(range(len(samples)), samples).slope
+
+    def is_leaking(self, tolerance_kib_per_game: float = DEFAULT_TOLERANCE_KIB_PER_GAME) -> bool:
+        return self.growth_kib_per_game > tolerance_kib_per_game
+
+    def format(self) -> str:
+        lines = [
+            f"players: {self.players}, games: {len(self.retained_kib)} (warm-up {self.warmup_games})",
+            f"session after warm-up: {self.session_kib:.1f} KiB",
+            "retained after each game (KiB): " + ", ".join(f"{value:.1f}" for value in self.retained_kib),
+            f"growth: {self.growth_kib_per_game:+.2f} KiB/game",
+        ]
+        if self.top_sites:
+            lines.append("largest growth since warm-up:")
+            lines.extend(f"  {site}" for site in self.top_sites)
+        return "\n".join(lines)
+
+
+def clear_bounded_caches() -> None:
+    """Empty every size-limited ``lru_cache`` in werewolf_gm.
+
+    Such caches grow until they hit their limit, which looks like a leak over a few
+    games but is not one.
+    """
+    for name, module in list(sys.modules.items()):
+        if not name.startswith("werewolf_gm") or module is None:
+            continue
+        for value in list(vars(module).values()):
+            cache_info = getattr(value, "cache_info", None)
+            if cache_info is not None and cache_info().maxsize is not None:
+                value.cache_clear()
+
+
+def _traced_kib() -> float:
+    clear_bounded_caches()
+    gc.collect()
+    return tracemalloc.get_traced_memory()[0] / 1024
+
+
+def profile_session_memory(
+    games: int = 20,
+    *,
+    players: int = 9,
+    warmup_games: int = 3,
+    seed: int = 0,
+    top: int = 10,
+    frames: int = 8,
+) -> MemoryReport:
+    """Play ``games`` full games in one app under tracemalloc.
+
+    Memory that is still held after warm-up and keeps growing game over game is what a
+    long-running web session would leak; the sites with the largest growth between the
+    end of warm-up and the last game are listed with their allocating tracebacks.
+    """
+    report = MemoryReport(players=players, warmup_games=warmup_games)
+    rng = random.Random(seed)
+    started_here = not tracemalloc.is_tracing()
+    if started_here:
+        tracemalloc.start(frames)
+    try:
+        before_session = _traced_kib()
+        app = WerewolfApp(FakePage())  # type: ignore[arg-type]
+        baseline: tracemalloc.Snapshot | None = None
+        for index in range(games):
+            # Warnings raised while rendering (Flet deprecations) are recorded by pytest
+            # and the warnings registry for the whole session, which would read as a leak.
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                for _, action in scenario_steps(app, players, rng, launch=index == 0):
+                    action()
+            report.retained_kib.append(_traced_kib() - before_session)
+            if index + 1 == warmup_games:
+                report.session_kib = report.retained_kib[-1]
+                baseline = tracemalloc.take_snapshot()
+        if baseline is not None and games > warmup_games:
+            _traced_kib()
+            report.top_sites = _growth_sites(baseline, tracemalloc.take_snapshot(), top)
+    finally:
+        if started_here:
+            tracemalloc.stop()
+    return report
+
+
+def _growth_sites(before: tracemalloc.Snapshot, after: tracemalloc.Snapshot, top: int) -> list[str]:
+    ignore = (tracemalloc.Filter(False, tracemalloc.__file__), tracemalloc.Filter(False, __file__))
+    stats = after.filter_traces(ignore).compare_to(before.filter_traces(ignore), "traceback")
+    sites: list[str] = []
+    for stat in stats:
+        if stat.size_diff <= 0:
+            continue
+        frame = _first_project_frame(stat.traceback)
+        sites.append(f"{stat.size_diff / 1024:+.1f} KiB ({stat.count_diff:+d} blocks) {frame}")
+        if len(sites) == top:
+            break
+    return sites
+
+
+def _first_project_frame(traceback: tracemalloc.Traceback) -> str:
+    # The allocation itself is often inside Flet or the stdlib; also show the innermost
+    # werewolf_gm frame that led to it.
+    innermost = traceback[-1]
+    for frame in reversed(traceback):
+        if "werewolf_gm" in frame.filename and f"{os.sep}bench{os.sep}" not in frame.filename:
+            if (frame.filename, frame.lineno) == (innermost.filename, innermost.lineno):
+                return f"{frame.filename}:{frame.lineno}"
+            return f"{innermost.filename}:{innermost.lineno} via {frame.filename}:{frame.lineno}"
+    return f"{innermost.filename}:{innermost.lineno}"
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Generic, Mapping, TypeVar
+
+S = TypeVar("S")
+
+BASELINE_VERSION = 1
+# Slower than the baseline by more than this factor counts as a regression.
+DEFAULT_THRESHOLD = 1.25
+
+Results = dict[str, dict[int, "Measurement"]]
+
+
+@dataclass(slots=True)
+class Case(Generic[S]):
+    """One timed operation: ``op`` runs once per state from ``make_state``.
+
+    Operations that consume their state (a kill, a night resolution) build a fresh
+    state per op outside the timed loop; repeatable ones return the same object.
+    ``max_ops`` bounds how many states are alive at once.
+    """
+
+    make_state: Callable[[], S]
+    op: Callable[[S], object]
+    max_ops: int = 100_000
+
+
+@dataclass(slots=True)
+class Measurement:
+    ns_per_op: float
+    median_ns_per_op: float
+    blocks_per_op: float
+    ops: int
+
+    def to_dict(self) -> dict[str, Any]:
+        # Rounded so committed baselines diff cleanly.
+        return {
+            "ns_per_op": round(self.ns_per_op, 1),
+            "median_ns_per_op": round(self.median_ns_per_op, 1),
+            "blocks_per_op": round(self.blocks_per_op, 3),
+            "ops": self.ops,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> Measurement:
+        return cls(
+            ns_per_op=float(data["ns_per_op"]),
+            median_ns_per_op=float(data["median_ns_per_op"]),
+            blocks_per_op=float(data["blocks_per_op"]),
+            ops=int(data["ops"]),
+        )
+
+
+def measure(case: Case[Any], *, min_seconds: float = 0.02, repeat: int = 5) -> Measurement:
+    """Best and median ns/op over ``repeat`` batches sized to take ``min_seconds``.
+
+    ``blocks_per_op`` is the net change in live interpreter memory blocks per op
+    (``sys.getallocatedblocks``), i.e. what an operation leaves allocated.
+    """
+    ops = 1
+    while True:
+        elapsed_ns, _ = _run_batch(case, ops)
+        if elapsed_ns >= min_seconds * 1e9 or ops >= case.max_ops:
+            break
+        ops = min(case.max_ops, ops * 10)
+
+    per_op: list[float] = []
+    blocks: list[int] = []
+    for _ in range(repeat):
+        elapsed_ns, block_delta = _run_batch(case, ops)
+        per_op.append(elapsed_ns / ops)
+        blocks.append(block_delta)
+    return Measurement(
+        ns_per_op=min(per_op),
+        median_ns_per_op=statistics.median(per_op),
+        blocks_per_op=statistics.median(blocks) / ops,
+        ops=ops,
+    )
+
+
+def _run_batch(case: Case[Any], ops: int) -> tuple[int, int]:
+    states = [case.make_state() for _ in range(ops)]
+    op = case.op
+    gc.collect()
+    gc.disable()
+    try:
+        blocks_before = sys.getallocatedblocks()
+        started_at = time.perf_counter_ns()
+        for state in states:
+            op(state)
+        elapsed = time.perf_counter_ns() - started_at
+        blocks_after = sys.getallocatedblocks()
+    finally:
+        gc.enable()
+    return elapsed, blocks_after - blocks_before
+
+
+def results_to_dict(results: Results) -> dict[str, Any]:
+    return {
+        "version": BASELINE_VERSION,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": {
+            name: {str(size): measurement.to_dict() for size, measurement in by_size.items()}
+            for name, by_size in results.items()
+        },
+    }
+
+
+def results_from_dict(data: Mapping[str, Any]) -> Results:
+    version = data.get("version", BASELINE_VERSION)
+    if version != BASELINE_VERSION:
+        raise ValueError(f"Unsupported baseline version: {version}")
+    return {
+        name: {int(size): Measurement.from_dict(entry) for size, entry in by_size.items()}
+        for name, by_size in data["results"].items()
+    }
+
+
+def save_results(results: Results, path: str | Path) -> None:
+    Path(path).write_text(json.dumps(results_to_dict(results), indent=1, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def load_results(path: str | Path) -> Results:
+    return results_from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+def compare_results(baseline: Results, current: Results, *, threshold: float = DEFAULT_THRESHOLD) -> list[str]:
+    """One line per (benchmark, size) that got slower than ``threshold`` times the baseline."""
+    regressions: list[str] = []
+    for name, by_size in current.items():
+        for size, measurement in by_size.items():
+            before = baseline.get(name, {}).get(size)
+            if before is None or before.ns_per_op <= 0:
+                continue
+            ratio = measurement.ns_per_op / before.ns_per_op
+            if ratio > threshold:
+                regressions.append(
+                    f"{name}[{size}]: {before.ns_per_op:.0f} -> {measurement.ns_per_op:.0f} ns/op ({ratio:.2f}x)"
+                )
+    return regressions
+
+
+def format_table(results: Results) -> str:
+    """ns/op per size, blocks/op at the largest size and growth from the smallest to the largest."""
+    sizes = sorted({size for by_size in results.values() for size in by_size})
+    width = max([len("benchmark"), *(len(name) for name in results)])
+    header = f"{'benchmark':<{width}}" + "".join(f"{size:>12}" for size in sizes) + f"{'blocks/op':>11}{'growth':>9}"
+    lines = [header, "-" * len(header)]
+    for name, by_size in results.items():
+        cells = "".join(
+            f"{by_size[size].ns_per_op:>12,.0f}" if size in by_size else f"{'-':>12}" for size in sizes
+        )
+        present = [by_size[size] for size in sizes if size in by_size]
+        growth = present[-1].ns_per_op / present[0].ns_per_op if present and present[0].ns_per_op else 0.0
+        lines.append(f"{name:<{width}}{cells}{present[-1].blocks_per_op:>11.2f}{growth:>8.1f}x")
+    return "\n".join(lines)
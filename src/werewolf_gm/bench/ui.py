@@ -0,0 +1,267 @@
+from __future__ import annotations
+
+import json
+import random
+import statistics
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Iterator
+
+import flet as ft
+import msgpack
+from flet.messaging.protocol import configure_encode_object_for_msgpack
+
+from werewolf_gm.domain import FirstDaySeerRule, GamePhase
+from werewolf_gm.simulation import default_roles
+from werewolf_gm.ui.app import WerewolfApp
+from werewolf_gm.ui.tabs import GameTab
+
+from .timing import BASELINE_VERSION, DEFAULT_THRESHOLD
+
+_encode_control = configure_encode_object_for_msgpack(ft.BaseControl)
+
+
+def serialize_control(control: ft.BaseControl) -> bytes:
+    """The control tree as Flet encodes it for the client (full tree, not a patch)."""
+    return msgpack.packb(control, default=_encode_control)
+
+
+def count_controls(payload: bytes) -> int:
+    stack = [msgpack.unpackb(payload)]
+    count = 0
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            if "_c" in node:
+                count += 1
+            stack.extend(node.values())
+        elif isinstance(node, list):
+            stack.extend(node)
+    return count
+
+
+class FakePage:
+    """Stand-in for ``ft.Page`` that records renders instead of talking to a client.
+
+    ``run_task`` is recorded but never run, so the timer loop stays idle and a scenario
+    is deterministic.
+    """
+
+    def __init__(self) -> None:
+        self.title = ""
+        self.window = SimpleNamespace(width=None, height=None, resizable=True)
+        self.padding = None
+        self.theme_mode = None
+        self.views: list[ft.View] = []
+        self.route = "/"
+        self.on_route_change: Callable[[Any], None] | None = None
+        self.snack_bar: ft.SnackBar | None = None
+        self.dialogs: list[ft.AlertDialog] = []
+        self.update_count = 0
+        self.partial_updates = 0
+        self.view_rebuilds = 0
+        self.tasks_started = 0
+        self._rendered_view: ft.View | None = None
+
+    def go(self, route: str) -> None:
+        self.route = route
+        if self.on_route_change is not None:
+            self.on_route_change(SimpleNamespace(route=route))
+
+    def update(self, *controls: ft.BaseControl) -> None:
+        self.update_count += 1
+        if controls:
+            self.partial_updates += 1
+            return
+        view = self.views[-1] if self.views else None
+        if view is not None and view is not self._rendered_view:
+            self.view_rebuilds += 1
+        self._rendered_view = view
+
+    def show_dialog(self, dialog: ft.AlertDialog) -> None:
+        dialog.open = True
+        self.dialogs.append(dialog)
+        self.update()
+
+    def pop_dialog(self) -> ft.AlertDialog | None:
+        return self.dialogs.pop() if self.dialogs else None
+
+    def run_task(self, handler: Callable[..., Any], *args: Any) -> None:
+        self.tasks_started += 1
+
+    def tree_payloads(self) -> list[bytes]:
+        """Serialized top view plus any open dialog and snack bar."""
+        controls: list[ft.BaseControl] = self.views[-1:] + self.dialogs[-1:]
+        if self.snack_bar is not None and self.snack_bar.open:
+            controls.append(self.snack_bar)
+        return [serialize_control(control) for control in controls]
+
+
+@dataclass(slots=True)
+class Interaction:
+    name: str
+    seconds: float
+    updates: int
+    view_rebuilds: int
+    controls: int
+    bytes: int
+
+
+@dataclass(slots=True)
+class ScenarioReport:
+    player_count: int
+    interactions: list[Interaction] = field(default_factory=list)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        grouped: dict[str, list[Interaction]] = {}
+        for interaction in self.interactions:
+            grouped.setdefault(interaction.name, []).append(interaction)
+        return {
+            name: {
+                "count": len(items),
+                "mean_ms": round(statistics.fmean(item.seconds for item in items) * 1000, 3),
+                "max_ms": round(max(item.seconds for item in items) * 1000, 3),
+                "updates": round(statistics.fmean(item.updates for item in items), 2),
+                "rebuilds": round(statistics.fmean(item.view_rebuilds for item in items), 2),
+                "controls": round(statistics.fmean(item.controls for item in items), 1),
+                "bytes": round(statistics.fmean(item.bytes for item in items), 1),
+            }
+            for name, items in grouped.items()
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        return {"players": self.player_count, "interactions": self.summary()}
+
+    def format(self) -> str:
+        header = f"{'interaction':<24}{'count':>6}{'mean ms':>10}{'max ms':>10}{'updates':>9}{'rebuilds':>9}{'controls':>10}{'bytes':>10}"
+        lines = [f"players: {self.player_count}", header, "-" * len(header)]
+        for name, row in self.summary().items():
+            lines.append(
+                f"{name:<24}{row['count']:>6}{row['mean_ms']:>10.2f}{row['max_ms']:>10.2f}"
+                f"{row['updates']:>9.2f}{row['rebuilds']:>9.2f}{row['controls']:>10.0f}{row['bytes']:>10.0f}"
+            )
+        return "\n".join(lines)
+
+
+class ScenarioDriver:
+    """Drives a ``WerewolfApp`` through its handlers and records the cost of each step."""
+
+    def __init__(self, player_count: int) -> None:
+        self.page = FakePage()
+        self.app = WerewolfApp(self.page)  # type: ignore[arg-type]
+        self.report = ScenarioReport(player_count)
+
+    def interact(self, name: str, action: Callable[[], None]) -> None:
+        updates, rebuilds = self.page.update_count, self.page.view_rebuilds
+        started_at = time.perf_counter()
+        action()
+        elapsed = time.perf_counter() - started_at
+        payloads = self.page.tree_payloads()
+        self.report.interactions.append(
+            Interaction(
+                name=name,
+                seconds=elapsed,
+                updates=self.page.update_count - updates,
+                view_rebuilds=self.page.view_rebuilds - rebuilds,
+                controls=sum(count_controls(payload) for payload in payloads),
+                bytes=sum(len(payload) for payload in payloads),
+            )
+        )
+
+
+
+Step = tuple[str, Callable[[], None]]
+
+
+def scenario_steps(
+    app: WerewolfApp,
+    player_count: int,
+    rng: random.Random,
+    *,
+    max_days: int | None = None,
+    launch: bool = True,
+) -> Iterator[Step]:
+    """Setup -> start -> random legal choices each phase -> finish, as named handler calls.
+
+    Steps are produced lazily: each one is chosen from the state the previous one left.
+    With ``launch=False`` the app is expected to be on the setup screen already, as it
+    is after a finished game.
+    """
+    page = app.page
+    if launch:
+        yield "start", app.start
+        yield "open_setup", lambda: page.go("/setup")
+    roles = default_roles(player_count)
+    rng.shuffle(roles)
+    for idx, role in enumerate(roles, start=1):
+        yield "add_player", lambda name=f"P{idx}", role=role: app._on_add_player(name, role)
+    yield "start_game", lambda: app._on_start_game(180, 90, FirstDaySeerRule.FREE_SELECT)
+
+    game = app.state.game
+    limit = player_count if max_days is None else max_days
+    while game.phase is not GamePhase.FINISHED and game.day <= limit:
+        candidates = game.target_candidates()
+        if game.phase is GamePhase.DAY:
+            for tab in (GameTab.DASHBOARD, GameTab.LOG, GameTab.PROGRESS):
+                event = SimpleNamespace(control=SimpleNamespace(selected_index=tab.value))
+                yield "switch_tab", lambda event=event: app._on_navigation_change(event)
+            yield "next_phase", lambda: app._on_next_phase(None)
+        elif game.phase is GamePhase.VOTING and candidates:
+            target_id = rng.choice(candidates.players).id
+            yield "confirm_vote", lambda: app._on_confirm_vote(target_id)
+            yield "vote_dialog_yes", lambda: page.dialogs[-1].actions[1].on_click(None)
+            yield "vote_result_next", lambda: page.dialogs[-1].actions[0].on_click(None)
+        elif game.phase in {GamePhase.NIGHT_SEER, GamePhase.NIGHT_MEDIUM} and candidates:
+            target_id = rng.choice(candidates.players).id
+            yield "night_reveal", lambda: app._on_confirm_night_action(target_id)
+            yield "close_reveal", lambda: app._on_close_reveal(None)
+        elif game.phase in {GamePhase.NIGHT_KNIGHT, GamePhase.NIGHT_WEREWOLF} and candidates:
+            target_id = rng.choice(candidates.players).id
+            yield "night_action", lambda: app._on_confirm_night_action(target_id)
+        else:
+            yield "next_phase", lambda: app._on_next_phase(None)
+    yield "finish_game", lambda: app._on_finish_game(None)
+
+
+def run_ui_scenario(player_count: int = 9, *, seed: int = 0, max_days: int | None = None) -> ScenarioReport:
+    driver = ScenarioDriver(player_count)
+    for name, action in scenario_steps(driver.app, player_count, random.Random(seed), max_days=max_days):
+        driver.interact(name, action)
+    return driver.report
+
+
+def save_reports(reports: list[ScenarioReport], path: str | Path) -> None:
+    data = {"version": BASELINE_VERSION, "scenarios": [report.to_dict() for report in reports]}
+    Path(path).write_text(json.dumps(data, indent=1, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def load_summaries(path: str | Path) -> dict[int, dict[str, dict[str, float]]]:
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    version = data.get("version", BASELINE_VERSION)
+    if version != BASELINE_VERSION:
+        raise ValueError(f"Unsupported baseline version: {version}")
+    return {int(scenario["players"]): scenario["interactions"] for scenario in data["scenarios"]}
+
+
+def compare_reports(
+    baseline: dict[int, dict[str, dict[str, float]]],
+    reports: list[ScenarioReport],
+    *,
+    threshold: float = DEFAULT_THRESHOLD,
+) -> list[str]:
+    """Any extra update or view rebuild is a regression; tree size and time may grow up to ``threshold``."""
+    regressions: list[str] = []
+    for report in reports:
+        for name, row in report.summary().items():
+            before = baseline.get(report.player_count, {}).get(name)
+            if before is None:
+                continue
+            for key in ("updates", "rebuilds"):
+                if row[key] > before[key]:
+                    regressions.append(f"{name}[{report.player_count}] {key}: {before[key]} -> {row[key]}")
+            for key in ("controls", "bytes", "mean_ms"):
+                if before[key] > 0 and row[key] / before[key] > threshold:
+                    regressions.append(f"{name}[{report.player_count}] {key}: {before[key]} -> {row[key]}")
+    return regressions
@@ -0,0 +1,387 @@
+from __future__ import annotations
+
+import argparse
+import time
+from collections import Counter
+from typing import TYPE_CHECKING, Callable, Sequence
+
+if TYPE_CHECKING:
+    from werewolf_gm.bench.timing import Results
+    from werewolf_gm.domain import Command, Game
+
+# Subcommands import what they need when they run, so ``--help`` and the headless
+# commands never load Flet and startup stays fast.
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = _build_parser()
+    args = parser.parse_args(argv)
+    if not hasattr(args, "handler"):
+        parser.print_help()
+        return 0
+    return args.handler(args)
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="werewolf_gm", description="Werewolf GM support tools.")
+    subparsers = parser.add_subparsers(title="commands")
+
+    ui = subparsers.add_parser("ui", help="launch the Flet app")
+    ui.set_defaults(handler=_run_ui)
+
+    play = subparsers.add_parser("play", help="run a game as GM in the terminal")
+    play.add_argument("--players", type=int, default=9)
+    play.add_argument("--seed", type=int, default=None)
+    play.add_argument("--record", metavar="PATH", help="save the game record as JSON")
+    play.set_defaults(handler=_run_play)
+
+    simulate = subparsers.add_parser("simulate", help="play random games headlessly")
+    simulate.add_argument("--players", type=int, default=9)
+    simulate.add_argument("--games", type=int, default=100)
+    simulate.add_argument("--seed", type=int, default=0)
+    simulate.add_argument("--table", action="store_true", help="use the player table backend")
+    simulate.add_argument("--record", metavar="PATH", help="save the last game's record as JSON")
+    simulate.add_argument("--corpus", metavar="PATH", help="append every game's record to a JSON Lines corpus")
+    simulate.add_argument("--trace", metavar="PATH", help="write a Chrome trace of the domain calls")
+    simulate.set_defaults(handler=_run_simulate)
+
+    replay = subparsers.add_parser("replay", help="replay a saved game record")
+    replay.add_argument("path")
+    replay.set_defaults(handler=_run_replay)
+
+    fuzz = subparsers.add_parser("fuzz", help="run random operation sequences against Game and check invariants")
+    fuzz.add_argument("--steps", type=int, default=100_000)
+    fuzz.add_argument("--seed", type=int, default=0)
+    fuzz.add_argument("--players", type=int, default=9)
+    fuzz.set_defaults(handler=_run_fuzz)
+
+    archive = subparsers.add_parser("archive", help="statistics over the archive of finished games")
+    archive.add_argument(
+        "--dir", default=None, help="archive directory (default: $WEREWOLF_GM_ARCHIVE or ~/.werewolf_gm/archive)"
+    )
+    archive.set_defaults(handler=_run_archive)
+
+    ratings = subparsers.add_parser("ratings", help="player ratings and win rates from the archive")
+    ratings.add_argument(
+        "--dir", default=None, help="archive directory (default: $WEREWOLF_GM_ARCHIVE or ~/.werewolf_gm/archive)"
+    )
+    ratings.add_argument("--rebuild", action="store_true", help="recount every archived game instead of only new ones")
+    ratings.add_argument("--top", type=int, default=20, help="leaderboard size")
+    ratings.add_argument("--min-games", type=int, default=1)
+    ratings.add_argument("--player", default=None, help="show one player's record by role and team")
+    ratings.set_defaults(handler=_run_ratings)
+
+    bench = subparsers.add_parser("bench", help="run benchmarks")
+    bench_suites = bench.add_subparsers(title="suites")
+    bench_domain = bench_suites.add_parser("domain", help="time core Game operations by player count")
+    bench_domain.add_argument("--sizes", type=int, nargs="+", default=None, metavar="N")
+    bench_domain.add_argument("--only", nargs="+", default=None, metavar="NAME", help="benchmarks to run")
+    bench_domain.add_argument("--table", action="store_true", help="use the player table backend")
+    _add_baseline_arguments(bench_domain)
+    bench_domain.set_defaults(handler=_run_bench_domain)
+    bench_ui = bench_suites.add_parser("ui", help="play scripted games through the app on a fake page")
+    bench_ui.add_argument("--players", type=int, nargs="+", default=[9, 30], metavar="N")
+    bench_ui.add_argument("--seed", type=int, default=0)
+    _add_baseline_arguments(bench_ui)
+    bench_ui.set_defaults(handler=_run_bench_ui)
+    bench_load = bench_suites.add_parser("load", help="run many app sessions on one event loop")
+    bench_load.add_argument("--sessions", type=int, nargs="+", default=None, metavar="N")
+    bench_load.add_argument("--duration", type=float, default=20.0, help="seconds per session count")
+    bench_load.add_argument("--players", type=int, default=9)
+    bench_load.add_argument("--think", type=float, default=0.5, help="mean seconds between clicks")
+    bench_load.add_argument("--timer-interval", type=float, default=1.0, help="seconds per timer tick")
+    bench_load.add_argument("--budget-ms", type=float, default=None, help="p99 response and loop lag budget")
+    bench_load.add_argument("--seed", type=int, default=0)
+    bench_load.set_defaults(handler=_run_bench_load)
+    bench_memory = bench_suites.add_parser("memory", help="check one session for memory growth across games")
+    bench_memory.add_argument("--games", type=int, default=20)
+    bench_memory.add_argument("--players", type=int, default=9)
+    bench_memory.add_argument("--tolerance", type=float, default=None, help="allowed KiB growth per game")
+    bench_memory.add_argument("--seed", type=int, default=0)
+    bench_memory.set_defaults(handler=_run_bench_memory)
+    bench_corpus = bench_suites.add_parser("corpus", help="replay a record corpus and check every outcome")
+    bench_corpus.add_argument("path", help="JSON Lines corpus (see simulate --corpus, $WEREWOLF_GM_CORPUS)")
+    bench_corpus.add_argument("--repeat", type=int, default=1, help="replay the corpus this many times")
+    bench_corpus.add_argument("--table", action="store_true", help="use the player table backend")
+    bench_corpus.set_defaults(handler=_run_bench_corpus)
+    bench_archive = bench_suites.add_parser("archive", help="write a sample game archive and time a stats scan")
+    bench_archive.add_argument("--games", type=int, default=20_000)
+    bench_archive.add_argument("--months", type=int, default=12)
+    bench_archive.add_argument("--seed", type=int, default=0)
+    bench_archive.add_argument("--dir", default=None, help="keep the archive here instead of a temporary directory")
+    bench_archive.set_defaults(handler=_run_bench_archive)
+    return parser
+
+
+def _add_baseline_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--save", metavar="PATH", help="write the results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="fail if slower than this baseline")
+    parser.add_argument("--threshold", type=float, default=None, help="allowed slowdown factor (default 1.25)")
+
+
+def _run_ui(_: argparse.Namespace) -> int:
+    from werewolf_gm.main import run
+
+    run()
+    return 0
+
+
+def _run_simulate(args: argparse.Namespace) -> int:
+    from werewolf_gm.replay import append_to_corpus, save_record
+    from werewolf_gm.simulation import simulate_game
+
+    from werewolf_gm import tracing
+
+    if args.trace:
+        tracing.enable()
+    outcomes: Counter[str] = Counter()
+    total_days = 0
+    result = None
+    started_at = time.perf_counter()
+    try:
+        for offset in range(args.games):
+            result = simulate_game(args.players, seed=args.seed + offset, use_player_table=args.table)
+            outcomes[result.victory_state.value] += 1
+            total_days += result.days
+            if args.corpus:
+                append_to_corpus(result.record, args.corpus)
+    finally:
+        tracer = tracing.disable() if args.trace else None
+    elapsed = time.perf_counter() - started_at
+    if tracer is not None:
+        tracer.write(args.trace)
+
+    for state, count in sorted(outcomes.items()):
+        print(f"{state}: {count}")
+    if args.games:
+        print(f"average days: {total_days / args.games:.2f}")
+        print(f"{args.games / elapsed:.1f} games/s")
+    if args.record and result is not None:
+        save_record(result.record, args.record)
+    return 0
+
+
+def _run_replay(args: argparse.Namespace) -> int:
+    from werewolf_gm.replay import load_record, replay
+
+    game = replay(load_record(args.path))
+    _print_summary(game, print)
+    return 0
+
+
+def _run_fuzz(args: argparse.Namespace) -> int:
+    from werewolf_gm.fuzz import fuzz
+
+    stats = fuzz(steps=args.steps, seed=args.seed, players=args.players)
+    print(
+        f"{stats.steps} steps in {stats.cases} games ({stats.rejected} rejected, {stats.finished} finished), "
+        f"{stats.steps_per_second:.0f} steps/s"
+    )
+    for failure in stats.failures:
+        print(failure.format())
+    return 1 if stats.failures else 0
+
+
+def _run_archive(args: argparse.Namespace) -> int:
+    from werewolf_gm.archive import archive_stats, default_directory, open_archives
+
+    readers = open_archives(args.dir or default_directory())
+    try:
+        print(archive_stats(readers).format())
+    finally:
+        for reader in readers:
+            reader.close()
+    return 0
+
+
+def _run_ratings(args: argparse.Namespace) -> int:
+    from werewolf_gm.archive import default_directory
+    from werewolf_gm.domain import Team
+    from werewolf_gm.ratings import rebuild_index, refresh_index
+
+    directory = args.dir or default_directory()
+    index = rebuild_index(directory) if args.rebuild else refresh_index(directory)
+    if args.player is not None:
+        profile = index.profile(args.player)
+        if profile is None:
+            print(f"no archived games for {args.player}")
+            return 1
+        print(f"{profile.name}: rating {profile.rating:.0f}, {profile.games} games, win rate {profile.win_rate:.0%}")
+        for label, counts_by_group in (("team", profile.teams), ("role", profile.roles)):
+            for group, (games, wins) in counts_by_group.items():
+                print(f"  {label} {group.value}: {wins}/{games} ({wins / games:.0%})")
+        return 0
+    print(f"{index.games} rated games, {len(index.players)} players")
+    for rank, profile in enumerate(index.leaderboard(args.top, min_games=args.min_games), start=1):
+        team_rates = " ".join(
+            f"{team.value} {rate:.0%}" for team in Team if (rate := profile.team_win_rate(team)) is not None
+        )
+        print(
+            f"{rank:>3}. {profile.name:<16} {profile.rating:>6.0f} {profile.games:>5} games "
+            f"win {profile.win_rate:>4.0%}  {team_rates}"
+        )
+    return 0
+
+
+def _run_bench_domain(args: argparse.Namespace) -> int:
+    from werewolf_gm.bench.domain import DEFAULT_SIZES, run_domain_benchmarks
+
+    results = run_domain_benchmarks(args.sizes or DEFAULT_SIZES, names=args.only, use_player_table=args.table)
+    return _report_bench(results, args)
+
+
+def _run_bench_ui(args: argparse.Namespace) -> int:
+    from werewolf_gm.bench.timing import DEFAULT_THRESHOLD
+    from werewolf_gm.bench.ui import compare_reports, load_summaries, run_ui_scenario, save_reports
+
+    reports = [run_ui_scenario(player_count, seed=args.seed) for player_count in args.players]
+    for report in reports:
+        print(report.format())
+    if args.save:
+        save_reports(reports, args.save)
+    if not args.compare:
+        return 0
+    threshold = args.threshold if args.threshold is not None else DEFAULT_THRESHOLD
+    return _print_regressions(compare_reports(load_summaries(args.compare), reports, threshold=threshold))
+
+
+def _run_bench_load(args: argparse.Namespace) -> int:
+    from werewolf_gm.bench.load import DEFAULT_BUDGET_MS, DEFAULT_SESSION_COUNTS, format_load, run_load
+
+    results = run_load(
+        args.sessions or DEFAULT_SESSION_COUNTS,
+        duration=args.duration,
+        players=args.players,
+        think_seconds=args.think,
+        timer_interval=args.timer_interval,
+        seed=args.seed,
+    )
+    print(format_load(results, budget_ms=args.budget_ms if args.budget_ms is not None else DEFAULT_BUDGET_MS))
+    return 0
+
+
+def _run_bench_memory(args: argparse.Namespace) -> int:
+    from werewolf_gm.bench.memory import DEFAULT_TOLERANCE_KIB_PER_GAME, profile_session_memory
+
+    report = profile_session_memory(args.games, players=args.players, seed=args.seed)
+    print(report.format())
+    tolerance = args.tolerance if args.tolerance is not None else DEFAULT_TOLERANCE_KIB_PER_GAME
+    if report.is_leaking(tolerance):
+        print(f"leak: memory grows {report.growth_kib_per_game:.2f} KiB/game (tolerance {tolerance})")
+        return 1
+    return 0
+
+
+def _run_bench_corpus(args: argparse.Namespace) -> int:
+    from werewolf_gm.bench.corpus import replay_corpus
+    from werewolf_gm.replay import load_corpus
+
+    report = replay_corpus(load_corpus(args.path), repeat=args.repeat, use_player_table=args.table)
+    print(report.format())
+    return 1 if report.mismatches else 0
+
+
+def _run_bench_archive(args: argparse.Namespace) -> int:
+    import tempfile
+
+    from werewolf_gm.bench.archive import run_archive_bench
+
+    if args.dir:
+        print(run_archive_bench(args.dir, args.games, months=args.months, seed=args.seed).format())
+        return 0
+    with tempfile.TemporaryDirectory() as directory:
+        print(run_archive_bench(directory, args.games, months=args.months, seed=args.seed).format())
+    return 0
+
+
+def _report_bench(results: Results, args: argparse.Namespace) -> int:
+    from werewolf_gm.bench.timing import DEFAULT_THRESHOLD, compare_results, format_table, load_results, save_results
+
+    print(format_table(results))
+    if args.save:
+        save_results(results, args.save)
+    if not args.compare:
+        return 0
+    threshold = args.threshold if args.threshold is not None else DEFAULT_THRESHOLD
+    return _print_regressions(compare_results(load_results(args.compare), results, threshold=threshold))
+
+
+def _print_regressions(regressions: list[str]) -> int:
+    for line in regressions:
+        print(f"regression: {line}")
+    return 1 if regressions else 0
+
+
+def _run_play(
+    args: argparse.Namespace,
+    *,
+    input_fn: Callable[[str], str] = input,
+    output: Callable[[str], None] = print,
+) -> int:
+    import random
+
+    from werewolf_gm.domain import GamePhase
+    from werewolf_gm.replay import GameRecord, save_record
+    from werewolf_gm.simulation import build_game
+
+    game = build_game(args.players, rng=random.Random(args.seed))
+    for player in game.players:
+        output(f"{player.name}: {player.role.value}")
+    game.start_game()
+    record = GameRecord.from_game(game, seed=args.seed, started_at=time.time())
+
+    while game.phase is not GamePhase.FINISHED:
+        commands = _prompt_phase_commands(game, input_fn=input_fn, output=output)
+        if commands is None:
+            break
+        game.apply(commands)
+        record.add(commands, at=time.time())
+    record.finish(game)
+
+    _print_summary(game, output)
+    if args.record:
+        save_record(record, args.record)
+    return 0
+
+
+def _prompt_phase_commands(
+    game: Game,
+    *,
+    input_fn: Callable[[str], str],
+    output: Callable[[str], None],
+) -> list[Command] | None:
+    from werewolf_gm.domain import AdvancePhase, DeathReason, GamePhase, KillPlayer, SetTarget
+    from werewolf_gm.simulation import NIGHT_ACTION_KINDS
+
+    candidates = game.target_candidates()
+    output(f"-- day {game.day} {game.phase.value}")
+    if not candidates or (game.phase is not GamePhase.VOTING and game.phase not in NIGHT_ACTION_KINDS):
+        try:
+            input_fn("enter to continue> ")
+        except EOFError:
+            return None
+        return [AdvancePhase()]
+
+    names = {player.name.casefold(): player.id for player in candidates.players}
+    output("candidates: " + ", ".join(player.name for player in candidates.players))
+    while True:
+        try:
+            answer = input_fn("target (empty to skip)> ").strip()
+        except EOFError:
+            return None
+        if not answer:
+            return [AdvancePhase()]
+        player_id = names.get(answer.casefold())
+        if player_id is not None:
+            break
+        output(f"unknown candidate: {answer}")
+
+    if game.phase is GamePhase.VOTING:
+        return [KillPlayer(player_id, DeathReason.EXECUTED), AdvancePhase()]
+    return [SetTarget(NIGHT_ACTION_KINDS[game.phase], player_id), AdvancePhase()]
+
+
+def _print_summary(game: Game, output: Callable[[str], None]) -> None:
+    output(f"day {game.day} {game.phase.value}: {game.victory.state.value}")
+    alive = ", ".join(f"{player.name}({player.role.value})" for player in game.alive_players())
+    output(f"alive: {alive}")
@@ -1,20 +1,57 @@
 """Domain models and core game logic."""
 
-from .enums import DeathReason, FirstDaySeerRule, GamePhase, Role, Team, VictoryState
-from .game import Game, GameRules
+from .commands import AdvancePhase, Command, KillPlayer, RevertPhase, SetTarget
+from .events import KillEvent, PhaseChangeEvent, Subscription, TargetSetEvent, VictoryEvent
+from .enums import DeathReason, FirstDaySeerRule, GamePhase, NightActionKind, Role, Team, VictoryState
+from .fingerprint import compute_fingerprint
+from .game import Divination, Game, GameRules
+from .history import GameHistory, HistoryEntry
+from .inference import KnownRole, RoleClaim, RoleMarginals, RoleReport, infer_roles
+from .night import NightAction, NightResolution, resolve_night
 from .player import Player
+from .player_table import PlayerTable, TablePlayer
+from .targets import TargetCandidates
 from .victory import VictoryJudge, VictoryResult
+from .voting import VoteResult, VoteTally
 
 __all__ = [
+    "AdvancePhase",
+    "Command",
     "DeathReason",
+    "Divination",
     "FirstDaySeerRule",
     "Game",
+    "GameHistory",
     "GameRules",
     "GamePhase",
+    "HistoryEntry",
+    "KillEvent",
+    "KillPlayer",
+    "KnownRole",
+    "NightAction",
+    "NightActionKind",
+    "NightResolution",
+    "PhaseChangeEvent",
     "Player",
+    "PlayerTable",
+    "RevertPhase",
     "Role",
+    "RoleClaim",
+    "RoleMarginals",
+    "RoleReport",
+    "SetTarget",
+    "Subscription",
+    "TablePlayer",
+    "TargetSetEvent",
+    "TargetCandidates",
     "Team",
     "VictoryJudge",
+    "VictoryEvent",
     "VictoryResult",
     "VictoryState",
+    "VoteResult",
+    "VoteTally",
+    "compute_fingerprint",
+    "infer_roles",
+    "resolve_night",
 ]
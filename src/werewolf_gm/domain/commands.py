@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Union
+
+from .enums import DeathReason, NightActionKind
+
+
+@dataclass(slots=True, frozen=True)
+class KillPlayer:
+    player_id: int
+    reason: DeathReason
+
+
+@dataclass(slots=True, frozen=True)
+class SetTarget:
+    kind: NightActionKind
+    player_id: int
+
+
+@dataclass(slots=True, frozen=True)
+class AdvancePhase:
+    pass
+
+
+@dataclass(slots=True, frozen=True)
+class RevertPhase:
+    """Step back to the previous night action (a no-op outside the night)."""
+
+
+Command = Union[KillPlayer, SetTarget, AdvancePhase, RevertPhase]
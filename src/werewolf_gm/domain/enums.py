@@ -54,3 +54,10 @@ class DeathReason(str, Enum):
     EXECUTED = "executed"
     ATTACKED = "attacked"
     OTHER = "other"
+
+
+class NightActionKind(str, Enum):
+    SEER = "seer"
+    MEDIUM = "medium"
+    GUARD = "guard"
+    ATTACK = "attack"
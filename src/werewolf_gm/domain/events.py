@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable
+
+from .enums import DeathReason, GamePhase, NightActionKind
+from .victory import VictoryResult
+
+if TYPE_CHECKING:
+    from .game import Game
+
+TARGET_FIELD_KINDS: dict[str, NightActionKind] = {
+    "seer_target_id": NightActionKind.SEER,
+    "medium_target_id": NightActionKind.MEDIUM,
+    "guard_target_id": NightActionKind.GUARD,
+    "attacked_player_id": NightActionKind.ATTACK,
+}
+
+
+@dataclass(slots=True, frozen=True)
+class KillEvent:
+    player_id: int
+    reason: DeathReason
+    day: int
+
+
+@dataclass(slots=True, frozen=True)
+class PhaseChangeEvent:
+    previous_day: int
+    previous_phase: GamePhase
+    day: int
+    phase: GamePhase
+
+
+@dataclass(slots=True, frozen=True)
+class TargetSetEvent:
+    """A night target was set (``target_id``) or cleared (``None``); ``actor_id`` is set for per-actor actions."""
+
+    kind: NightActionKind
+    target_id: int | None
+    actor_id: int | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class VictoryEvent:
+    result: VictoryResult
+
+
+class Subscription:
+    __slots__ = ("_game", "_callbacks")
+
+    def __init__(self, game: Game, callbacks: dict[str, Callable]) -> None:
+        self._game = game
+        self._callbacks = callbacks
+
+    def cancel(self) -> None:
+        self._game._unsubscribe(self._callbacks)
+
+
+class GameObservers:
+    """Subscribers of one ``Game`` plus the events waiting for delivery.
+
+    ``Game`` only creates this object on the first ``subscribe`` call and drops it when
+    the last subscription is cancelled, so unobserved games record nothing. Events are
+    buffered until the outermost mutation (or ``Game.batch()``) ends and each callback
+    then receives every event of its kind at once. Phase and day changes within one
+    delivery are coalesced into a single ``PhaseChangeEvent``.
+    """
+
+    __slots__ = ("subscribers", "kills", "targets", "phase_origin", "victory")
+
+    def __init__(self) -> None:
+        self.subscribers: list[dict[str, Callable]] = []
+        self.kills: list[KillEvent] = []
+        self.targets: list[TargetSetEvent] = []
+        self.phase_origin: tuple[int, GamePhase] | None = None
+        self.victory: VictoryEvent | None = None
+
+    def note_phase(self, game: Game) -> None:
+        if self.phase_origin is None:
+            self.phase_origin = (game.day, game.phase)
+
+    def mark(self) -> tuple[int, int, tuple[int, GamePhase] | None, VictoryEvent | None]:
+        return len(self.kills), len(self.targets), self.phase_origin, self.victory
+
+    def rollback(self, mark: tuple[int, int, tuple[int, GamePhase] | None, VictoryEvent | None]) -> None:
+        kills, targets, self.phase_origin, self.victory = mark
+        del self.kills[kills:]
+        del self.targets[targets:]
+
+    def flush(self, game: Game) -> None:
+        kills, self.kills = self.kills, []
+        targets, self.targets = self.targets, []
+        phases: list[PhaseChangeEvent] = []
+        if self.phase_origin is not None and self.phase_origin != (game.day, game.phase):
+            previous_day, previous_phase = self.phase_origin
+            phases.append(PhaseChangeEvent(previous_day, previous_phase, game.day, game.phase))
+        self.phase_origin = None
+        victories = [self.victory] if self.victory is not None else []
+        self.victory = None
+
+        for name, events in (
+            ("on_kill", kills),
+            ("on_target_set", targets),
+            ("on_phase_change", phases),
+            ("on_victory", victories),
+        ):
+            if not events:
+                continue
+            for callbacks in list(self.subscribers):
+                callback = callbacks.get(name)
+                if callback is not None:
+                    callback(tuple(events))
+
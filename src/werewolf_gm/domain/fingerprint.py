@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import hashlib
+from functools import lru_cache
+from typing import TYPE_CHECKING
+
+from .enums import GamePhase
+from .player import Player
+
+if TYPE_CHECKING:
+    from .game import Game
+    from .night import NightAction
+
+NIGHT_TARGET_FIELDS = (
+    "seer_target_id",
+    "medium_target_id",
+    "guard_target_id",
+    "attacked_player_id",
+)
+
+
+@lru_cache(maxsize=8192)
+def zobrist_key(*parts: object) -> int:
+    """Stable 64-bit random key for a state component (same on every device)."""
+    digest = hashlib.blake2b("\x1f".join(map(str, parts)).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def phase_key(phase: GamePhase) -> int:
+    return zobrist_key("phase", phase.value)
+
+
+def day_key(day: int) -> int:
+    return zobrist_key("day", day)
+
+
+def target_key(field_name: str, player_id: object | None) -> int:
+    if player_id is None:
+        return 0
+    return zobrist_key("target", field_name, player_id)
+
+
+def night_action_key(action: NightAction) -> int:
+    return zobrist_key("night_action", action.kind.value, action.actor_id, action.target_id)
+
+
+def player_key(player: Player) -> int:
+    return zobrist_key(
+        "player",
+        player.id,
+        player.role.value,
+        player.is_alive,
+        player.death_reason.value if player.death_reason is not None else "",
+        player.death_day if player.death_day is not None else "",
+    )
+
+
+def compute_fingerprint(game: Game) -> int:
+    """Recompute the fingerprint from scratch; ``Game`` keeps the same value incrementally."""
+    value = phase_key(game.phase) ^ day_key(game.day)
+    for field_name in NIGHT_TARGET_FIELDS:
+        value ^= target_key(field_name, getattr(game, field_name))
+    for action in game.night_actions.values():
+        value ^= night_action_key(action)
+    for player in game.players:
+        value ^= player_key(player)
+    return value
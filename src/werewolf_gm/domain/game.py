@@ -1,11 +1,37 @@
 from __future__ import annotations
 
 import random
+from contextlib import contextmanager
 from dataclasses import dataclass, field
-from typing import Iterable
-
-from .enums import DeathReason, FirstDaySeerRule, GamePhase, Role, VictoryState
+from functools import wraps
+from typing import Callable, Iterable, Iterator, Mapping, Sequence, TypeVar
+
+from werewolf_gm import tracing
+
+from .commands import AdvancePhase, Command, KillPlayer, RevertPhase, SetTarget
+from .events import (
+    TARGET_FIELD_KINDS,
+    GameObservers,
+    KillEvent,
+    PhaseChangeEvent,
+    Subscription,
+    TargetSetEvent,
+    VictoryEvent,
+)
+from .enums import DeathReason, FirstDaySeerRule, GamePhase, NightActionKind, Role, VictoryState
+from .fingerprint import (
+    NIGHT_TARGET_FIELDS,
+    compute_fingerprint,
+    day_key,
+    night_action_key,
+    phase_key,
+    player_key,
+    target_key,
+)
+from .night import DAWN_ACTION_KINDS, NightAction, NightResolution, resolve_night
 from .player import Player
+from .player_table import PlayerTable
+from .targets import NIGHT_ACTION_PHASES, NIGHT_ACTION_ROLES, TargetCandidates, compute_target_candidates
 from .victory import VictoryJudge, VictoryResult
 
 
@@ -16,6 +42,44 @@ class GameRules:
     first_day_seer: FirstDaySeerRule = FirstDaySeerRule.FREE_SELECT
 
 
+_FINGERPRINTED_FIELDS = frozenset({"phase", "day", *NIGHT_TARGET_FIELDS})
+
+
+_Method = TypeVar("_Method", bound=Callable)
+
+
+def _notifies(method: _Method) -> _Method:
+    """Deliver the change events of a public mutator once it returns (only when observed).
+
+    Also records a ``domain`` span per call while a tracer is active.
+    """
+    span_name = f"Game.{method.__name__}"
+
+    def call(self: Game, args: tuple, kwargs: dict):
+        if self._observers is None:
+            return method(self, *args, **kwargs)
+        with self.batch():
+            return method(self, *args, **kwargs)
+
+    @wraps(method)
+    def wrapper(self: Game, *args, **kwargs):
+        if tracing.ACTIVE is None:
+            return call(self, args, kwargs)
+        with tracing.ACTIVE.span(span_name, "domain"):
+            return call(self, args, kwargs)
+
+    return wrapper  # type: ignore[return-value]
+
+
+@dataclass(slots=True, frozen=True)
+class Divination:
+    day: int
+    role: Role
+    actor_id: int | None
+    target_id: int
+    is_werewolf: bool
+
+
 @dataclass(slots=True)
 class Game:
     players: list[Player] = field(default_factory=list)
@@ -29,31 +93,186 @@ class Game:
             reason="Game not evaluated yet.",
         )
     )
-    seer_target_id: str | None = None
-    medium_target_id: str | None = None
-    guard_target_id: str | None = None
-    attacked_player_id: str | None = None
-    last_executed_player_id: str | None = None
-    last_night_victim_id: str | None = None
-    last_guard_target_id: str | None = None
-    last_attack_target_id: str | None = None
-    first_day_white_target_id: str | None = None
+    seer_target_id: int | None = None
+    medium_target_id: int | None = None
+    guard_target_id: int | None = None
+    attacked_player_id: int | None = None
+    last_executed_player_id: int | None = None
+    last_night_victim_id: int | None = None
+    last_guard_target_id: int | None = None
+    last_attack_target_id: int | None = None
+    first_day_white_target_id: int | None = None
+    divinations: list[Divination] = field(default_factory=list)
+    night_actions: dict[tuple[NightActionKind, int], NightAction] = field(default_factory=dict)
+    last_night_resolution: NightResolution | None = None
+    _fingerprint: int | None = field(default=None, init=False, repr=False, compare=False)
+    _token: object = field(default_factory=object, init=False, repr=False, compare=False)
+    # Inside apply(): alive [werewolves, non-werewolves] and the undo log of player rows.
+    _batch_alive: list[int] | None = field(default=None, init=False, repr=False, compare=False)
+    _undo: dict[int, tuple[Player, Player]] | None = field(default=None, init=False, repr=False, compare=False)
+    _victory_dirty: bool = field(default=False, init=False, repr=False, compare=False)
+    _index: dict[int, int] = field(default_factory=dict, init=False, repr=False, compare=False)
+    _next_player_id: int = field(default=0, init=False, repr=False, compare=False)
+    _table: PlayerTable | None = field(default=None, init=False, repr=False, compare=False)
+    _roster_version: int = field(default=0, init=False, repr=False, compare=False)
+    _candidate_cache: dict[GamePhase, tuple[tuple, TargetCandidates]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _observers: GameObservers | None = field(default=None, init=False, repr=False, compare=False)
+    _batch_depth: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._next_player_id = max((p.id for p in self.players), default=-1) + 1
+        for player in self.players:
+            if player.id < 0:
+                player.id = self._next_player_id
+                self._next_player_id += 1
+            player._owner = self._token
+        self._fingerprint = compute_fingerprint(self)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if name in _FINGERPRINTED_FIELDS:
+            fingerprint = getattr(self, "_fingerprint", None)
+            if fingerprint is not None:
+                observers = self._observers
+                if name == "phase":
+                    fingerprint ^= phase_key(self.phase) ^ phase_key(value)
+                    if observers is not None:
+                        observers.note_phase(self)
+                elif name == "day":
+                    fingerprint ^= day_key(self.day) ^ day_key(value)
+                    if observers is not None:
+                        observers.note_phase(self)
+                else:
+                    previous = getattr(self, name)
+                    fingerprint ^= target_key(name, previous) ^ target_key(name, value)
+                    if observers is not None and previous != value:
+                        observers.targets.append(TargetSetEvent(TARGET_FIELD_KINDS[name], value))
+                object.__setattr__(self, "_fingerprint", fingerprint)
+        object.__setattr__(self, name, value)
+
+    def subscribe(
+        self,
+        *,
+        on_kill: Callable[[Sequence[KillEvent]], None] | None = None,
+        on_phase_change: Callable[[Sequence[PhaseChangeEvent]], None] | None = None,
+        on_target_set: Callable[[Sequence[TargetSetEvent]], None] | None = None,
+        on_victory: Callable[[Sequence[VictoryEvent]], None] | None = None,
+    ) -> Subscription:
+        """Receive change records in batches, once per public mutation or ``batch()``.
+
+        Nothing is recorded while a game has no subscribers. Forks start unobserved.
+        """
+        callbacks = {
+            name: callback
+            for name, callback in (
+                ("on_kill", on_kill),
+                ("on_phase_change", on_phase_change),
+                ("on_target_set", on_target_set),
+                ("on_victory", on_victory),
+            )
+            if callback is not None
+        }
+        if self._observers is None:
+            self._observers = GameObservers()
+        self._observers.subscribers.append(callbacks)
+        return Subscription(self, callbacks)
+
+    @contextmanager
+    def batch(self) -> Iterator[Game]:
+        """Hold change events back until the outermost batch ends, then deliver them together."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._observers is not None:
+                self._observers.flush(self)
+
+    @property
+    def fingerprint(self) -> int:
+        """64-bit Zobrist hash of phase, day, night targets and every player's state."""
+        assert self._fingerprint is not None
+        return self._fingerprint
+
+    def fork(self) -> Game:
+        """Cheap independent copy for simulations and what-if branches.
+
+        Player records are shared copy-on-write: both games lose ownership of every
+        record, and whichever game later mutates a player replaces it with a private
+        copy first. A fork therefore costs a list copy plus O(changed players), and
+        ``Player`` objects fetched before the fork become read-only snapshots.
+        With the player table backend the columns are copied eagerly instead.
+        """
+        clone = object.__new__(Game)
+        for name in Game.__slots__:
+            object.__setattr__(clone, name, getattr(self, name))
+        if self._table is not None:
+            table = self._table.copy()
+            object.__setattr__(clone, "_table", table)
+            object.__setattr__(clone, "players", table.views)
+        else:
+            object.__setattr__(clone, "players", list(self.players))
+        object.__setattr__(clone, "_candidate_cache", {})
+        object.__setattr__(clone, "_observers", None)
+        object.__setattr__(clone, "_batch_depth", 0)
+        object.__setattr__(clone, "divinations", list(self.divinations))
+        object.__setattr__(clone, "night_actions", dict(self.night_actions))
+        object.__setattr__(
+            clone,
+            "rules",
+            GameRules(
+                day_seconds=self.rules.day_seconds,
+                night_seconds=self.rules.night_seconds,
+                first_day_seer=self.rules.first_day_seer,
+            ),
+        )
+        object.__setattr__(clone, "_token", object())
+        object.__setattr__(self, "_token", object())
+        return clone
+
+    @property
+    def uses_player_table(self) -> bool:
+        return self._table is not None
+
+    def use_player_table(self) -> None:
+        """Switch to the struct-of-arrays backend; ``players`` keeps working as row views."""
+        if self._table is not None:
+            return
+        self._table = PlayerTable.from_players(self.players)
+        self.players = self._table.views
+        self._index = {}
 
     def add_player(self, name: str, role: Role) -> Player:
         if any(p.name == name for p in self.players):
             raise ValueError(f"Player name already exists: {name}")
-        player = Player(name=name, role=role)
-        self.players.append(player)
+        self._index[self._next_player_id] = len(self.players)
+        if self._table is not None:
+            player = self._table.append(name=name, role=role, player_id=self._next_player_id)
+        else:
+            player = Player(name=name, role=role, id=self._next_player_id)
+            player._owner = self._token
+            self.players.append(player)
+        self._next_player_id += 1
+        self._roster_version += 1
+        self._fingerprint ^= player_key(player)
         return player
 
-    def remove_player(self, player_id: str) -> None:
+    @_notifies
+    def remove_player(self, player_id: int) -> None:
         for idx, player in enumerate(self.players):
             if player.id == player_id:
-                self.players.pop(idx)
+                self._fingerprint ^= player_key(player)
+                if self._table is not None:
+                    self._table.remove(idx)
+                else:
+                    self.players.pop(idx)
+                self._roster_version += 1
                 self._clear_player_reference(player_id)
                 return
         raise ValueError(f"Player not found: {player_id}")
 
+    @_notifies
     def start_game(self) -> None:
         self.day = 0
         self.phase = GamePhase.NIGHT_SEER
@@ -61,7 +280,9 @@ class Game:
         self.last_night_victim_id = None
         self.last_guard_target_id = None
         self.last_attack_target_id = None
+        self.last_night_resolution = None
         self.first_day_white_target_id = None
+        self.divinations.clear()
         if self.rules.first_day_seer is FirstDaySeerRule.RANDOM_WHITE:
             candidates = [
                 player
@@ -73,43 +294,69 @@ class Game:
         self._reset_night_action_records()
         self.refresh_victory()
 
+    @_notifies
     def revert_to_previous_night_phase(self) -> bool:
         if self.phase is GamePhase.NIGHT_MEDIUM:
             self.phase = GamePhase.NIGHT_SEER
             self.seer_target_id = None
+            self._discard_divination(Role.SEER)
             return True
 
         if self.phase is GamePhase.NIGHT_KNIGHT:
             self.phase = GamePhase.NIGHT_MEDIUM
             self.medium_target_id = None
+            self._discard_divination(Role.MEDIUM)
             return True
 
         if self.phase is GamePhase.NIGHT_WEREWOLF:
             self.attacked_player_id = None
+            self._discard_night_actions(NightActionKind.ATTACK)
             if self.day == 0:
                 self.phase = GamePhase.NIGHT_SEER
                 self.seer_target_id = None
+                self._discard_divination(Role.SEER)
                 return True
 
             self.phase = GamePhase.NIGHT_KNIGHT
             self.guard_target_id = None
+            self._discard_night_actions(NightActionKind.GUARD)
             return True
 
         return False
 
-    def get_player(self, player_id: str) -> Player:
-        for player in self.players:
-            if player.id == player_id:
-                return player
-        raise ValueError(f"Player not found: {player_id}")
+    def get_player(self, player_id: int) -> Player:
+        return self.players[self._player_index(player_id)]
+
+    @staticmethod
+    def external_id(player_id: int) -> str:
+        """String form of a player id for UI control keys and saved data."""
+        return f"p{player_id}"
+
+    def resolve_external_id(self, external_id: str) -> int:
+        if not external_id.startswith("p") or not external_id[1:].isdigit():
+            raise ValueError(f"Invalid player reference: {external_id}")
+        player_id = int(external_id[1:])
+        self.get_player(player_id)
+        return player_id
 
     def alive_players(self) -> list[Player]:
+        if self._table is not None:
+            return self._table.players_in(self._table.alive_mask)
         return [p for p in self.players if p.is_alive]
 
     def alive_players_by_role(self, role: Role) -> list[Player]:
+        if self._table is not None:
+            return self._table.players_in(self._table.alive_mask & self._table.role_mask(role))
         return [p for p in self.alive_players() if p.role is role]
 
+    def alive_players_except_role(self, role: Role) -> list[Player]:
+        if self._table is not None:
+            return self._table.players_in(self._table.alive_mask & ~self._table.role_mask(role))
+        return [p for p in self.alive_players() if p.role is not role]
+
     def has_alive_role(self, role: Role) -> bool:
+        if self._table is not None:
+            return bool(self._table.alive_mask & self._table.role_mask(role))
         return any(True for _ in self.alive_players_by_role(role))
 
     def get_executed_player_on_day(self, day: int) -> Player | None:
@@ -118,48 +365,194 @@ class Game:
                 return player
         return None
 
-    def kill_player(self, player_id: str, reason: DeathReason) -> None:
-        player = self.get_player(player_id)
+    @_notifies
+    def kill_player(self, player_id: int, reason: DeathReason) -> None:
+        if self.phase is GamePhase.FINISHED:
+            raise ValueError("Game already finished")
+        player = self._writable_player(player_id)
         if not player.is_alive:
             raise ValueError(f"Player already dead: {player.name}")
 
+        before = player_key(player)
         player.kill(reason)
         player.death_day = self.day
+        self._roster_version += 1
+        self._fingerprint ^= before ^ player_key(player)
         if reason is DeathReason.EXECUTED:
             self.last_executed_player_id = player_id
-        self.refresh_victory()
-
-    def set_seer_target(self, player_id: str) -> None:
-        self.seer_target_id = self._require_alive_player(player_id).id
-
-    def set_medium_target(self, player_id: str) -> None:
-        self.medium_target_id = self.get_player(player_id).id
-
-    def set_guard_target(self, player_id: str) -> None:
+        if self._observers is not None:
+            self._observers.kills.append(KillEvent(player_id, reason, self.day))
+        counts = self._batch_alive
+        if counts is None:
+            self.refresh_victory()
+            return
+        # A batch only recounts the roster once the running counts decide the game.
+        counts[0 if player.role is Role.WEREWOLF else 1] -= 1
+        if VictoryJudge.evaluate(alive_werewolves=counts[0], alive_non_werewolves=counts[1]).state is VictoryState.ONGOING:
+            self._victory_dirty = True
+        else:
+            self.refresh_victory()
+
+    def target_candidates(self, phase: GamePhase | None = None) -> TargetCandidates:
+        """Legal targets for ``phase`` (default: current); recomputed only after a death,
+        roster change, day change or first-day rule change."""
+        if phase is None:
+            phase = self.phase
+        key = (
+            self.day,
+            self._roster_version,
+            self.rules.first_day_seer,
+            self.first_day_white_target_id,
+        )
+        cached = self._candidate_cache.get(phase)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        candidates = compute_target_candidates(self, phase)
+        self._candidate_cache[phase] = (key, candidates)
+        return candidates
+
+    def is_legal_target(self, player_id: int, phase: GamePhase | None = None) -> bool:
+        return player_id in self.target_candidates(phase).ids
+
+    @_notifies
+    def resolve_night_batch(self, targets: Mapping[NightActionKind, int | None]) -> GamePhase:
+        """Validate all night actions together, then run the whole night in one apply().
+
+        Must be called at the start of the night (NIGHT_SEER). Actions left as ``None``
+        are skipped; any illegal target rejects the batch without changing the game.
+        """
+        return self.apply(self.night_batch_commands(targets))
+
+    def night_batch_commands(self, targets: Mapping[NightActionKind, int | None]) -> list[Command]:
+        """The commands ``resolve_night_batch(targets)`` applies; raises if any target is illegal."""
+        if self.phase is not GamePhase.NIGHT_SEER:
+            raise ValueError(f"Night batch must start at {GamePhase.NIGHT_SEER.value}: {self.phase.value}")
+
+        errors: list[str] = []
+        commands: list[Command] = []
+        for kind, phase in NIGHT_ACTION_PHASES.items():
+            if self.day == 0 and phase in {GamePhase.NIGHT_MEDIUM, GamePhase.NIGHT_KNIGHT}:
+                continue
+            player_id = targets.get(kind)
+            if player_id is not None:
+                if self.is_legal_target(player_id, phase):
+                    commands.append(SetTarget(kind, player_id))
+                else:
+                    errors.append(f"Illegal {kind.value} target: {player_id}")
+            commands.append(AdvancePhase())
+
+        if errors:
+            raise ValueError("; ".join(errors))
+        return commands
+
+    @_notifies
+    def set_seer_target(self, player_id: int) -> None:
+        target = self._require_alive_player(player_id)
+        self.seer_target_id = target.id
+        self._record_divination(Role.SEER, target)
+
+    @_notifies
+    def set_medium_target(self, player_id: int) -> None:
+        target = self.get_player(player_id)
+        self.medium_target_id = target.id
+        self._record_divination(Role.MEDIUM, target)
+
+    @_notifies
+    def set_guard_target(self, player_id: int) -> None:
         self.guard_target_id = self._require_alive_player(player_id).id
 
-    def set_attack_target(self, player_id: str) -> None:
+    @_notifies
+    def set_attack_target(self, player_id: int) -> None:
         self.attacked_player_id = self._require_alive_player(player_id).id
 
-    def resolve_night_actions(self) -> str | None:
+    @_notifies
+    def submit_night_action(self, kind: NightActionKind, actor_id: int, target_id: int) -> NightAction:
+        """Record one actor's dawn action (guard or attack vote), replacing their earlier one.
+
+        Used when several knights or werewolves act individually; the single-target
+        setters stay the GM's decision for the whole role.
+        """
+        if kind not in DAWN_ACTION_KINDS:
+            raise ValueError(f"Only guard and attack are resolved at dawn: {kind.value}")
+        phase = NIGHT_ACTION_PHASES[kind]
+        actor = self._require_alive_player(actor_id)
+        if actor.role is not NIGHT_ACTION_ROLES[phase]:
+            raise ValueError(f"{actor.name} cannot act as {NIGHT_ACTION_ROLES[phase].value}")
+        if not self.is_legal_target(target_id, phase):
+            raise ValueError(f"Illegal {kind.value} target: {target_id}")
+
+        action = NightAction(kind=kind, target_id=target_id, actor_id=actor.id)
+        previous = self.night_actions.get((kind, actor.id))
+        if previous is not None:
+            self._fingerprint ^= night_action_key(previous)
+        self.night_actions[(kind, actor.id)] = action
+        self._fingerprint ^= night_action_key(action)
+        if self._observers is not None:
+            self._observers.targets.append(TargetSetEvent(kind, target_id, actor.id))
+        return action
+
+    @_notifies
+    def resolve_night_actions(self) -> int | None:
+        actions = list(self.night_actions.values())
+        if self.guard_target_id is not None:
+            actions.append(NightAction(NightActionKind.GUARD, self.guard_target_id))
+        if self.attacked_player_id is not None:
+            actions.append(NightAction(NightActionKind.ATTACK, self.attacked_player_id))
+        resolution = resolve_night(actions, is_alive=lambda player_id: self.get_player(player_id).is_alive)
+
+        self.last_night_resolution = resolution
         self.last_night_victim_id = None
         self.last_guard_target_id = self.guard_target_id
-        self.last_attack_target_id = self.attacked_player_id
+        if self.last_guard_target_id is None and resolution.guarded_ids:
+            self.last_guard_target_id = min(resolution.guarded_ids)
+        self.last_attack_target_id = resolution.attack_target_id
 
-        if self.attacked_player_id and self.attacked_player_id != self.guard_target_id:
-            target = self.get_player(self.attacked_player_id)
-            if target.is_alive:
-                self.kill_player(target.id, DeathReason.ATTACKED)
-                self.last_night_victim_id = target.id
+        for victim_id in resolution.victim_ids:
+            self.kill_player(victim_id, DeathReason.ATTACKED)
+            self.last_night_victim_id = victim_id
 
         self._reset_night_action_records()
         return self.last_night_victim_id
 
-    def refresh_victory(self) -> VictoryResult:
-        alive = self.alive_players()
-        alive_werewolves = self._count_actual_werewolves(alive)
-        alive_non_werewolves = len(alive) - alive_werewolves
+    @_notifies
+    def apply(self, actions: Iterable[Command]) -> GamePhase:
+        """Apply a batch of commands atomically and return the resulting phase.
+
+        Commands are validated in one pass before anything runs. The result matches
+        calling the methods one at a time: kills keep running alive counts, so a kill
+        that decides the game finishes it there, and any later kill or target in the
+        batch is rejected (phase commands after it are no-ops). Any failure restores
+        the game to its state before the call; ``Player`` objects stay live throughout.
+        """
+        commands = list(actions)
+        self._validate_commands(commands)
+
+        saved = self._save_state()
+        events = self._observers.mark() if self._observers is not None else None
+        finished = self.phase is GamePhase.FINISHED
+        self._batch_alive = list(self._alive_counts())
+        self._undo = {}
+        try:
+            for command in commands:
+                if not finished and self.phase is GamePhase.FINISHED and isinstance(command, (KillPlayer, SetTarget)):
+                    raise ValueError(f"Game already finished before {command!r}")
+                self._apply_command(command)
+            self._flush_victory()
+        except Exception:
+            self._rollback(saved)
+            if events is not None and self._observers is not None:
+                self._observers.rollback(events)
+            raise
+        finally:
+            self._batch_alive = None
+            self._undo = None
+        return self.phase
 
+    @_notifies
+    def refresh_victory(self) -> VictoryResult:
+        self._victory_dirty = False
+        previous_state = self.victory.state
+        alive_werewolves, alive_non_werewolves = self._alive_counts()
         self.victory = VictoryJudge.evaluate(
             alive_werewolves=alive_werewolves,
             alive_non_werewolves=alive_non_werewolves,
@@ -167,10 +560,14 @@ class Game:
 
         if self.victory.state is not VictoryState.ONGOING:
             self.phase = GamePhase.FINISHED
+        if self._observers is not None and self.victory.state is not previous_state:
+            self._observers.victory = VictoryEvent(self.victory)
 
         return self.victory
 
+    @_notifies
     def proceed_to_next_phase(self) -> GamePhase:
+        self._flush_victory()
         if self.phase is GamePhase.FINISHED:
             return self.phase
 
@@ -210,6 +607,7 @@ class Game:
             return self.phase
 
         self.resolve_night_actions()
+        self._flush_victory()
         if self.phase is GamePhase.FINISHED:
             return self.phase
 
@@ -217,23 +615,157 @@ class Game:
         self.day += 1
         return self.phase
 
+    def _validate_commands(self, commands: list[Command]) -> None:
+        player_ids = {player.id for player in self.players}
+        for command in commands:
+            if isinstance(command, KillPlayer):
+                if not isinstance(command.reason, DeathReason):
+                    raise ValueError(f"Invalid death reason: {command.reason!r}")
+            elif isinstance(command, SetTarget):
+                if not isinstance(command.kind, NightActionKind):
+                    raise ValueError(f"Invalid night action: {command.kind!r}")
+            elif not isinstance(command, (AdvancePhase, RevertPhase)):
+                raise ValueError(f"Unsupported command: {command!r}")
+            else:
+                continue
+            if command.player_id not in player_ids:
+                raise ValueError(f"Player not found: {command.player_id}")
+
+    def _unsubscribe(self, callbacks: dict[str, Callable]) -> None:
+        if self._observers is None:
+            return
+        self._observers.subscribers = [
+            subscriber for subscriber in self._observers.subscribers if subscriber is not callbacks
+        ]
+        if not self._observers.subscribers and not self._batch_depth:
+            self._observers = None
+
+    def _apply_command(self, command: Command) -> None:
+        if isinstance(command, KillPlayer):
+            self.kill_player(command.player_id, command.reason)
+        elif isinstance(command, SetTarget):
+            if command.kind is NightActionKind.SEER:
+                self.set_seer_target(command.player_id)
+            elif command.kind is NightActionKind.MEDIUM:
+                self.set_medium_target(command.player_id)
+            elif command.kind is NightActionKind.GUARD:
+                self.set_guard_target(command.player_id)
+            else:
+                self.set_attack_target(command.player_id)
+        elif isinstance(command, RevertPhase):
+            self.revert_to_previous_night_phase()
+        else:
+            self.proceed_to_next_phase()
+
+    def _flush_victory(self) -> None:
+        if self._victory_dirty:
+            self.refresh_victory()
+
+    def _save_state(self) -> dict[str, object]:
+        saved = {name: getattr(self, name) for name in _SAVED_SLOTS}
+        saved["divinations"] = list(self.divinations)
+        saved["night_actions"] = dict(self.night_actions)
+        saved["rules"] = GameRules(
+            day_seconds=self.rules.day_seconds,
+            night_seconds=self.rules.night_seconds,
+            first_day_seer=self.rules.first_day_seer,
+        )
+        return saved
+
+    def _rollback(self, saved: dict[str, object]) -> None:
+        """Undo an apply(): scalar fields from ``saved``, player rows from the undo log."""
+        for name, value in saved.items():
+            object.__setattr__(self, name, value)
+        for idx, (original, before) in (self._undo or {}).items():
+            if self._table is not None:
+                self._table.restore(idx, before)
+            else:
+                original.is_alive = before.is_alive
+                original.death_reason = before.death_reason
+                original.death_day = before.death_day
+                self.players[idx] = original
+        self._candidate_cache = {}
+
+    def _alive_counts(self) -> tuple[int, int]:
+        if self._table is not None:
+            alive_mask = self._table.alive_mask
+            alive_werewolves = (alive_mask & self._table.role_mask(Role.WEREWOLF)).bit_count()
+            return alive_werewolves, alive_mask.bit_count() - alive_werewolves
+        alive = self.alive_players()
+        alive_werewolves = self._count_actual_werewolves(alive)
+        return alive_werewolves, len(alive) - alive_werewolves
+
     @staticmethod
     def _count_actual_werewolves(players: Iterable[Player]) -> int:
         return sum(1 for p in players if p.role is Role.WEREWOLF)
 
-    def _require_alive_player(self, player_id: str) -> Player:
+    def _player_index(self, player_id: int) -> int:
+        # The index may be shared with forks or stale after direct list edits, so verify the hit.
+        idx = self._index.get(player_id)
+        if idx is not None and idx < len(self.players) and self.players[idx].id == player_id:
+            return idx
+        self._index = {player.id: idx for idx, player in enumerate(self.players)}
+        idx = self._index.get(player_id)
+        if idx is None:
+            raise ValueError(f"Player not found: {player_id}")
+        return idx
+
+    def _writable_player(self, player_id: int) -> Player:
+        idx = self._player_index(player_id)
+        player = self.players[idx]
+        if self._undo is not None and idx not in self._undo:
+            self._undo[idx] = (player, player.copy())
+        if self._table is None and player._owner is not self._token:
+            player = player.copy()
+            player._owner = self._token
+            self.players[idx] = player
+        return player
+
+    def _require_alive_player(self, player_id: int) -> Player:
         player = self.get_player(player_id)
         if not player.is_alive:
             raise ValueError(f"Player is not alive: {player.name}")
         return player
 
+    def _record_divination(self, role: Role, target: Player) -> None:
+        self._discard_divination(role)
+        actor = next((p for p in self.players if p.role is role and p.is_alive), None)
+        self.divinations.append(
+            Divination(
+                day=self.day,
+                role=role,
+                actor_id=actor.id if actor is not None else None,
+                target_id=target.id,
+                is_werewolf=target.is_werewolf,
+            )
+        )
+
+    def _discard_divination(self, role: Role) -> None:
+        self.divinations = [d for d in self.divinations if (d.day, d.role) != (self.day, role)]
+
     def _reset_night_action_records(self) -> None:
         self.seer_target_id = None
         self.medium_target_id = None
         self.guard_target_id = None
         self.attacked_player_id = None
-
-    def _clear_player_reference(self, player_id: str) -> None:
+        if self.night_actions:
+            self._discard_night_actions()
+
+    def _discard_night_actions(self, kind: NightActionKind | None = None, player_id: int | None = None) -> None:
+        kept: dict[tuple[NightActionKind, int], NightAction] = {}
+        for key, action in self.night_actions.items():
+            if (kind is None or action.kind is kind) and (
+                player_id is None or player_id in (action.actor_id, action.target_id)
+            ):
+                self._fingerprint ^= night_action_key(action)
+                if self._observers is not None:
+                    self._observers.targets.append(TargetSetEvent(action.kind, None, action.actor_id))
+            else:
+                kept[key] = action
+        self.night_actions = kept
+
+    def _clear_player_reference(self, player_id: int) -> None:
+        self._discard_night_actions(player_id=player_id)
         if self.seer_target_id == player_id:
             self.seer_target_id = None
         if self.medium_target_id == player_id:
@@ -252,3 +784,15 @@ class Game:
             self.last_attack_target_id = None
         if self.first_day_white_target_id == player_id:
             self.first_day_white_target_id = None
+        self.divinations = [
+            d for d in self.divinations if player_id not in {d.actor_id, d.target_id}
+        ]
+
+
+# Fields apply() saves and puts back on rollback; player rows go through the undo log.
+_SAVED_SLOTS = tuple(
+    name
+    for name in Game.__slots__
+    if name
+    not in {"players", "_table", "_index", "_token", "_observers", "_batch_depth", "_batch_alive", "_undo", "_candidate_cache"}
+)
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from .enums import GamePhase
+from .game import Game
+
+
+@dataclass(slots=True, frozen=True)
+class HistoryEntry:
+    day: int
+    phase: GamePhase
+    fingerprint: int
+    snapshot: Game
+
+
+class GameHistory:
+    """Forked snapshots of a game so any recorded point can be branched from later."""
+
+    def __init__(self, game: Game) -> None:
+        self.game = game
+        self._entries: list[HistoryEntry] = []
+        self.record()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getitem__(self, index: int) -> HistoryEntry:
+        return self._entries[index]
+
+    def record(self) -> int:
+        snapshot = self.game.fork()
+        self._entries.append(
+            HistoryEntry(
+                day=snapshot.day,
+                phase=snapshot.phase,
+                fingerprint=snapshot.fingerprint,
+                snapshot=snapshot,
+            )
+        )
+        return len(self._entries) - 1
+
+    def branch(self, index: int) -> Game:
+        """New game starting from the recorded point; the stored snapshot stays untouched."""
+        return self._entries[index].snapshot.fork()
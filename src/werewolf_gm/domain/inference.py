@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+from collections import Counter
+from dataclasses import dataclass, field
+from itertools import product
+from typing import Iterable, Union
+
+from .enums import DeathReason, GamePhase, Role, VictoryState
+from .game import Game
+
+ROLES: tuple[Role, ...] = tuple(Role)
+ROLE_BIT: dict[Role, int] = {role: 1 << idx for idx, role in enumerate(ROLES)}
+WEREWOLF_BIT = ROLE_BIT[Role.WEREWOLF]
+LIAR_MASK = ROLE_BIT[Role.WEREWOLF] | ROLE_BIT[Role.MADMAN]
+
+
+@dataclass(slots=True, frozen=True)
+class KnownRole:
+    """Hard fact: the player is (or, with ``is_role=False``, is not) the given role."""
+
+    player_id: int
+    role: Role
+    is_role: bool = True
+
+
+@dataclass(slots=True, frozen=True)
+class RoleClaim:
+    """Public claim. Villager-side players never lie, so a claimant is the role or werewolf-side."""
+
+    player_id: int
+    role: Role
+
+
+@dataclass(slots=True, frozen=True)
+class RoleReport:
+    """A seer/medium style result that only holds if the speaker really has ``role``."""
+
+    speaker_id: int
+    role: Role
+    target_id: int
+    is_werewolf: bool
+
+
+Observation = Union[KnownRole, RoleClaim, RoleReport]
+
+
+@dataclass(slots=True)
+class RoleMarginals:
+    assignments: int
+    by_player: dict[int, dict[Role, float]] = field(default_factory=dict)
+
+    @property
+    def is_consistent(self) -> bool:
+        return self.assignments > 0
+
+    def probability(self, player_id: int, role: Role) -> float:
+        return self.by_player.get(player_id, {}).get(role, 0.0)
+
+    def werewolf_probability(self, player_id: int) -> float:
+        return self.probability(player_id, Role.WEREWOLF)
+
+
+def observations_from_game(game: Game) -> list[Observation]:
+    """Public facts the GM has recorded: night results and who was killed by wolves."""
+    observations: list[Observation] = []
+    for divination in game.divinations:
+        if divination.actor_id is None:
+            continue
+        observations.append(
+            RoleReport(
+                speaker_id=divination.actor_id,
+                role=divination.role,
+                target_id=divination.target_id,
+                is_werewolf=divination.is_werewolf,
+            )
+        )
+    for player in game.players:
+        if player.death_reason is DeathReason.ATTACKED:
+            observations.append(KnownRole(player.id, Role.WEREWOLF, is_role=False))
+    return observations
+
+
+def infer_roles(
+    game: Game,
+    observations: Iterable[Observation] = (),
+    *,
+    include_game_records: bool = True,
+) -> RoleMarginals:
+    """Count role assignments consistent with the composition, the observations and
+    the current victory state, and return per-player role marginals.
+
+    Unary facts become per-player bitmask candidates. Reports are conditional on their
+    speaker, so each (speaker, role) pair is branched on; every branch is then counted
+    exactly with a forward/backward DP over the remaining role counts instead of
+    enumerating assignments one by one.
+    """
+    players = game.players
+    index_by_id = {player.id: idx for idx, player in enumerate(players)}
+    composition = Counter(player.role for player in players)
+    full_mask = 0
+    for role, count in composition.items():
+        if count:
+            full_mask |= ROLE_BIT[role]
+    masks = [full_mask] * len(players)
+
+    all_observations = list(observations)
+    if include_game_records:
+        all_observations.extend(observations_from_game(game))
+
+    reports: dict[tuple[int, Role], list[tuple[int, bool]]] = {}
+    for observation in all_observations:
+        if isinstance(observation, KnownRole):
+            idx = _require_index(index_by_id, observation.player_id)
+            bit = ROLE_BIT[observation.role]
+            masks[idx] &= bit if observation.is_role else ~bit
+        elif isinstance(observation, RoleClaim):
+            idx = _require_index(index_by_id, observation.player_id)
+            masks[idx] &= ROLE_BIT[observation.role] | LIAR_MASK
+        elif isinstance(observation, RoleReport):
+            speaker = _require_index(index_by_id, observation.speaker_id)
+            target = _require_index(index_by_id, observation.target_id)
+            reports.setdefault((speaker, observation.role), []).append((target, observation.is_werewolf))
+        else:
+            raise ValueError(f"Unknown observation: {observation!r}")
+
+    counter = _AssignmentCounter(
+        role_counts=[composition.get(role, 0) for role in ROLES],
+        alive=[player.is_alive for player in players],
+        victory_state=game.victory.state if game.phase is GamePhase.FINISHED else VictoryState.ONGOING,
+    )
+
+    total = 0
+    marginal_counts = [[0] * len(ROLES) for _ in players]
+    branch_keys = list(reports)
+    for truths in product((True, False), repeat=len(branch_keys)):
+        branch = _apply_branch(masks, branch_keys, truths, reports)
+        if branch is None:
+            continue
+        branch_total, branch_marginals = counter.count(branch)
+        if not branch_total:
+            continue
+        total += branch_total
+        for idx, row in enumerate(branch_marginals):
+            target_row = marginal_counts[idx]
+            for role_idx, value in enumerate(row):
+                target_row[role_idx] += value
+
+    result = RoleMarginals(assignments=total)
+    if total:
+        for player, row in zip(players, marginal_counts):
+            result.by_player[player.id] = {
+                role: value / total for role, value in zip(ROLES, row) if value
+            }
+    return result
+
+
+def _require_index(index_by_id: dict[int, int], player_id: int) -> int:
+    try:
+        return index_by_id[player_id]
+    except KeyError:
+        raise ValueError(f"Player not found: {player_id}") from None
+
+
+def _apply_branch(
+    masks: list[int],
+    branch_keys: list[tuple[int, Role]],
+    truths: tuple[bool, ...],
+    reports: dict[tuple[int, Role], list[tuple[int, bool]]],
+) -> list[int] | None:
+    branch = list(masks)
+    for (speaker, role), is_true in zip(branch_keys, truths):
+        bit = ROLE_BIT[role]
+        if not is_true:
+            branch[speaker] &= ~bit
+            continue
+        branch[speaker] &= bit
+        for target, is_werewolf in reports[(speaker, role)]:
+            branch[target] &= WEREWOLF_BIT if is_werewolf else ~WEREWOLF_BIT
+    if any(mask == 0 for mask in branch):
+        return None
+    return branch
+
+
+class _AssignmentCounter:
+    """Exact DP counter over (remaining role counts, alive werewolves) states."""
+
+    def __init__(self, *, role_counts: list[int], alive: list[bool], victory_state: VictoryState) -> None:
+        self.role_counts = role_counts
+        self.alive = alive
+        self.alive_total = sum(alive)
+        self.victory_state = victory_state
+        self.wolf_idx = ROLES.index(Role.WEREWOLF)
+
+        # Mixed-radix encoding: one digit per role for the remaining count, one for alive wolves.
+        self.strides: list[int] = []
+        stride = 1
+        for count in role_counts:
+            self.strides.append(stride)
+            stride *= count + 1
+        self.alive_wolf_stride = stride
+
+    def count(self, masks: list[int]) -> tuple[int, list[list[int]]]:
+        if not self._feasible(masks):
+            return 0, []
+
+        start = sum(count * stride for count, stride in zip(self.role_counts, self.strides))
+        forward: list[dict[int, int]] = [{start: 1}]
+        for idx, mask in enumerate(masks):
+            layer: dict[int, int] = {}
+            for state, ways in forward[-1].items():
+                for role_idx, next_state in self._transitions(state, mask, self.alive[idx]):
+                    layer[next_state] = layer.get(next_state, 0) + ways
+            forward.append(layer)
+
+        backward: dict[int, int] = {}
+        for state in forward[-1]:
+            if self._accepts(state):
+                backward[state] = 1
+
+        marginals = [[0] * len(ROLES) for _ in masks]
+        for idx in range(len(masks) - 1, -1, -1):
+            previous: dict[int, int] = {}
+            row = marginals[idx]
+            for state, ways in forward[idx].items():
+                completions = 0
+                for role_idx, next_state in self._transitions(state, masks[idx], self.alive[idx]):
+                    tail = backward.get(next_state)
+                    if tail:
+                        completions += tail
+                        row[role_idx] += ways * tail
+                if completions:
+                    previous[state] = completions
+            backward = previous
+
+        total = backward.get(start, 0)
+        return total, marginals
+
+    def _transitions(self, state: int, mask: int, is_alive: bool) -> Iterable[tuple[int, int]]:
+        for role_idx, stride in enumerate(self.strides):
+            if not mask >> role_idx & 1:
+                continue
+            if (state // stride) % (self.role_counts[role_idx] + 1) == 0:
+                continue
+            next_state = state - stride
+            if is_alive and role_idx == self.wolf_idx:
+                next_state += self.alive_wolf_stride
+            yield role_idx, next_state
+
+    def _accepts(self, state: int) -> bool:
+        alive_wolves = state // self.alive_wolf_stride
+        others = self.alive_total - alive_wolves
+        if self.victory_state is VictoryState.VILLAGER_WIN:
+            return alive_wolves == 0
+        if self.victory_state is VictoryState.WEREWOLF_WIN:
+            return 0 < alive_wolves and alive_wolves >= others
+        return 0 < alive_wolves < others
+
+    def _feasible(self, masks: list[int]) -> bool:
+        for role_idx, count in enumerate(self.role_counts):
+            bit = 1 << role_idx
+            allowed = sum(1 for mask in masks if mask & bit)
+            forced = sum(1 for mask in masks if mask == bit)
+            if allowed < count or forced > count:
+                return False
+        return True
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+from .enums import NightActionKind
+
+# Lower runs first. Protections must be in place before the attack lands.
+NIGHT_ACTION_PRIORITY: dict[NightActionKind, int] = {
+    NightActionKind.SEER: 0,
+    NightActionKind.MEDIUM: 0,
+    NightActionKind.GUARD: 1,
+    NightActionKind.ATTACK: 2,
+}
+DAWN_ACTION_KINDS = frozenset({NightActionKind.GUARD, NightActionKind.ATTACK})
+
+
+@dataclass(slots=True, frozen=True)
+class NightAction:
+    """One submitted night action. ``actor_id=None`` is the GM entering the decision for the whole role."""
+
+    kind: NightActionKind
+    target_id: int
+    actor_id: int | None = None
+
+
+@dataclass(slots=True, frozen=True)
+class NightResolution:
+    guarded_ids: frozenset[int]
+    attack_target_id: int | None
+    victim_ids: tuple[int, ...]
+    protected_ids: tuple[int, ...]
+
+
+EMPTY_NIGHT = NightResolution(guarded_ids=frozenset(), attack_target_id=None, victim_ids=(), protected_ids=())
+
+
+def resolve_night(actions: Iterable[NightAction], *, is_alive: Callable[[int], bool]) -> NightResolution:
+    """Resolve every submitted action in one pass, in priority order.
+
+    Actions are bucketed by priority (no sort), so the cost is linear in the number of
+    actions. Werewolves pick one attack target: a GM decision (``actor_id=None``) wins,
+    otherwise the most-voted target, with ties going to the lowest player id so the
+    result does not depend on submission order.
+    """
+    buckets: list[list[NightAction]] = [[] for _ in range(max(NIGHT_ACTION_PRIORITY.values()) + 1)]
+    for action in actions:
+        buckets[NIGHT_ACTION_PRIORITY[action.kind]].append(action)
+
+    guarded: set[int] = set()
+    pack_target: int | None = None
+    attack_votes: dict[int, int] = {}
+    for bucket in buckets:
+        for action in bucket:
+            if action.kind is NightActionKind.GUARD:
+                guarded.add(action.target_id)
+            elif action.kind is NightActionKind.ATTACK:
+                if action.actor_id is None:
+                    pack_target = action.target_id
+                else:
+                    attack_votes[action.target_id] = attack_votes.get(action.target_id, 0) + 1
+
+    attack_target = pack_target
+    if attack_target is None and attack_votes:
+        attack_target = min(attack_votes, key=lambda target_id: (-attack_votes[target_id], target_id))
+
+    victims: tuple[int, ...] = ()
+    protected: tuple[int, ...] = ()
+    if attack_target is not None and is_alive(attack_target):
+        if attack_target in guarded:
+            protected = (attack_target,)
+        else:
+            victims = (attack_target,)
+    return NightResolution(
+        guarded_ids=frozenset(guarded),
+        attack_target_id=attack_target,
+        victim_ids=victims,
+        protected_ids=protected,
+    )
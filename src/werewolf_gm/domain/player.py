@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from uuid import uuid4
 
 from .enums import DeathReason, Role, Team
 
@@ -10,10 +9,11 @@ from .enums import DeathReason, Role, Team
 class Player:
     name: str
     role: Role
-    id: str = field(default_factory=lambda: str(uuid4()))
+    id: int = -1
     is_alive: bool = True
     death_reason: DeathReason | None = None
     death_day: int | None = None
+    _owner: object | None = field(default=None, init=False, repr=False, compare=False)
 
     @property
     def team(self) -> Team:
@@ -23,6 +23,16 @@ class Player:
     def is_werewolf(self) -> bool:
         return self.role.is_actual_werewolf
 
+    def copy(self) -> Player:
+        return Player(
+            name=self.name,
+            role=self.role,
+            id=self.id,
+            is_alive=self.is_alive,
+            death_reason=self.death_reason,
+            death_day=self.death_day,
+        )
+
     def kill(self, reason: DeathReason) -> None:
         self.is_alive = False
         self.death_reason = reason
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+from array import array
+from typing import Iterable, Iterator
+
+from .enums import DeathReason, Role, Team
+from .player import Player
+
+ROLES: tuple[Role, ...] = tuple(Role)
+ROLE_CODE: dict[Role, int] = {role: code for code, role in enumerate(ROLES)}
+DEATH_REASONS: tuple[DeathReason, ...] = tuple(DeathReason)
+DEATH_REASON_CODE: dict[DeathReason, int] = {reason: code + 1 for code, reason in enumerate(DEATH_REASONS)}
+NO_DEATH_DAY = -1
+
+
+class PlayerTable:
+    """Struct-of-arrays player storage for very large lobbies.
+
+    Each attribute is a compact column indexed by row, and the alive flag and every
+    role are mirrored as int bitsets (bit ``row``) so filters are bit operations.
+    ``views`` holds one ``TablePlayer`` per row, standing in for ``Player`` objects.
+    """
+
+    __slots__ = (
+        "names",
+        "ids",
+        "roles",
+        "alive",
+        "death_reasons",
+        "death_days",
+        "alive_mask",
+        "role_masks",
+        "views",
+    )
+
+    def __init__(self) -> None:
+        self.names: list[str] = []
+        self.ids = array("q")
+        self.roles = bytearray()
+        self.alive = bytearray()
+        self.death_reasons = bytearray()
+        self.death_days = array("i")
+        self.alive_mask = 0
+        self.role_masks = [0] * len(ROLES)
+        self.views: list[TablePlayer] = []
+
+    @classmethod
+    def from_players(cls, players: Iterable[Player]) -> PlayerTable:
+        table = cls()
+        for player in players:
+            table.append(
+                name=player.name,
+                role=player.role,
+                player_id=player.id,
+                is_alive=player.is_alive,
+                death_reason=player.death_reason,
+                death_day=player.death_day,
+            )
+        return table
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def append(
+        self,
+        *,
+        name: str,
+        role: Role,
+        player_id: int,
+        is_alive: bool = True,
+        death_reason: DeathReason | None = None,
+        death_day: int | None = None,
+    ) -> TablePlayer:
+        row = len(self.names)
+        self.names.append(name)
+        self.ids.append(player_id)
+        self.roles.append(ROLE_CODE[role])
+        self.alive.append(1 if is_alive else 0)
+        self.death_reasons.append(DEATH_REASON_CODE[death_reason] if death_reason is not None else 0)
+        self.death_days.append(death_day if death_day is not None else NO_DEATH_DAY)
+        bit = 1 << row
+        if is_alive:
+            self.alive_mask |= bit
+        self.role_masks[ROLE_CODE[role]] |= bit
+        view = TablePlayer(self, row)
+        self.views.append(view)
+        return view
+
+    def remove(self, row: int) -> None:
+        del self.names[row]
+        del self.ids[row]
+        del self.roles[row]
+        del self.alive[row]
+        del self.death_reasons[row]
+        del self.death_days[row]
+        self.alive_mask = _drop_bit(self.alive_mask, row)
+        self.role_masks = [_drop_bit(mask, row) for mask in self.role_masks]
+        del self.views[row]
+        for view in self.views[row:]:
+            view._row -= 1
+
+    def kill(self, row: int, reason: DeathReason) -> None:
+        self.alive[row] = 0
+        self.death_reasons[row] = DEATH_REASON_CODE[reason]
+        self.alive_mask &= ~(1 << row)
+
+    def restore(self, row: int, player: Player) -> None:
+        """Put back the alive and death columns of ``row`` from a ``Player`` copy."""
+        self.alive[row] = 1 if player.is_alive else 0
+        self.death_reasons[row] = DEATH_REASON_CODE[player.death_reason] if player.death_reason is not None else 0
+        self.death_days[row] = player.death_day if player.death_day is not None else NO_DEATH_DAY
+        if player.is_alive:
+            self.alive_mask |= 1 << row
+        else:
+            self.alive_mask &= ~(1 << row)
+
+    def copy(self) -> PlayerTable:
+        table = PlayerTable()
+        table.names = list(self.names)
+        table.ids = array("q", self.ids)
+        table.roles = bytearray(self.roles)
+        table.alive = bytearray(self.alive)
+        table.death_reasons = bytearray(self.death_reasons)
+        table.death_days = array("i", self.death_days)
+        table.alive_mask = self.alive_mask
+        table.role_masks = list(self.role_masks)
+        table.views = [TablePlayer(table, row) for row in range(len(self.names))]
+        return table
+
+    def role_mask(self, role: Role) -> int:
+        return self.role_masks[ROLE_CODE[role]]
+
+    def players_in(self, mask: int) -> list[TablePlayer]:
+        views = self.views
+        return [views[row] for row in iter_bits(mask)]
+
+
+class TablePlayer:
+    """Row view into a ``PlayerTable`` exposing the ``Player`` attribute API."""
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: PlayerTable, row: int) -> None:
+        self._table = table
+        self._row = row
+
+    def __repr__(self) -> str:
+        return (
+            f"TablePlayer(name={self.name!r}, role={self.role}, id={self.id}, "
+            f"is_alive={self.is_alive}, death_reason={self.death_reason}, death_day={self.death_day})"
+        )
+
+    @property
+    def name(self) -> str:
+        return self._table.names[self._row]
+
+    @property
+    def id(self) -> int:
+        return self._table.ids[self._row]
+
+    @property
+    def role(self) -> Role:
+        return ROLES[self._table.roles[self._row]]
+
+    @property
+    def is_alive(self) -> bool:
+        return bool(self._table.alive[self._row])
+
+    @property
+    def death_reason(self) -> DeathReason | None:
+        code = self._table.death_reasons[self._row]
+        return DEATH_REASONS[code - 1] if code else None
+
+    @property
+    def death_day(self) -> int | None:
+        day = self._table.death_days[self._row]
+        return None if day == NO_DEATH_DAY else day
+
+    @death_day.setter
+    def death_day(self, day: int | None) -> None:
+        self._table.death_days[self._row] = NO_DEATH_DAY if day is None else day
+
+    @property
+    def team(self) -> Team:
+        return self.role.team
+
+    @property
+    def is_werewolf(self) -> bool:
+        return self.role.is_actual_werewolf
+
+    def copy(self) -> Player:
+        return Player(
+            name=self.name,
+            role=self.role,
+            id=self.id,
+            is_alive=self.is_alive,
+            death_reason=self.death_reason,
+            death_day=self.death_day,
+        )
+
+    def kill(self, reason: DeathReason) -> None:
+        self._table.kill(self._row, reason)
+
+
+def iter_bits(mask: int) -> Iterator[int]:
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def _drop_bit(mask: int, row: int) -> int:
+    low = mask & ((1 << row) - 1)
+    return low | ((mask >> (row + 1)) << row)
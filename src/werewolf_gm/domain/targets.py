@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .enums import FirstDaySeerRule, GamePhase, NightActionKind, Role
+from .player import Player
+
+if TYPE_CHECKING:
+    from .game import Game
+
+NIGHT_ACTION_ROLES: dict[GamePhase, Role] = {
+    GamePhase.NIGHT_SEER: Role.SEER,
+    GamePhase.NIGHT_MEDIUM: Role.MEDIUM,
+    GamePhase.NIGHT_KNIGHT: Role.KNIGHT,
+    GamePhase.NIGHT_WEREWOLF: Role.WEREWOLF,
+}
+NIGHT_ACTION_PHASES: dict[NightActionKind, GamePhase] = {
+    NightActionKind.SEER: GamePhase.NIGHT_SEER,
+    NightActionKind.MEDIUM: GamePhase.NIGHT_MEDIUM,
+    NightActionKind.GUARD: GamePhase.NIGHT_KNIGHT,
+    NightActionKind.ATTACK: GamePhase.NIGHT_WEREWOLF,
+}
+
+
+@dataclass(slots=True, frozen=True)
+class TargetCandidates:
+    players: tuple[Player, ...]
+    ids: frozenset[int]
+
+    def __contains__(self, player_id: object) -> bool:
+        return player_id in self.ids
+
+    def __len__(self) -> int:
+        return len(self.players)
+
+
+NO_CANDIDATES = TargetCandidates(players=(), ids=frozenset())
+
+
+def compute_target_candidates(game: Game, phase: GamePhase | None = None) -> TargetCandidates:
+    """Legal targets for ``phase`` (default: the current phase) on the current day, in seating order."""
+    if phase is None:
+        phase = game.phase
+    if phase is GamePhase.VOTING:
+        return _candidates(game.alive_players())
+
+    role = NIGHT_ACTION_ROLES.get(phase)
+    if role is None or not game.has_alive_role(role):
+        return NO_CANDIDATES
+
+    if phase is GamePhase.NIGHT_MEDIUM:
+        executed = game.get_executed_player_on_day(game.day)
+        return _candidates([executed] if executed is not None else [])
+
+    if game.day == 0:
+        if phase is GamePhase.NIGHT_WEREWOLF:
+            return NO_CANDIDATES
+        rule = game.rules.first_day_seer
+        if rule is FirstDaySeerRule.NONE:
+            return NO_CANDIDATES
+        if rule is FirstDaySeerRule.RANDOM_WHITE:
+            if game.first_day_white_target_id is None:
+                return NO_CANDIDATES
+            try:
+                target = game.get_player(game.first_day_white_target_id)
+            except ValueError:
+                return NO_CANDIDATES
+            return _candidates([target] if target.is_alive else [])
+
+    return _candidates(game.alive_players_except_role(role))
+
+
+def _candidates(players: list[Player]) -> TargetCandidates:
+    return TargetCandidates(players=tuple(players), ids=frozenset(player.id for player in players))
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable
+
+from .enums import GamePhase
+
+if TYPE_CHECKING:
+    from .game import Game
+
+
+@dataclass(slots=True, frozen=True)
+class VoteResult:
+    leader_ids: tuple[int, ...]
+    top_count: int
+
+    @property
+    def winner_id(self) -> int | None:
+        """The single most-voted player, or ``None`` while nobody leads alone."""
+        if self.top_count and len(self.leader_ids) == 1:
+            return self.leader_ids[0]
+        return None
+
+    @property
+    def is_tie(self) -> bool:
+        return self.top_count > 0 and len(self.leader_ids) > 1
+
+
+class VoteTally:
+    """Live tally of one voting round.
+
+    ``votes`` maps voter -> target, ``counts`` target -> votes and ``buckets`` vote count ->
+    targets with exactly that many votes, so casting or changing a vote and reading the
+    current leaders are O(1).
+    """
+
+    __slots__ = ("voter_ids", "candidate_ids", "round", "votes", "counts", "buckets", "top_count", "_voters")
+
+    def __init__(self, voter_ids: Iterable[int], candidate_ids: Iterable[int], *, round: int = 1) -> None:
+        self.voter_ids: tuple[int, ...] = tuple(voter_ids)
+        self._voters = frozenset(self.voter_ids)
+        self.candidate_ids: tuple[int, ...] = tuple(candidate_ids)
+        self.round = round
+        self.votes: dict[int, int] = {}
+        self.counts: dict[int, int] = dict.fromkeys(self.candidate_ids, 0)
+        self.buckets: dict[int, set[int]] = {0: set(self.candidate_ids)}
+        self.top_count = 0
+
+    @classmethod
+    def for_game(cls, game: Game) -> VoteTally:
+        """Every living player votes for any legal voting target."""
+        voters = [player.id for player in game.alive_players()]
+        return cls(voters, [player.id for player in game.target_candidates(GamePhase.VOTING).players])
+
+    def __len__(self) -> int:
+        return len(self.votes)
+
+    @property
+    def is_complete(self) -> bool:
+        return len(self.votes) == len(self.voter_ids)
+
+    def pending_voter_ids(self) -> list[int]:
+        return [voter_id for voter_id in self.voter_ids if voter_id not in self.votes]
+
+    def count(self, target_id: int) -> int:
+        return self.counts.get(target_id, 0)
+
+    def cast(self, voter_id: int, target_id: int | None) -> tuple[int, ...]:
+        """Set (or with ``None`` withdraw) a vote; return the targets whose count changed."""
+        if voter_id not in self._voters:
+            raise ValueError(f"Player cannot vote: {voter_id}")
+        if target_id is not None:
+            if target_id not in self.counts:
+                raise ValueError(f"Player is not a voting candidate: {target_id}")
+            if target_id == voter_id:
+                raise ValueError("Players cannot vote for themselves")
+
+        previous = self.votes.get(voter_id)
+        if previous == target_id:
+            return ()
+
+        changed: list[int] = []
+        if previous is not None:
+            del self.votes[voter_id]
+            self._move(previous, -1)
+            changed.append(previous)
+        if target_id is not None:
+            self.votes[voter_id] = target_id
+            self._move(target_id, 1)
+            changed.append(target_id)
+        return tuple(changed)
+
+    def result(self) -> VoteResult:
+        leaders = self.buckets.get(self.top_count, set()) if self.top_count else set()
+        order = {player_id: idx for idx, player_id in enumerate(self.candidate_ids)} if len(leaders) > 1 else {}
+        return VoteResult(leader_ids=tuple(sorted(leaders, key=order.get)), top_count=self.top_count)
+
+    def runoff(self) -> VoteTally:
+        """Next round between the tied leaders, voted on by the same voters."""
+        result = self.result()
+        if not result.is_tie:
+            raise ValueError("A runoff needs a tie for the most votes")
+        return VoteTally(self.voter_ids, result.leader_ids, round=self.round + 1)
+
+    def revote(self) -> VoteTally:
+        """Next round over the same candidates with every vote cleared."""
+        return VoteTally(self.voter_ids, self.candidate_ids, round=self.round + 1)
+
+    def _move(self, target_id: int, delta: int) -> None:
+        count = self.counts[target_id]
+        bucket = self.buckets[count]
+        bucket.discard(target_id)
+        if not bucket and count:
+            del self.buckets[count]
+        count += delta
+        self.counts[target_id] = count
+        self.buckets.setdefault(count, set()).add(target_id)
+        if count > self.top_count:
+            self.top_count = count
+        elif delta < 0 and self.top_count == count + 1 and count + 1 not in self.buckets:
+            self.top_count = count
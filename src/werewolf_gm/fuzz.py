@@ -0,0 +1,394 @@
+"""Randomized state-machine fuzzer for ``Game``.
+
+Each case builds a game from scratch with ``add_player``/``remove_player``, starts it
+and then throws a mix of legal and illegal operations at it, checking invariants
+after every step. Operations are plain data, so a failing case can be replayed and
+shrunk to a minimal sequence.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+from operator import attrgetter
+from dataclasses import dataclass, field, fields, is_dataclass
+from enum import Enum
+from typing import Any, Callable, Sequence
+
+from werewolf_gm.domain import (
+    AdvancePhase,
+    Command,
+    DeathReason,
+    Game,
+    GamePhase,
+    KillPlayer,
+    NightActionKind,
+    RevertPhase,
+    Role,
+    SetTarget,
+    VictoryJudge,
+    VictoryState,
+    compute_fingerprint,
+)
+from werewolf_gm.domain.night import DAWN_ACTION_KINDS
+from werewolf_gm.simulation import NIGHT_ACTION_KINDS, default_roles
+
+Op = tuple[str, tuple[Any, ...]]
+
+_TARGET_SETTERS: dict[NightActionKind, Callable[[Game, int], None]] = {
+    NightActionKind.SEER: Game.set_seer_target,
+    NightActionKind.MEDIUM: Game.set_medium_target,
+    NightActionKind.GUARD: Game.set_guard_target,
+    NightActionKind.ATTACK: Game.set_attack_target,
+}
+_DAWN_KINDS = tuple(DAWN_ACTION_KINDS)
+_KINDS = tuple(NightActionKind)
+_REASONS = tuple(DeathReason)
+_REFERENCE_FIELDS = (
+    "seer_target_id",
+    "medium_target_id",
+    "guard_target_id",
+    "attacked_player_id",
+    "last_executed_player_id",
+    "last_night_victim_id",
+    "last_guard_target_id",
+    "last_attack_target_id",
+    "first_day_white_target_id",
+)
+_references = attrgetter(*_REFERENCE_FIELDS)
+
+
+def _apply_commands(game: Game, commands: tuple[Command, ...]) -> None:
+    game.apply(commands)
+
+
+def _run_one_at_a_time(game: Game, commands: Sequence[Command]) -> None:
+    """The public calls each command of an ``apply`` batch stands for, made one by one."""
+    for command in commands:
+        if isinstance(command, KillPlayer):
+            game.kill_player(command.player_id, command.reason)
+        elif isinstance(command, SetTarget):
+            _TARGET_SETTERS[command.kind](game, command.player_id)
+        elif isinstance(command, RevertPhase):
+            game.revert_to_previous_night_phase()
+        else:
+            game.proceed_to_next_phase()
+
+
+def _resolve_night_batch(game: Game, targets: tuple[tuple[NightActionKind, int], ...]) -> None:
+    game.resolve_night_batch(dict(targets))
+
+
+OPERATIONS: dict[str, Callable[..., object]] = {
+    "add_player": Game.add_player,
+    "remove_player": Game.remove_player,
+    "start_game": Game.start_game,
+    "kill_player": Game.kill_player,
+    "set_target": lambda game, kind, player_id: _TARGET_SETTERS[kind](game, player_id),
+    "submit_night_action": Game.submit_night_action,
+    "proceed_to_next_phase": Game.proceed_to_next_phase,
+    "revert_to_previous_night_phase": Game.revert_to_previous_night_phase,
+    "apply": _apply_commands,
+    "resolve_night_batch": _resolve_night_batch,
+}
+
+
+def _literal(value: object) -> str:
+    if isinstance(value, Enum):
+        return f"{type(value).__name__}.{value.name}"
+    if isinstance(value, tuple):
+        items = ", ".join(map(_literal, value))
+        return f"({items},)" if len(value) == 1 else f"({items})"
+    if is_dataclass(value):
+        args = ", ".join(_literal(getattr(value, item.name)) for item in fields(value))
+        return f"{type(value).__name__}({args})"
+    return repr(value)
+
+
+def format_op(op: Op) -> str:
+    """``op`` as the ``Game`` method call it stands for."""
+    name, args = op
+    if name == "set_target":
+        kind, player_id = args
+        return f"game.{_TARGET_SETTERS[kind].__name__}({player_id!r})"
+    if name == "resolve_night_batch":
+        targets = ", ".join(f"{_literal(kind)}: {player_id!r}" for kind, player_id in args[0])
+        return f"game.resolve_night_batch({{{targets}}})"
+    return f"game.{name}({', '.join(map(_literal, args))})"
+
+
+class InvariantViolation(AssertionError):
+    def __init__(self, invariant: str, message: str) -> None:
+        super().__init__(f"{invariant}: {message}")
+        self.invariant = invariant
+
+
+@dataclass(slots=True)
+class FuzzFailure:
+    seed: int
+    invariant: str
+    message: str
+    ops: list[Op]
+
+    def reproduction(self) -> str:
+        """Python statements that replay the failing sequence."""
+        return "\n".join(["game = Game()", *map(format_op, self.ops)])
+
+    def format(self) -> str:
+        return (
+            f"invariant {self.invariant} failed (seed {self.seed}, {len(self.ops)} ops): {self.message}\n"
+            + self.reproduction()
+        )
+
+
+@dataclass(slots=True)
+class FuzzStats:
+    cases: int = 0
+    steps: int = 0
+    rejected: int = 0
+    finished: int = 0
+    seconds: float = 0.0
+    failures: list[FuzzFailure] = field(default_factory=list)
+
+    @property
+    def steps_per_second(self) -> float:
+        return self.steps / self.seconds if self.seconds else 0.0
+
+
+class _Checker:
+    """Runs operations against one game and checks the invariants after each.
+
+    The full fingerprint recompute is O(players), so with ``full=False`` it is left to
+    :meth:`check_fingerprint` at the end of a case; shrinking always runs ``full``.
+    """
+
+    __slots__ = ("game", "full", "started", "finished", "ids")
+
+    def __init__(self, *, full: bool = True) -> None:
+        self.game = Game()
+        self.full = full
+        self.started = False
+        self.finished = False
+        self.ids: frozenset[int] = frozenset()
+
+    def step(self, op: Op) -> bool:
+        """Run ``op``; return False if the game rejected it with ``ValueError``."""
+        game = self.game
+        name, args = op
+        before = (game.fingerprint, game.victory.state, len(game.players), len(game.divinations))
+        sequential = game.fork() if name == "apply" else None
+        try:
+            OPERATIONS[name](game, *args)
+        except ValueError:
+            if (game.fingerprint, game.victory.state, len(game.players), len(game.divinations)) != before:
+                raise InvariantViolation("rejected_is_noop", f"{name}{args!r} raised but changed the game")
+            self._check()
+            return False
+        except Exception as exc:  # noqa: BLE001 - anything but ValueError is a bug
+            raise InvariantViolation("crash", f"{name}{args!r} raised {exc!r}") from exc
+        if sequential is not None:
+            self._check_one_at_a_time(sequential, args[0])
+        if name == "start_game":
+            self.started = True
+        elif name == "add_player" or name == "remove_player":
+            self.ids = frozenset(player.id for player in game.players)
+        self._check()
+        return True
+
+    def check_fingerprint(self) -> None:
+        if self.game.fingerprint != compute_fingerprint(self.game):
+            raise InvariantViolation("fingerprint", "incremental fingerprint differs from a full recompute")
+
+    def _check_one_at_a_time(self, sequential: Game, commands: Sequence[Command]) -> None:
+        # An accepted batch must end where the same calls made one at a time end.
+        try:
+            _run_one_at_a_time(sequential, commands)
+        except ValueError as exc:
+            raise InvariantViolation("apply_sequential", f"apply accepted a batch that fails one at a time: {exc}")
+        game = self.game
+        if (game.fingerprint, game.victory.state, game.divinations) != (
+            sequential.fingerprint,
+            sequential.victory.state,
+            sequential.divinations,
+        ):
+            raise InvariantViolation("apply_sequential", f"apply{commands!r} differs from one call at a time")
+
+    def _check(self) -> None:
+        game = self.game
+        if self.full:
+            self.check_fingerprint()
+
+        ids = self.ids
+        for name, player_id in zip(_REFERENCE_FIELDS, _references(game)):
+            if player_id is not None and player_id not in ids:
+                raise InvariantViolation("references", f"{name}={player_id} is not a player")
+        for (kind, actor_id), action in game.night_actions.items():
+            if actor_id not in ids or action.target_id not in ids:
+                raise InvariantViolation("references", f"night action {kind.value} {actor_id}->{action.target_id}")
+        for divination in game.divinations:
+            if divination.target_id not in ids:
+                raise InvariantViolation("references", f"divination of missing player {divination.target_id}")
+
+        if self.finished and game.phase is not GamePhase.FINISHED:
+            raise InvariantViolation("finished_absorbing", f"left FINISHED for {game.phase.value}")
+        if not self.started:
+            return
+        werewolves = 0
+        alive = 0
+        for player in game.players:
+            if player.is_alive:
+                alive += 1
+                if player.role is Role.WEREWOLF:
+                    werewolves += 1
+        expected = VictoryJudge.evaluate(alive_werewolves=werewolves, alive_non_werewolves=alive - werewolves)
+        if game.victory.state is not expected.state:
+            raise InvariantViolation(
+                "victory", f"{game.victory.state.value} with {werewolves} wolves of {alive} alive"
+            )
+        if (game.phase is GamePhase.FINISHED) != (expected.state is not VictoryState.ONGOING):
+            raise InvariantViolation("victory", f"phase {game.phase.value} with {expected.state.value}")
+        self.finished = game.phase is GamePhase.FINISHED
+
+
+class _Generator:
+    """Chooses the next operation from the current state; about one in five is illegal."""
+
+    def __init__(self, rng: random.Random, players: int) -> None:
+        self.rng = rng
+        self.players = players
+
+    def setup_ops(self) -> list[Op]:
+        rng = self.rng
+        roles = default_roles(self.players)
+        rng.shuffle(roles)
+        ops: list[Op] = [("add_player", (f"P{idx}", role)) for idx, role in enumerate(roles)]
+        for _ in range(rng.randrange(3)):
+            position = rng.randrange(len(ops) + 1)
+            if rng.random() < 0.5:
+                ops.insert(position, ("add_player", ("P0", rng.choice(roles))))
+            else:
+                ops.insert(position, ("remove_player", (rng.randrange(-1, self.players + 2),)))
+        ops.append(("start_game", ()))
+        return ops
+
+    def next_op(self, game: Game) -> Op:
+        rng = self.rng
+        roll = rng.random()
+        if roll < 0.30:
+            return "proceed_to_next_phase", ()
+        if roll < 0.38:
+            return "kill_player", (self._any_id(game), rng.choice(_REASONS))
+        if roll < 0.60:
+            kind = NIGHT_ACTION_KINDS.get(game.phase) or rng.choice(_KINDS)
+            return "set_target", (kind, self._target_id(game))
+        if roll < 0.68:
+            return "submit_night_action", (rng.choice(_DAWN_KINDS), self._any_id(game), self._target_id(game))
+        if roll < 0.76:
+            return "revert_to_previous_night_phase", ()
+        if roll < 0.92:
+            return "apply", (tuple(self._command(game) for _ in range(rng.randint(1, 4))),)
+        targets = tuple((kind, self._target_id(game)) for kind in _KINDS if rng.random() < 0.8)
+        return "resolve_night_batch", (targets,)
+
+    def _any_id(self, game: Game) -> int:
+        if self.rng.random() < 0.05:
+            return self.rng.choice((-1, len(game.players) + 5))
+        return self.rng.choice(game.players).id
+
+    def _target_id(self, game: Game) -> int:
+        candidates = game.target_candidates()
+        if candidates and self.rng.random() < 0.8:
+            return self.rng.choice(candidates.players).id
+        return self._any_id(game)
+
+    def _command(self, game: Game) -> Command:
+        roll = self.rng.random()
+        if roll < 0.45:
+            return AdvancePhase()
+        if roll < 0.55:
+            return RevertPhase()
+        if roll < 0.7:
+            return KillPlayer(self._any_id(game), self.rng.choice(_REASONS))
+        return SetTarget(self.rng.choice(_KINDS), self._target_id(game))
+
+
+def run_ops(ops: Sequence[Op]) -> None:
+    """Replay ``ops`` on a new game, raising ``InvariantViolation`` at the first broken invariant."""
+    checker = _Checker()
+    for op in ops:
+        checker.step(op)
+
+
+def _fails_with(ops: Sequence[Op], invariant: str) -> bool:
+    try:
+        run_ops(ops)
+    except InvariantViolation as exc:
+        return exc.invariant == invariant
+    return False
+
+
+def shrink(ops: Sequence[Op], invariant: str) -> list[Op]:
+    """Delta-debug ``ops`` down to a sequence that still breaks ``invariant``.
+
+    Drops ever smaller chunks while the failure persists, ending with single operations,
+    so no one operation of the result can be removed. Ids are assigned in ``add_player``
+    order, so adds before a referenced player usually stay.
+    """
+    current = list(ops)
+    chunk = max(1, len(current) // 2)
+    while True:
+        start = 0
+        removed = False
+        while start < len(current):
+            candidate = current[:start] + current[start + chunk :]
+            if candidate and _fails_with(candidate, invariant):
+                current = candidate
+                removed = True
+            else:
+                start += chunk
+        if chunk == 1 and not removed:
+            return current
+        if not removed:
+            chunk = max(1, chunk // 2)
+
+
+def fuzz(
+    *,
+    steps: int = 100_000,
+    seed: int = 0,
+    players: int = 9,
+    steps_per_case: int = 200,
+    max_failures: int = 1,
+) -> FuzzStats:
+    """Run random cases until ``steps`` operations ran or ``max_failures`` were found (shrunk)."""
+    stats = FuzzStats()
+    started_at = time.perf_counter()
+    case_seed = seed
+    while stats.steps < steps and len(stats.failures) < max_failures:
+        rng = random.Random(case_seed)
+        generator = _Generator(rng, players)
+        checker = _Checker(full=False)
+        ops = generator.setup_ops()
+        try:
+            for op in ops:
+                stats.rejected += not checker.step(op)
+            stats.steps += len(ops)
+            after_finish = 0
+            for _ in range(steps_per_case):
+                op = generator.next_op(checker.game)
+                ops.append(op)
+                stats.rejected += not checker.step(op)
+                stats.steps += 1
+                if checker.finished:
+                    after_finish += 1
+                    if after_finish > 5:
+                        break
+            checker.check_fingerprint()
+        except InvariantViolation as exc:
+            minimal = shrink(ops, exc.invariant)
+            stats.failures.append(FuzzFailure(case_seed, exc.invariant, str(exc), minimal))
+        stats.finished += checker.finished
+        stats.cases += 1
+        case_seed += 1
+    stats.seconds = time.perf_counter() - started_at
+    return stats
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-import flet as ft
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import flet as ft
 
 try:
-    from werewolf_gm.ui import WerewolfApp
+    import werewolf_gm  # noqa: F401
 except ModuleNotFoundError as exc:
     if exc.name != "werewolf_gm":
         raise
@@ -11,13 +14,24 @@ except ModuleNotFoundError as exc:
     from pathlib import Path
 
     sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
-    from werewolf_gm.ui import WerewolfApp
+
+# Imported first so startup offsets are measured from here.
+from werewolf_gm.ui.startup import STARTUP  # noqa: E402
 
 
 def main(page: ft.Page) -> None:
-    app = WerewolfApp(page)
-    app.start()
+    from werewolf_gm.ui.shell import AppShell
+
+    STARTUP.mark("imports")
+    AppShell(page).start()
+
+
+def run() -> None:
+    import flet as ft
+
+    STARTUP.mark("flet_imported")
+    ft.app(main)
 
 
 if __name__ == "__main__":
-    ft.app(main)
\ No newline at end of file
+    run()
@@ -0,0 +1,222 @@
+"""Per-player records and Elo ratings over the game archive.
+
+Results are kept in ``ratings.json`` next to the monthly archive files. The index
+remembers how many games of each file it has counted, so :func:`refresh_index` only
+decodes games archived since the last call; :func:`rebuild_index` recounts everything.
+Games are rated in archive order (months, then append order).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from werewolf_gm.archive import ArchivedGame, ArchiveReader, archive_path, open_archives
+from werewolf_gm.domain import Role, Team, VictoryState
+
+INDEX_NAME = "ratings.json"
+INDEX_VERSION = 1
+INITIAL_RATING = 1500.0
+K_FACTOR = 24.0
+
+_WINNERS = {VictoryState.VILLAGER_WIN: Team.VILLAGER, VictoryState.WEREWOLF_WIN: Team.WEREWOLF}
+
+
+def profile_key(name: str) -> str:
+    """Players are matched by name, ignoring case and surrounding spaces."""
+    return name.strip().casefold()
+
+
+@dataclass(slots=True)
+class PlayerProfile:
+    name: str
+    rating: float = INITIAL_RATING
+    games: int = 0
+    wins: int = 0
+    last_played: int = 0
+    # [games, wins] per role and per team.
+    roles: dict[Role, list[int]] = field(default_factory=dict)
+    teams: dict[Team, list[int]] = field(default_factory=dict)
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.games if self.games else 0.0
+
+    def role_win_rate(self, role: Role) -> float | None:
+        games, wins = self.roles.get(role, (0, 0))
+        return wins / games if games else None
+
+    def team_win_rate(self, team: Team) -> float | None:
+        games, wins = self.teams.get(team, (0, 0))
+        return wins / games if games else None
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "rating": self.rating,
+            "games": self.games,
+            "wins": self.wins,
+            "last_played": self.last_played,
+            "roles": {role.value: counts for role, counts in self.roles.items()},
+            "teams": {team.value: counts for team, counts in self.teams.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> PlayerProfile:
+        return cls(
+            name=data["name"],
+            rating=float(data["rating"]),
+            games=int(data["games"]),
+            wins=int(data["wins"]),
+            last_played=int(data.get("last_played", 0)),
+            roles={Role(role): list(counts) for role, counts in data.get("roles", {}).items()},
+            teams={Team(team): list(counts) for team, counts in data.get("teams", {}).items()},
+        )
+
+
+@dataclass(slots=True)
+class RatingIndex:
+    players: dict[str, PlayerProfile] = field(default_factory=dict)
+    # Archive file name -> games already counted from it.
+    sources: dict[str, int] = field(default_factory=dict)
+    games: int = 0
+
+    def profile(self, name: str) -> PlayerProfile | None:
+        return self.players.get(profile_key(name))
+
+    def leaderboard(self, limit: int | None = None, *, min_games: int = 1) -> list[PlayerProfile]:
+        ranked = sorted(
+            (profile for profile in self.players.values() if profile.games >= min_games),
+            key=lambda profile: -profile.rating,
+        )
+        return ranked[:limit]
+
+    def add_game(self, game: ArchivedGame) -> None:
+        """Count ``game`` and move ratings by team Elo (each side rated by its mean)."""
+        winner = _WINNERS.get(game.victory)
+        if winner is None:
+            return
+        profiles: list[tuple[PlayerProfile, Role]] = []
+        for name, role in zip(game.names, game.roles):
+            key = profile_key(name)
+            profile = self.players.get(key)
+            if profile is None:
+                profile = self.players[key] = PlayerProfile(name=name.strip())
+            profiles.append((profile, role))
+
+        sides: dict[Team, list[float]] = {Team.VILLAGER: [], Team.WEREWOLF: []}
+        for profile, role in profiles:
+            sides[role.team].append(profile.rating)
+        means = {team: sum(ratings) / len(ratings) if ratings else INITIAL_RATING for team, ratings in sides.items()}
+        villager_expected = 1 / (1 + 10 ** ((means[Team.WEREWOLF] - means[Team.VILLAGER]) / 400))
+        expected = {Team.VILLAGER: villager_expected, Team.WEREWOLF: 1 - villager_expected}
+
+        for profile, role in profiles:
+            team = role.team
+            won = team is winner
+            profile.rating += K_FACTOR * (won - expected[team])
+            profile.games += 1
+            profile.wins += won
+            profile.last_played = max(profile.last_played, game.finished_at)
+            for counts in (profile.roles.setdefault(role, [0, 0]), profile.teams.setdefault(team, [0, 0])):
+                counts[0] += 1
+                counts[1] += won
+        self.games += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": INDEX_VERSION,
+            "games": self.games,
+            "sources": self.sources,
+            "players": {key: profile.to_dict() for key, profile in self.players.items()},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> RatingIndex:
+        version = data.get("version", INDEX_VERSION)
+        if version != INDEX_VERSION:
+            raise ValueError(f"Unsupported ratings index version: {version}")
+        return cls(
+            players={key: PlayerProfile.from_dict(entry) for key, entry in data.get("players", {}).items()},
+            sources={name: int(count) for name, count in data.get("sources", {}).items()},
+            games=int(data.get("games", 0)),
+        )
+
+
+def index_path(directory: str | Path) -> Path:
+    return Path(directory) / INDEX_NAME
+
+
+def load_index(directory: str | Path) -> RatingIndex:
+    """The saved index as is (empty if there is none); no archive is read."""
+    path = index_path(directory)
+    if not path.exists():
+        return RatingIndex()
+    return RatingIndex.from_dict(json.loads(path.read_text(encoding="utf-8")))
+
+
+def save_index(index: RatingIndex, directory: str | Path) -> None:
+    path = index_path(directory)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(path.name + ".tmp")
+    temporary.write_text(json.dumps(index.to_dict(), ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+    os.replace(temporary, path)
+
+
+def _catch_up(index: RatingIndex, readers: list[ArchiveReader]) -> bool:
+    changed = False
+    for reader in readers:
+        counted = index.sources.get(reader.path.name, 0)
+        if counted == reader.games:
+            continue
+        for game in reader.iter_games(counted):
+            index.add_game(game)
+        index.sources[reader.path.name] = reader.games
+        changed = True
+    return changed
+
+
+def refresh_index(directory: str | Path) -> RatingIndex:
+    """Bring the saved index up to date with the archive, counting only new games.
+
+    Falls back to :func:`rebuild_index` when an archive file has fewer games than the
+    index already counted (it was replaced or truncated).
+    """
+    index = load_index(directory)
+    readers = open_archives(directory)
+    try:
+        if any(index.sources.get(reader.path.name, 0) > reader.games for reader in readers):
+            return rebuild_index(directory)
+        if _catch_up(index, readers):
+            save_index(index, directory)
+    finally:
+        for reader in readers:
+            reader.close()
+    return index
+
+
+def add_archived_game(index: RatingIndex, directory: str | Path, game: ArchivedGame) -> None:
+    """Count ``game``, just appended to its month file, and save; no archive is read.
+
+    ``index`` must be up to date with the archive as it was before the append.
+    """
+    index.add_game(game)
+    name = archive_path(directory, game.finished_at).name
+    index.sources[name] = index.sources.get(name, 0) + 1
+    save_index(index, directory)
+
+
+def rebuild_index(directory: str | Path) -> RatingIndex:
+    """Recount every archived game from scratch and save the result."""
+    index = RatingIndex()
+    readers = open_archives(directory)
+    try:
+        _catch_up(index, readers)
+    finally:
+        for reader in readers:
+            reader.close()
+    save_index(index, directory)
+    return index
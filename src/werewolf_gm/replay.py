@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from werewolf_gm.domain import (
+    AdvancePhase,
+    Command,
+    DeathReason,
+    FirstDaySeerRule,
+    Game,
+    GamePhase,
+    GameRules,
+    KillPlayer,
+    NightActionKind,
+    Player,
+    RevertPhase,
+    Role,
+    SetTarget,
+    VictoryState,
+)
+
+RECORD_VERSION = 1
+CORPUS_ENV = "WEREWOLF_GM_CORPUS"
+
+
+@dataclass(slots=True, frozen=True)
+class GameOutcome:
+    """Where a game ended; a replay must reach the same state (fingerprint included)."""
+
+    victory: VictoryState
+    phase: GamePhase
+    day: int
+    fingerprint: int
+
+    @classmethod
+    def of(cls, game: Game) -> GameOutcome:
+        return cls(victory=game.victory.state, phase=game.phase, day=game.day, fingerprint=game.fingerprint)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "victory": self.victory.value,
+            "phase": self.phase.value,
+            "day": self.day,
+            "fingerprint": f"{self.fingerprint:016x}",
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> GameOutcome:
+        return cls(
+            victory=VictoryState(data["victory"]),
+            phase=GamePhase(data["phase"]),
+            day=int(data["day"]),
+            fingerprint=int(data["fingerprint"], 16),
+        )
+
+
+@dataclass(slots=True)
+class GameRecord:
+    """A started game as seating, rules and the commands applied after ``start_game``."""
+
+    players: list[tuple[str, Role]]
+    # Player ids in seat order; None means 0..n-1. Commands refer to these ids, which
+    # have gaps once a player was removed during setup.
+    player_ids: list[int] | None = None
+    rules: GameRules = field(default_factory=GameRules)
+    first_day_white_target_id: int | None = None
+    commands: list[Command] = field(default_factory=list)
+    seed: int | None = None
+    # Wall-clock start (Unix seconds) and per-command offsets from it, for recorded play.
+    started_at: float | None = None
+    times: list[float] = field(default_factory=list)
+    outcome: GameOutcome | None = None
+
+    @classmethod
+    def from_game(
+        cls,
+        game: Game,
+        commands: Iterable[Command] = (),
+        *,
+        seed: int | None = None,
+        started_at: float | None = None,
+    ) -> GameRecord:
+        return cls(
+            players=[(player.name, player.role) for player in game.players],
+            player_ids=[player.id for player in game.players],
+            rules=GameRules(
+                day_seconds=game.rules.day_seconds,
+                night_seconds=game.rules.night_seconds,
+                first_day_seer=game.rules.first_day_seer,
+            ),
+            first_day_white_target_id=game.first_day_white_target_id,
+            commands=list(commands),
+            seed=seed,
+            started_at=started_at,
+        )
+
+    def add(self, commands: Iterable[Command], at: float | None = None) -> None:
+        """Append commands issued at Unix time ``at`` (needs ``started_at``)."""
+        commands = list(commands)
+        self.commands.extend(commands)
+        if at is not None and self.started_at is not None:
+            self.times.extend([round(at - self.started_at, 3)] * len(commands))
+
+    def finish(self, game: Game) -> None:
+        self.outcome = GameOutcome.of(game)
+
+    def new_game(self) -> Game:
+        """Fresh game at the point the record starts (day 0, seer phase)."""
+        rules = GameRules(
+            day_seconds=self.rules.day_seconds,
+            night_seconds=self.rules.night_seconds,
+            first_day_seer=self.rules.first_day_seer,
+        )
+        ids = self.player_ids if self.player_ids is not None else range(len(self.players))
+        players = [Player(name, role, id=player_id) for (name, role), player_id in zip(self.players, ids)]
+        game = Game(rules=rules, players=players)
+        game.start_game()
+        game.first_day_white_target_id = self.first_day_white_target_id
+        return game
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "version": RECORD_VERSION,
+            "players": [{"name": name, "role": role.value} for name, role in self.players],
+            "rules": {
+                "day_seconds": self.rules.day_seconds,
+                "night_seconds": self.rules.night_seconds,
+                "first_day_seer": self.rules.first_day_seer.value,
+            },
+            "player_ids": self.player_ids,
+            "first_day_white_target_id": self.first_day_white_target_id,
+            "commands": [command_to_dict(command) for command in self.commands],
+            "seed": self.seed,
+            "started_at": self.started_at,
+            "times": self.times,
+            "outcome": self.outcome.to_dict() if self.outcome is not None else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> GameRecord:
+        version = data.get("version", RECORD_VERSION)
+        if version != RECORD_VERSION:
+            raise ValueError(f"Unsupported record version: {version}")
+        rules = data.get("rules", {})
+        return cls(
+            players=[(entry["name"], Role(entry["role"])) for entry in data["players"]],
+            player_ids=[int(player_id) for player_id in data["player_ids"]] if data.get("player_ids") else None,
+            rules=GameRules(
+                day_seconds=rules.get("day_seconds", 180),
+                night_seconds=rules.get("night_seconds", 90),
+                first_day_seer=FirstDaySeerRule(rules.get("first_day_seer", FirstDaySeerRule.FREE_SELECT.value)),
+            ),
+            first_day_white_target_id=data.get("first_day_white_target_id"),
+            commands=[command_from_dict(entry) for entry in data.get("commands", [])],
+            seed=data.get("seed"),
+            started_at=data.get("started_at"),
+            times=list(data.get("times") or []),
+            outcome=GameOutcome.from_dict(data["outcome"]) if data.get("outcome") else None,
+        )
+
+
+def command_to_dict(command: Command) -> dict[str, Any]:
+    if isinstance(command, KillPlayer):
+        return {"type": "kill", "player": command.player_id, "reason": command.reason.value}
+    if isinstance(command, SetTarget):
+        return {"type": "target", "kind": command.kind.value, "player": command.player_id}
+    if isinstance(command, AdvancePhase):
+        return {"type": "advance"}
+    if isinstance(command, RevertPhase):
+        return {"type": "revert"}
+    raise ValueError(f"Unsupported command: {command!r}")
+
+
+def command_from_dict(data: dict[str, Any]) -> Command:
+    kind = data.get("type")
+    if kind == "kill":
+        return KillPlayer(int(data["player"]), DeathReason(data["reason"]))
+    if kind == "target":
+        return SetTarget(NightActionKind(data["kind"]), int(data["player"]))
+    if kind == "advance":
+        return AdvancePhase()
+    if kind == "revert":
+        return RevertPhase()
+    raise ValueError(f"Unknown command type: {kind!r}")
+
+
+def load_record(path: str | Path) -> GameRecord:
+    return GameRecord.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+def save_record(record: GameRecord, path: str | Path) -> None:
+    Path(path).write_text(json.dumps(record.to_dict(), ensure_ascii=False, indent=1), encoding="utf-8")
+
+
+def append_to_corpus(record: GameRecord, path: str | Path) -> None:
+    """Add ``record`` to a corpus file (JSON Lines, one record per line)."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("a", encoding="utf-8") as stream:
+        stream.write(json.dumps(record.to_dict(), ensure_ascii=False, separators=(",", ":")) + "\n")
+
+
+def append_to_env_corpus(record: GameRecord) -> Path | None:
+    """Add ``record`` to the corpus at ``$WEREWOLF_GM_CORPUS`` if it is set."""
+    path = os.environ.get(CORPUS_ENV)
+    if not path:
+        return None
+    append_to_corpus(record, path)
+    return Path(path)
+
+
+def load_corpus(path: str | Path) -> Iterator[GameRecord]:
+    with Path(path).open(encoding="utf-8") as stream:
+        for line in stream:
+            if line.strip():
+                yield GameRecord.from_dict(json.loads(line))
+
+
+def replay(record: GameRecord) -> Game:
+    """Re-run a record from the start and return the resulting game."""
+    game = record.new_game()
+    game.apply(record.commands)
+    return game
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+
+from werewolf_gm.domain import (
+    AdvancePhase,
+    Command,
+    DeathReason,
+    Game,
+    GamePhase,
+    GameRules,
+    KillPlayer,
+    NightActionKind,
+    Role,
+    SetTarget,
+    VictoryState,
+)
+from werewolf_gm.domain.targets import NIGHT_ACTION_PHASES
+
+from .replay import GameRecord
+
+NIGHT_ACTION_KINDS: dict[GamePhase, NightActionKind] = {phase: kind for kind, phase in NIGHT_ACTION_PHASES.items()}
+
+
+@dataclass(slots=True)
+class SimulationResult:
+    record: GameRecord
+    game: Game
+
+    @property
+    def victory_state(self) -> VictoryState:
+        return self.game.victory.state
+
+    @property
+    def days(self) -> int:
+        return self.game.day
+
+
+def default_roles(player_count: int) -> list[Role]:
+    """A standard village: about a quarter wolves, a seer, a knight (5+ seats),
+    a medium (6+) and a madman (8+); everyone else is a citizen."""
+    if player_count < 4:
+        raise ValueError("At least 4 players are required")
+    roles = [Role.WEREWOLF] * max(1, player_count // 4)
+    for role, min_players in ((Role.SEER, 4), (Role.KNIGHT, 5), (Role.MEDIUM, 6), (Role.MADMAN, 8)):
+        if player_count >= min_players:
+            roles.append(role)
+    roles.extend([Role.CITIZEN] * (player_count - len(roles)))
+    return roles
+
+
+def build_game(player_count: int, *, rng: random.Random, rules: GameRules | None = None) -> Game:
+    roles = default_roles(player_count)
+    rng.shuffle(roles)
+    game = Game(rules=rules or GameRules())
+    for idx, role in enumerate(roles, start=1):
+        game.add_player(f"P{idx}", role)
+    return game
+
+
+def choose_phase_commands(game: Game, rng: random.Random) -> list[Command]:
+    """Random legal commands for the current phase, ending with the phase advance."""
+    commands: list[Command] = []
+    candidates = game.target_candidates()
+    if game.phase is GamePhase.VOTING and candidates:
+        commands.append(KillPlayer(rng.choice(candidates.players).id, DeathReason.EXECUTED))
+    elif game.phase in NIGHT_ACTION_KINDS and candidates:
+        commands.append(SetTarget(NIGHT_ACTION_KINDS[game.phase], rng.choice(candidates.players).id))
+    commands.append(AdvancePhase())
+    return commands
+
+
+def simulate_game(
+    player_count: int = 9,
+    *,
+    seed: int | None = None,
+    max_days: int | None = None,
+    use_player_table: bool = False,
+) -> SimulationResult:
+    """Play one game with uniformly random legal choices.
+
+    Every day executes someone, so a game ends within ``player_count`` days; ``max_days``
+    can stop it earlier.
+    """
+    if max_days is None:
+        max_days = player_count
+    rng = random.Random(seed)
+    game = build_game(player_count, rng=rng)
+    if use_player_table:
+        game.use_player_table()
+    game.start_game()
+    record = GameRecord.from_game(game, seed=seed)
+
+    while game.phase is not GamePhase.FINISHED and game.day <= max_days:
+        commands = choose_phase_commands(game, rng)
+        game.apply(commands)
+        record.add(commands)
+    record.finish(game)
+    return SimulationResult(record=record, game=game)
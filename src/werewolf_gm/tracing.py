@@ -0,0 +1,134 @@
+"""Span tracer that writes Chrome trace event JSON (chrome://tracing, Perfetto, speedscope).
+
+Tracing is process-wide and off by default. ``enable()`` (or ``WEREWOLF_GM_TRACE=path``)
+installs a tracer; the domain's public mutators and the app's handlers, view builds,
+renders and page updates then record nested spans into a bounded buffer, so it can be
+left on for a whole game.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Any, Callable, TypeVar
+
+TRACE_ENV = "WEREWOLF_GM_TRACE"
+DEFAULT_MAX_EVENTS = 200_000
+
+_T = TypeVar("_T")
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "cat", "started_at")
+
+    def __init__(self, tracer: Tracer, name: str, cat: str) -> None:
+        self.tracer = tracer
+        self.name = name
+        self.cat = cat
+
+    def __enter__(self) -> _Span:
+        self.started_at = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        self.tracer.events.append(
+            (self.name, self.cat, self.started_at, time.perf_counter_ns(), threading.get_ident())
+        )
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def __enter__(self) -> _NoSpan:
+        return self
+
+    def __exit__(self, *_: object) -> None:
+        return None
+
+
+_NO_SPAN = _NoSpan()
+
+
+class Tracer:
+    """Records complete spans as ``(name, category, start_ns, end_ns, thread)`` tuples.
+
+    Only the newest ``max_events`` spans are kept. Spans are appended when they end,
+    so a parent follows its children; trace viewers nest them by time.
+    """
+
+    def __init__(self, *, max_events: int = DEFAULT_MAX_EVENTS) -> None:
+        self.started_at = time.perf_counter_ns()
+        self.events: deque[tuple[str, str, int, int, int]] = deque(maxlen=max_events)
+
+    def span(self, name: str, cat: str = "app") -> _Span:
+        return _Span(self, name, cat)
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        pid = os.getpid()
+        thread_ids: dict[int, int] = {}
+        trace_events: list[dict[str, Any]] = [
+            {"name": "process_name", "ph": "M", "pid": pid, "tid": 0, "args": {"name": "werewolf_gm"}}
+        ]
+        for name, cat, start_ns, end_ns, thread in self.events:
+            tid = thread_ids.setdefault(thread, len(thread_ids) + 1)
+            trace_events.append(
+                {
+                    "name": name,
+                    "cat": cat,
+                    "ph": "X",
+                    "ts": (start_ns - self.started_at) / 1000,
+                    "dur": (end_ns - start_ns) / 1000,
+                    "pid": pid,
+                    "tid": tid,
+                }
+            )
+        return {"traceEvents": trace_events, "displayTimeUnit": "ms"}
+
+    def write(self, path: str | Path) -> None:
+        Path(path).write_text(json.dumps(self.to_chrome_trace(), separators=(",", ":")), encoding="utf-8")
+
+
+ACTIVE: Tracer | None = None
+
+
+def enable(*, max_events: int = DEFAULT_MAX_EVENTS) -> Tracer:
+    global ACTIVE
+    if ACTIVE is None:
+        ACTIVE = Tracer(max_events=max_events)
+    return ACTIVE
+
+
+def disable() -> Tracer | None:
+    global ACTIVE
+    tracer, ACTIVE = ACTIVE, None
+    return tracer
+
+
+def enable_from_env() -> Tracer | None:
+    return enable() if os.environ.get(TRACE_ENV) else ACTIVE
+
+
+def write_to_env_path() -> Path | None:
+    """Write the active trace to ``$WEREWOLF_GM_TRACE`` if both are set."""
+    path = os.environ.get(TRACE_ENV)
+    if ACTIVE is None or not path:
+        return None
+    ACTIVE.write(path)
+    return Path(path)
+
+
+def span(name: str, cat: str = "app") -> _Span | _NoSpan:
+    tracer = ACTIVE
+    return _NO_SPAN if tracer is None else _Span(tracer, name, cat)
+
+
+def traced(name: str, cat: str, call: Callable[[], _T]) -> _T:
+    tracer = ACTIVE
+    if tracer is None:
+        return call()
+    with _Span(tracer, name, cat):
+        return call()
@@ -1,5 +1,24 @@
 """UI layer for Flet app."""
 
-from .app import WerewolfApp
+from __future__ import annotations
 
-__all__ = ["WerewolfApp"]
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .app import WerewolfApp
+    from .shell import AppShell
+
+__all__ = ["AppShell", "WerewolfApp"]
+
+
+def __getattr__(name: str) -> object:
+    # Flet is only imported once the app itself is requested.
+    if name == "WerewolfApp":
+        from .app import WerewolfApp
+
+        return WerewolfApp
+    if name == "AppShell":
+        from .shell import AppShell
+
+        return AppShell
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,50 +2,107 @@ from __future__ import annotations
 
 import asyncio
 import random
+from functools import partial, wraps
+from pathlib import Path
+from typing import Callable
 
 import flet as ft
 
-from werewolf_gm.domain import DeathReason, FirstDaySeerRule, GamePhase, Role
-
+from werewolf_gm import archive, ratings, replay, tracing
+from werewolf_gm.domain import (
+    AdvancePhase,
+    DeathReason,
+    FirstDaySeerRule,
+    GamePhase,
+    KillPlayer,
+    NightActionKind,
+    RevertPhase,
+    Role,
+    SetTarget,
+    VoteTally,
+)
+from werewolf_gm.domain.targets import NIGHT_ACTION_ROLES
+
+from .command_queue import CommandQueue
+from .components import VoteBoard
+from .home import build_home_view
+from .instrumentation import Instrumentation
 from .state import AppState
 from .tabs import GameTab, build_navigation_bar
-from .views import build_game_tab_content, build_home_view, build_reveal_view, build_setup_view
+from .views import build_game_tab_content, build_reveal_view, build_setup_view
+
+
+_RENDER_NONE = 0
+_RENDER_TIMER = 1
+_RENDER_VIEW = 2
+
+
+def _command(handler: Callable[..., None]) -> Callable[..., None]:
+    """Run a UI handler through the app's command queue instead of on the calling thread."""
+
+    @wraps(handler)
+    def wrapper(self: WerewolfApp, *args, **kwargs) -> None:
+        self._submit(handler.__name__, partial(handler, self, *args, **kwargs))
+
+    return wrapper
 
 
 class WerewolfApp:
-    def __init__(self, page: ft.Page) -> None:
+    def __init__(
+        self,
+        page: ft.Page,
+        *,
+        home_view: ft.View | None = None,
+        instrumentation: Instrumentation | None = None,
+        archive_dir: Path | None = None,
+    ) -> None:
         self.page = page
+        self.home_view = home_view
+        # Finished games are appended to the monthly archive here (None: not archived).
+        self.archive_dir = archive_dir
+        self._ratings: ratings.RatingIndex | None = None
+        # False when neither the saved index nor the archive could be read: show it, never save it.
+        self._ratings_synced = False
+        self.instrumentation = instrumentation or Instrumentation.from_env()
+        tracing.enable_from_env()
         self.state = AppState()
         self.confirm_dialog: ft.AlertDialog | None = None
         self._timer_loop_active = False
         self.timer_text_ref = ft.Ref[ft.Text]()
+        self.vote_board_ref = ft.Ref[VoteBoard]()
+        self._render_request = _RENDER_NONE
+        self.commands = CommandQueue(on_drained=self._flush_render)
+        self.timer_interval_seconds = 1.0
 
     def start(self) -> None:
-        self._configure_page()
         self.page.on_route_change = self._on_route_change
         self.page.views.clear()
         self.page.views.append(self._build_view_for_route("/"))
-        self.page.update()
-
-    def _configure_page(self) -> None:
-        self.page.title = "Werewolf GM Support"
-        self.page.window.width = 390
-        self.page.window.height = 844
-        self.page.window.resizable = False
-        self.page.padding = 0
-        self.page.theme_mode = ft.ThemeMode.LIGHT
+        self._update_page()
 
+    @_command
     def _on_route_change(self, _: ft.RouteChangeEvent) -> None:
         self.page.views.clear()
         self.page.views.append(self._build_view_for_route(self.page.route))
-        self.page.update()
+        self._update_page()
 
         if self.page.route == "/game":
             self._ensure_timer_loop()
 
     def _build_view_for_route(self, route: str) -> ft.View:
+        with tracing.span(f"build_view {route}", "view"):
+            if self.instrumentation is None:
+                return self._build_view(route)
+            view = self.instrumentation.timed(f"build_view {route}", partial(self._build_view, route))
+        self.instrumentation.record_view(route, view)
+        return view
+
+    def _build_view(self, route: str) -> ft.View:
         if route == "/":
-            return build_home_view(self.page)
+            # The home view never changes, so it is built once and reused.
+            if self.home_view is None:
+                self.home_view = build_home_view(lambda _: self.page.go("/setup"))
+            return self.home_view
         if route == "/setup":
             return build_setup_view(
                 self.page,
@@ -53,6 +110,7 @@ class WerewolfApp:
                 on_add_player=self._on_add_player,
                 on_remove_player=self._on_remove_player,
                 on_start_game=self._on_start_game,
+                ratings=self._rating_index(),
             )
         if route == "/game":
             return self._build_game_view()
@@ -63,14 +121,59 @@ class WerewolfApp:
             on_add_player=self._on_add_player,
             on_remove_player=self._on_remove_player,
             on_start_game=self._on_start_game,
+            ratings=self._rating_index(),
         )
 
+    def _queued(self, callback: Callable[[ft.ControlEvent], None]) -> Callable[[ft.ControlEvent], None]:
+        """Wrap a dialog callback so it runs as a queued command too."""
+
+        def submit(event: ft.ControlEvent) -> None:
+            self._submit(callback.__name__, partial(callback, event))
+
+        return submit
+
+    def _submit(self, name: str, command: Callable[[], None]) -> None:
+        if self.instrumentation is not None:
+            command = partial(self.instrumentation.run_command, name, command)
+        if tracing.ACTIVE is not None:
+            command = partial(tracing.traced, name, "timer" if name.startswith("timer_") else "handler", command)
+        self.commands.submit(name, command)
+
+    def _update_page(self, *controls: ft.Control) -> None:
+        with tracing.span("page.update", "update"):
+            if self.instrumentation is None:
+                self.page.update(*controls)
+                return
+            self.instrumentation.note_update()
+            self.instrumentation.timed("page.update", partial(self.page.update, *controls))
+
     def _refresh_current_view(self) -> None:
+        # Inside a command the render is deferred, so several commands share one update.
+        if self.commands.is_draining:
+            self._render_request = _RENDER_VIEW
+            return
+        if self.instrumentation is not None:
+            self.instrumentation.timed("refresh_current_view", self._render_view)
+            return
+        self._render_view()
+
+    def _flush_render(self) -> None:
+        request, self._render_request = self._render_request, _RENDER_NONE
+        if request == _RENDER_VIEW:
+            with tracing.span("render view", "render"):
+                self._render_view()
+        elif request == _RENDER_TIMER:
+            with tracing.span("render timer", "render"):
+                self._render_timer_text()
+        if self.instrumentation is not None:
+            self.instrumentation.finish_paint()
+
+    def _render_view(self) -> None:
         if not self.page.views:
             return
 
         self.page.views[-1] = self._build_view_for_route(self.page.route)
-        self.page.update()
+        self._update_page()
 
     def _build_game_view(self) -> ft.View:
         if self.state.reveal is not None:
@@ -101,6 +204,7 @@ class WerewolfApp:
                         content=build_game_tab_content(
                             self.state,
                             timer_text_ref=self.timer_text_ref,
+                            vote_board_ref=self.vote_board_ref,
                             on_decrease_timer=self._on_decrease_timer,
                             on_increase_timer=self._on_increase_timer,
                             on_toggle_timer=self._on_toggle_timer,
@@ -110,8 +214,14 @@ class WerewolfApp:
                             on_toggle_rpp_selection=self._on_toggle_rpp_selection,
                             on_execute_rpp=self._on_execute_rpp,
                             on_confirm_vote=self._on_confirm_vote,
+                            on_toggle_vote_tally=self._on_toggle_vote_tally,
+                            on_start_runoff=self._on_start_runoff,
+                            on_start_tie_rpp=self._on_start_tie_rpp,
+                            on_cast_vote=self._on_cast_vote,
                             on_confirm_night_action=self._on_confirm_night_action,
+                            on_submit_night_batch=self._on_submit_night_batch,
                             on_finish_game=self._on_finish_game,
+                            debug_report=self._debug_report(),
                         ),
                     )
                 )
@@ -122,6 +232,12 @@ class WerewolfApp:
             ),
         )
 
+    def _debug_report(self) -> str | None:
+        if self.instrumentation is None or self.state.selected_tab is not GameTab.LOG:
+            return None
+        return self.instrumentation.report()
+
+    @_command
     def _on_navigation_change(self, event: ft.ControlEvent) -> None:
         selected_index = int(event.control.selected_index)
         selected_tab = GameTab(selected_index)
@@ -134,6 +250,7 @@ class WerewolfApp:
 
         self._refresh_current_view()
 
+    @_command
     def _on_add_player(self, name: str, role: Role) -> None:
         if not name:
             self._show_message("プレイヤー名を入力してください")
@@ -148,7 +265,8 @@ class WerewolfApp:
         self.state.logs.append(f"セットアップ: 参加者追加 {name}（{role.value}）")
         self._refresh_current_view()
 
-    def _on_remove_player(self, player_id: str) -> None:
+    @_command
+    def _on_remove_player(self, player_id: int) -> None:
         try:
             player = self.state.game.get_player(player_id)
             self.state.game.remove_player(player_id)
@@ -159,6 +277,7 @@ class WerewolfApp:
         self.state.logs.append(f"セットアップ: 参加者削除 {player.name}（{player.role.value}）")
         self._refresh_current_view()
 
+    @_command
     def _on_start_game(
         self,
         day_seconds: int,
@@ -173,31 +292,44 @@ class WerewolfApp:
         self.state.setup_night_seconds = night_seconds
         self.state.setup_first_day_seer = first_day_seer
         self.state.apply_setup_rules_to_game()
+        self.state.prepare_game_backend()
         self.state.game.start_game()
+        self.state.begin_record()
         self.state.selected_tab = GameTab.PROGRESS
         self.state.last_morning_result = None
         self.state.reveal = None
         self.state.reset_rpp_mode()
+        self.state.vote_tally = None
         self.state.timer_running = True
         self.state.reset_timer_for_current_phase()
         self.page.go("/game")
 
-    def _execute_vote(self, player_id: str) -> None:
+    def _execute_vote(self, player_id: int) -> None:
         try:
             target = self.state.game.get_player(player_id)
             self.state.game.kill_player(player_id, DeathReason.EXECUTED)
         except ValueError as exc:
             self._show_message(str(exc))
             return
-
+        self.state.record_commands(KillPlayer(player_id, DeathReason.EXECUTED))
+
+        tally = self.state.vote_tally
+        if tally is not None and tally.result().winner_id == player_id:
+            counts = "、".join(
+                f"{self._player_name(candidate_id)} {tally.count(candidate_id)}票"
+                for candidate_id in tally.candidate_ids
+                if tally.count(candidate_id)
+            )
+            self._add_log(f"投票結果（{tally.round}回目）: {counts}")
         self._add_log(f"投票で {target.name} が処刑された")
         self.state.reset_rpp_mode()
         self._open_vote_result_dialog(target.name)
 
-    def _on_confirm_vote(self, player_id: str) -> None:
+    @_command
+    def _on_confirm_vote(self, player_id: int) -> None:
         try:
             target = self.state.game.get_player(player_id)
-            if not target.is_alive:
+            if not self.state.game.is_legal_target(player_id):
                 self._show_message("死亡済みのプレイヤーは処刑できません")
                 return
         except ValueError as exc:
@@ -216,8 +348,8 @@ class WerewolfApp:
             title=ft.Text("処刑の確認"),
             content=ft.Text(f"本当に {target.name} を処刑しますか？"),
             actions=[
-                ft.TextButton("いいえ", on_click=handle_cancel),
-                ft.FilledButton("はい", on_click=handle_confirm),
+                ft.TextButton("いいえ", on_click=self._queued(handle_cancel)),
+                ft.FilledButton("はい", on_click=self._queued(handle_confirm)),
             ],
             actions_alignment=ft.MainAxisAlignment.END,
         )
@@ -233,12 +365,57 @@ class WerewolfApp:
             title=ft.Text("処刑結果"),
             content=ft.Text(f"{target_name} が処刑されました。"),
             actions=[
-                ft.FilledButton("次へ（夜のターンへ）", on_click=handle_next),
+                ft.FilledButton("次へ（夜のターンへ）", on_click=self._queued(handle_next)),
             ],
             actions_alignment=ft.MainAxisAlignment.END,
         )
         self.page.show_dialog(self.confirm_dialog)
 
+    @_command
+    def _on_toggle_vote_tally(self, _: ft.ControlEvent) -> None:
+        if self.state.vote_tally is None:
+            self.state.vote_tally = VoteTally.for_game(self.state.game)
+        else:
+            self.state.vote_tally = None
+        self._refresh_current_view()
+
+    @_command
+    def _on_start_runoff(self, _: ft.ControlEvent) -> None:
+        tally = self.state.vote_tally
+        if tally is None:
+            return
+        try:
+            runoff = tally.runoff()
+        except ValueError as exc:
+            self._show_message(str(exc))
+            return
+
+        names = "、".join(self._player_name(player_id) for player_id in runoff.candidate_ids)
+        self._add_log(f"同票のため決選投票（{runoff.round}回目）: {names}")
+        self.state.vote_tally = runoff
+        self._refresh_current_view()
+
+    @_command
+    def _on_cast_vote(self, voter_id: int, target_id: int | None) -> None:
+        board = self.vote_board_ref.current
+        if board is None or board.tally is not self.state.vote_tally:
+            return
+        try:
+            board.cast(voter_id, target_id)
+        except ValueError as exc:
+            self._show_message(str(exc))
+
+    @_command
+    def _on_start_tie_rpp(self, _: ft.ControlEvent) -> None:
+        tally = self.state.vote_tally
+        if tally is None or not tally.result().is_tie:
+            return
+
+        self.state.is_rpp_mode = True
+        self.state.rpp_selected_ids = set(tally.result().leader_ids)
+        self._refresh_current_view()
+
+    @_command
     def _on_toggle_rpp(self, _: ft.ControlEvent) -> None:
         if self.state.is_rpp_mode:
             self.state.reset_rpp_mode()
@@ -247,16 +424,18 @@ class WerewolfApp:
             self.state.rpp_selected_ids.clear()
         self._refresh_current_view()
 
-    def _on_toggle_rpp_selection(self, player_id: str, is_checked: bool) -> None:
+    @_command
+    def _on_toggle_rpp_selection(self, player_id: int, is_checked: bool) -> None:
         if is_checked:
             self.state.rpp_selected_ids.add(player_id)
         else:
             self.state.rpp_selected_ids.discard(player_id)
         self._refresh_current_view()
 
+    @_command
     def _on_execute_rpp(self, _: ft.ControlEvent) -> None:
-        alive_ids = {player.id for player in self.state.game.alive_players()}
-        candidates = [player_id for player_id in self.state.rpp_selected_ids if player_id in alive_ids]
+        legal_ids = self.state.game.target_candidates().ids
+        candidates = [player_id for player_id in self.state.rpp_selected_ids if player_id in legal_ids]
         if not candidates:
             self._show_message("RPP候補を1名以上選択してください")
             return
@@ -287,20 +466,26 @@ class WerewolfApp:
             title=ft.Text("処刑の確認"),
             content=ft.Text(f"本当に「{quoted_names}」を処刑しますか？"),
             actions=[
-                ft.TextButton("いいえ", on_click=handle_cancel),
-                ft.FilledButton("はい", on_click=handle_confirm),
+                ft.TextButton("いいえ", on_click=self._queued(handle_cancel)),
+                ft.FilledButton("はい", on_click=self._queued(handle_confirm)),
             ],
             actions_alignment=ft.MainAxisAlignment.END,
         )
         self.page.show_dialog(self.confirm_dialog)
 
-    def _on_confirm_night_action(self, player_id: str) -> None:
+    @_command
+    def _on_confirm_night_action(self, player_id: int) -> None:
         phase = self.state.game.phase
 
         try:
             target = self.state.game.get_player(player_id)
+            if phase in NIGHT_ACTION_ROLES and not self.state.game.is_legal_target(player_id):
+                self._show_message(self._illegal_night_target_message(phase))
+                return
+
             if phase is GamePhase.NIGHT_SEER:
                 self.state.game.set_seer_target(player_id)
+                self.state.record_commands(SetTarget(NightActionKind.SEER, player_id))
                 self._add_log(
                     f"占い師が {target.name} を占い、"
                     f"{'人狼である' if target.is_werewolf else '人狼ではない'} と判定"
@@ -315,15 +500,8 @@ class WerewolfApp:
                 return
 
             if phase is GamePhase.NIGHT_MEDIUM:
-                executed_player = self.state.game.get_executed_player_on_day(self.state.game.day)
-                if executed_player is None:
-                    self._show_message("本日の処刑者はいません")
-                    return
-                if executed_player.id != player_id:
-                    self._show_message("霊媒師は本日の処刑者のみ対象にできます")
-                    return
-
                 self.state.game.set_medium_target(player_id)
+                self.state.record_commands(SetTarget(NightActionKind.MEDIUM, player_id))
                 self._add_log(
                     f"霊媒師が {target.name} を霊媒し、"
                     f"{'人狼である' if target.is_werewolf else '人狼ではない'} と判定"
@@ -339,9 +517,11 @@ class WerewolfApp:
 
             if phase is GamePhase.NIGHT_KNIGHT:
                 self.state.game.set_guard_target(player_id)
+                self.state.record_commands(SetTarget(NightActionKind.GUARD, player_id))
                 self._add_log(f"騎士が {target.name} を護衛対象に設定")
             elif phase is GamePhase.NIGHT_WEREWOLF:
                 self.state.game.set_attack_target(player_id)
+                self.state.record_commands(SetTarget(NightActionKind.ATTACK, player_id))
                 self._add_log(f"人狼が {target.name} を襲撃対象に設定")
             else:
                 self._show_message("現在は夜の行動フェーズではありません")
@@ -352,6 +532,70 @@ class WerewolfApp:
 
         self._advance_phase()
 
+    @_command
+    def _on_submit_night_batch(self, targets: dict[NightActionKind, int | None]) -> None:
+        game = self.state.game
+        night_day = game.day
+
+        try:
+            commands = game.night_batch_commands(targets)
+            game.apply(commands)
+        except ValueError as exc:
+            self._show_message(str(exc))
+            return
+        self.state.record_commands(*commands)
+
+        # The whole night is resolved at once, so logs are written in one batch and the
+        # view is rebuilt a single time instead of once per night phase.
+        logs: list[str] = []
+        results: list[str] = []
+        for divination in game.divinations:
+            if divination.day != night_day:
+                continue
+            is_seer = divination.role is Role.SEER
+            phase = GamePhase.NIGHT_SEER if is_seer else GamePhase.NIGHT_MEDIUM
+            target_name = self._player_name(divination.target_id)
+            verdict = "人狼である" if divination.is_werewolf else "人狼ではない"
+            role_label = "占い師" if is_seer else "霊媒師"
+            action = "占い" if is_seer else "霊媒し"
+            logs.append(self._format_log(night_day, phase, f"{role_label}が {target_name} を{action}、{verdict} と判定"))
+            results.append(f"{role_label}: {target_name} は{verdict}")
+
+        self.state.reset_rpp_mode()
+        self.state.last_morning_result = self._build_morning_result_message()
+        logs.extend(
+            self._format_log(game.day, game.phase, message) for message in self._night_resolution_messages()
+        )
+        logs.append(self._format_log(game.day, game.phase, f"フェーズ移行 -> {self._phase_label_for_log(game.phase)}"))
+        self.state.logs.extend(logs)
+
+        self._sync_timer_with_phase()
+        self._refresh_current_view()
+        self._ensure_timer_loop()
+        if results:
+            self._open_night_batch_result_dialog(results)
+
+    def _open_night_batch_result_dialog(self, results: list[str]) -> None:
+        self.confirm_dialog = ft.AlertDialog(
+            modal=True,
+            title=ft.Text("夜の判定結果"),
+            content=ft.Column(tight=True, controls=[ft.Text(result, size=18) for result in results]),
+            actions=[ft.FilledButton("確認", on_click=self._queued(self._close_night_batch_result_dialog))],
+            actions_alignment=ft.MainAxisAlignment.END,
+        )
+        self.page.show_dialog(self.confirm_dialog)
+
+    def _close_night_batch_result_dialog(self, _: ft.ControlEvent) -> None:
+        self._close_active_dialog()
+
+    def _illegal_night_target_message(self, phase: GamePhase) -> str:
+        if phase is GamePhase.NIGHT_MEDIUM:
+            if not self.state.game.target_candidates():
+                return "本日の処刑者はいません"
+            return "霊媒師は本日の処刑者のみ対象にできます"
+        return "選択したプレイヤーは行動対象にできません"
+
+    @_command
     def _on_close_reveal(self, _: ft.ControlEvent) -> None:
         if self.state.reveal is None:
             return
@@ -367,16 +611,19 @@ class WerewolfApp:
         self._refresh_current_view()
         self._ensure_timer_loop()
 
+    @_command
     def _on_decrease_timer(self, _: ft.ControlEvent) -> None:
         self.state.adjust_timer(-30)
         if self.state.timer_seconds == 0:
             self.state.timer_running = False
         self._refresh_current_view()
 
+    @_command
     def _on_increase_timer(self, _: ft.ControlEvent) -> None:
         self.state.adjust_timer(30)
         self._refresh_current_view()
 
+    @_command
     def _on_toggle_timer(self, _: ft.ControlEvent) -> None:
         if not self.state.timer_running and self.state.timer_seconds == 0:
             self.state.reset_timer_for_current_phase()
@@ -387,12 +634,15 @@ class WerewolfApp:
         if self.state.timer_running:
             self._ensure_timer_loop()
 
+    @_command
     def _on_next_phase(self, _: ft.ControlEvent) -> None:
         self._advance_phase()
 
+    @_command
     def _on_previous_phase(self, _: ft.ControlEvent) -> None:
         if not self.state.game.revert_to_previous_night_phase():
             return
+        self.state.record_commands(RevertPhase())
 
         self._add_log("GMが1つ前の行動に戻りました")
         self._sync_timer_with_phase()
@@ -405,7 +655,9 @@ class WerewolfApp:
 
         self.state.last_morning_result = None
         self.state.game.proceed_to_next_phase()
+        self.state.record_commands(AdvancePhase())
         self.state.reset_rpp_mode()
+        self.state.vote_tally = None
 
         if previous_phase is GamePhase.NIGHT_WEREWOLF:
             self.state.last_morning_result = self._build_morning_result_message()
@@ -419,6 +671,10 @@ class WerewolfApp:
         self._ensure_timer_loop()
 
     def _log_night_resolution(self) -> None:
+        for message in self._night_resolution_messages():
+            self._add_log(message)
+
+    def _night_resolution_messages(self) -> list[str]:
         guard_id = self.state.game.last_guard_target_id
         attack_id = self.state.game.last_attack_target_id
         victim_id = self.state.game.last_night_victim_id
@@ -426,25 +682,30 @@ class WerewolfApp:
         guard_name = self._player_name(guard_id)
         attack_name = self._player_name(attack_id)
 
-        if guard_id:
-            self._add_log(f"夜行動: 騎士の護衛先は {guard_name}")
-        if attack_id:
-            self._add_log(f"夜行動: 人狼の襲撃先は {attack_name}")
+        messages: list[str] = []
+        if guard_id is not None:
+            messages.append(f"夜行動: 騎士の護衛先は {guard_name}")
+        if attack_id is not None:
+            messages.append(f"夜行動: 人狼の襲撃先は {attack_name}")
 
-        if victim_id:
-            self._add_log(f"夜明け: {self._player_name(victim_id)} が襲撃で死亡")
-        elif attack_id and attack_id == guard_id:
-            self._add_log(f"夜明け: {attack_name} は護衛により生存")
+        if victim_id is not None:
+            messages.append(f"夜明け: {self._player_name(victim_id)} が襲撃で死亡")
+        elif attack_id is not None and attack_id == guard_id:
+            messages.append(f"夜明け: {attack_name} は護衛により生存")
         else:
-            self._add_log("夜明け: 襲撃による犠牲者なし")
+            messages.append("夜明け: 襲撃による犠牲者なし")
+        return messages
 
     def _build_morning_result_message(self) -> str:
         victim_id = self.state.game.last_night_victim_id
-        if victim_id:
+        if victim_id is not None:
             return f"昨晩の犠牲者: {self._player_name(victim_id)}"
         return "昨晩の犠牲者はいません"
 
+    @_command
     def _on_finish_game(self, _: ft.ControlEvent) -> None:
+        self._dump_diagnostics()
+        self._store_game()
         self.state.reset_game()
         self.page.go("/setup")
 
@@ -467,31 +728,73 @@ class WerewolfApp:
         )
         self.page.show_dialog(self.confirm_dialog)
 
+    @_command
     def _cancel_abort(self, _: ft.ControlEvent) -> None:
         self._close_active_dialog()
         self._refresh_current_view()
 
+    @_command
     def _confirm_abort(self, _: ft.ControlEvent) -> None:
+        self._dump_diagnostics()
+        self._store_game()
         self.state.reset_game()
         self._close_active_dialog()
         self.page.go("/setup")
 
+    def _dump_diagnostics(self) -> None:
+        if self.instrumentation is not None:
+            self.instrumentation.log()
+        tracing.write_to_env_path()
+
+    def _store_game(self) -> None:
+        game = self.state.game
+        record = self.state.record
+        try:
+            if record is not None:
+                record.finish(game)
+                replay.append_to_env_corpus(record)
+            if self.archive_dir is not None and game.phase is GamePhase.FINISHED:
+                archived = archive.ArchivedGame.of(game)
+                index = self._rating_index()
+                archive.write_games(archive.archive_path(self.archive_dir, archived.finished_at), [archived])
+                if index is not None and self._ratings_synced:
+                    ratings.add_archived_game(index, self.archive_dir, archived)
+        except (OSError, ValueError, OverflowError) as exc:
+            # A corrupt archive or index must not keep the GM on the finish dialog.
+            self._show_message(f"対戦記録を保存できませんでした: {exc}")
+
+    def _rating_index(self) -> ratings.RatingIndex | None:
+        """Player profiles for the setup view, read once and then updated per archived game."""
+        if self._ratings is None and self.archive_dir is not None:
+            self._ratings_synced = True
+            try:
+                self._ratings = ratings.refresh_index(self.archive_dir)
+            except (OSError, ValueError):
+                # An unreadable index is recounted from the archive.
+                try:
+                    self._ratings = ratings.rebuild_index(self.archive_dir)
+                except (OSError, ValueError):
+                    self._ratings = ratings.RatingIndex()
+                    self._ratings_synced = False
+        return self._ratings
+
     def _close_active_dialog(self) -> None:
         dialog = self.page.pop_dialog()
         if dialog is not None:
             dialog.open = False
         self.confirm_dialog = None
-        self.page.update()
+        self._update_page()
 
     def _show_message(self, message: str) -> None:
         self.page.snack_bar = ft.SnackBar(ft.Text(message))
         self.page.snack_bar.open = True
-        self.page.update()
+        self._update_page()
 
     def _add_log(self, message: str) -> None:
-        day = self.state.game.day
-        phase = self._phase_label_for_log(self.state.game.phase)
-        self.state.logs.append(f"{day}日目 {phase}: {message}")
+        self.state.logs.append(self._format_log(self.state.game.day, self.state.game.phase, message))
+
+    def _format_log(self, day: int, phase: GamePhase, message: str) -> str:
+        return f"{day}日目 {self._phase_label_for_log(phase)}: {message}"
 
     def _phase_label_for_log(self, phase: GamePhase) -> str:
         labels = {
@@ -506,8 +809,8 @@ class WerewolfApp:
         }
         return labels[phase]
 
-    def _player_name(self, player_id: str | None) -> str:
-        if not player_id:
+    def _player_name(self, player_id: int | None) -> str:
+        if player_id is None:
             return "なし"
         try:
             return self.state.game.get_player(player_id).name
@@ -523,30 +826,41 @@ class WerewolfApp:
             return
         if self.state.reveal is not None:
             return
+        self._timer_loop_active = True
         self.page.run_task(self._timer_loop)
 
     async def _timer_loop(self) -> None:
-        self._timer_loop_active = True
+        # The loop only keeps time; every state change it causes is a queued command.
         try:
             while self.state.timer_running and self.state.timer_seconds > 0:
-                await asyncio.sleep(1)
-                if not self.state.timer_running:
-                    break
+                await asyncio.sleep(self.timer_interval_seconds)
+                self._submit("timer_tick", self._tick_timer)
+        finally:
+            self._submit("timer_stopped", self._on_timer_loop_stopped)
 
-                self.state.timer_seconds = max(0, self.state.timer_seconds - 1)
-                self._update_timer_text_only()
+    def _tick_timer(self) -> None:
+        if not self.state.timer_running or self.state.timer_seconds <= 0:
+            return
 
-            if self.state.timer_seconds == 0:
-                self.state.timer_running = False
-                self._add_log("タイマー終了")
-                if self.page.route == "/game":
-                    self._refresh_current_view()
-        finally:
-            self._timer_loop_active = False
-            if self.state.timer_running and self.state.timer_seconds > 0:
-                self._ensure_timer_loop()
+        self.state.timer_seconds = max(0, self.state.timer_seconds - 1)
+        self._update_timer_text_only()
+        if self.state.timer_seconds == 0:
+            self.state.timer_running = False
+            self._add_log("タイマー終了")
+            if self.page.route == "/game":
+                self._refresh_current_view()
+
+    def _on_timer_loop_stopped(self) -> None:
+        self._timer_loop_active = False
+        self._ensure_timer_loop()
 
     def _update_timer_text_only(self) -> None:
+        if self.commands.is_draining:
+            self._render_request = max(self._render_request, _RENDER_TIMER)
+            return
+        self._render_timer_text()
+
+    def _render_timer_text(self) -> None:
         if self.timer_text_ref.current is None:
             return
         if self.page.route != "/game":
@@ -557,4 +871,4 @@ class WerewolfApp:
             return
 
         self.timer_text_ref.current.value = self.state.format_timer()
-        self.timer_text_ref.current.update()
+        self._update_page(self.timer_text_ref.current)
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(slots=True)
+class CommandStats:
+    count: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+    total_wait_seconds: float = 0.0
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.count if self.count else 0.0
+
+    def record(self, *, seconds: float, wait_seconds: float) -> None:
+        self.count += 1
+        self.total_seconds += seconds
+        self.total_wait_seconds += wait_seconds
+        if seconds > self.max_seconds:
+            self.max_seconds = seconds
+
+
+class CommandQueue:
+    """Single-writer queue (actor style) for app state mutations.
+
+    Click handlers run on worker threads and the timer runs on the event loop, so every
+    mutation is submitted here instead of touching ``AppState`` directly. Commands run
+    one at a time in submission order: whichever caller finds the queue idle drains it,
+    and later callers only enqueue. ``on_drained`` runs once after the queue empties,
+    which is where renders requested by the drained commands are merged into one.
+    """
+
+    def __init__(
+        self,
+        *,
+        on_drained: Callable[[], None] | None = None,
+        clock: Callable[[], float] = time.perf_counter,
+    ) -> None:
+        self.on_drained = on_drained
+        self.clock = clock
+        self.stats: dict[str, CommandStats] = {}
+        self._pending: deque[tuple[str, Callable[[], None], float]] = deque()
+        self._lock = threading.Lock()
+        self._drainer: int | None = None
+
+    @property
+    def is_draining(self) -> bool:
+        """True only inside a command (on the draining thread)."""
+        return self._drainer == threading.get_ident()
+
+    def submit(self, name: str, command: Callable[[], None]) -> None:
+        with self._lock:
+            self._pending.append((name, command, self.clock()))
+            if self._drainer is not None:
+                return
+            self._drainer = threading.get_ident()
+        self._drain()
+
+    def _drain(self) -> None:
+        while True:
+            with self._lock:
+                if not self._pending:
+                    self._drainer = None
+                    return
+                name, command, submitted_at = self._pending.popleft()
+            self._run(name, command, submitted_at)
+            with self._lock:
+                if self._pending:
+                    continue
+            if self.on_drained is not None:
+                try:
+                    self.on_drained()
+                except Exception:
+                    logger.exception("Render after commands failed")
+
+    def _run(self, name: str, command: Callable[[], None], submitted_at: float) -> None:
+        started_at = self.clock()
+        try:
+            command()
+        except Exception:
+            logger.exception("Command failed: %s", name)
+        finally:
+            finished_at = self.clock()
+            stats = self.stats.get(name)
+            if stats is None:
+                stats = self.stats[name] = CommandStats()
+            stats.record(seconds=finished_at - started_at, wait_seconds=started_at - submitted_at)
@@ -1,5 +1,7 @@
 """Reusable UI components."""
 
+from .player_picker import PlayerNameIndex, PlayerPicker, update_if_mounted
 from .timer import build_timer_panel
+from .vote_board import VoteBoard
 
-__all__ = ["build_timer_panel"]
+__all__ = ["PlayerNameIndex", "PlayerPicker", "VoteBoard", "build_timer_panel", "update_if_mounted"]
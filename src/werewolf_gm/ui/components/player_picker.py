@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from functools import lru_cache
+from typing import Iterable, Sequence
+
+import flet as ft
+
+MAX_PICKER_RESULTS = 8
+
+
+class PlayerNameIndex:
+    """Case-insensitive prefix index over player names (sorted list + bisect)."""
+
+    __slots__ = ("_keys", "_entries")
+
+    def __init__(self, entries: Iterable[tuple[int, str]]) -> None:
+        ordered = sorted((name.casefold(), player_id, name) for player_id, name in entries)
+        self._keys = [key for key, _, _ in ordered]
+        self._entries = [(player_id, name) for _, player_id, name in ordered]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def search(self, prefix: str, limit: int) -> tuple[list[tuple[int, str]], int]:
+        """Return up to ``limit`` matches in name order and the total number of matches."""
+        key = prefix.strip().casefold()
+        start = bisect_left(self._keys, key)
+        end = bisect_left(self._keys, key + "\U0010ffff", lo=start)
+        return self._entries[start : min(end, start + limit)], end - start
+
+
+@lru_cache(maxsize=16)
+def build_name_index(entries: tuple[tuple[int, str], ...]) -> PlayerNameIndex:
+    return PlayerNameIndex(entries)
+
+
+class PlayerPicker:
+    """Type-ahead player selector that only re-renders its result list while typing."""
+
+    def __init__(
+        self,
+        *,
+        label: str,
+        candidates: Sequence[tuple[int, str]],
+        selected_id: int | None = None,
+        max_results: int = MAX_PICKER_RESULTS,
+        width: int = 340,
+    ) -> None:
+        self.index = build_name_index(tuple(candidates))
+        self._names = dict(candidates)
+        self.max_results = max_results
+        self.selected_id = selected_id
+        self._query = ""
+        self._query_field = ft.TextField(
+            label=label,
+            hint_text="名前の先頭を入力して絞り込み",
+            width=width,
+            on_change=self._handle_query_change,
+        )
+        self._results = ft.Column(spacing=0, controls=self._build_results())
+        self.control = ft.Column(width=width, spacing=4, controls=[self._query_field, self._results])
+
+    def filter(self, query: str) -> None:
+        self._query = query
+        matches, total = self.index.search(query, 1)
+        if total == 1:
+            self.selected_id = matches[0][0]
+        self._results.controls = self._build_results()
+        update_if_mounted(self._results)
+
+    def _handle_query_change(self, event: ft.ControlEvent) -> None:
+        self.filter(event.control.value or "")
+
+    def _select(self, player_id: int) -> None:
+        self.selected_id = player_id
+        self._results.controls = self._build_results()
+        update_if_mounted(self._results)
+
+    def _build_results(self) -> list[ft.Control]:
+        matches, total = self.index.search(self._query, self.max_results)
+        selected_name = self._names.get(self.selected_id) if self.selected_id is not None else None
+        controls: list[ft.Control] = [
+            ft.Text(f"選択中: {selected_name or 'なし'}", weight=ft.FontWeight.W_600),
+        ]
+        if not matches:
+            controls.append(ft.Text("該当するプレイヤーがいません", color=ft.Colors.GREY_600))
+            return controls
+
+        for player_id, name in matches:
+            is_selected = player_id == self.selected_id
+
+            def handle_click(_: ft.ControlEvent, player_id: int = player_id) -> None:
+                self._select(player_id)
+
+            controls.append(
+                ft.ListTile(
+                    dense=True,
+                    title=ft.Text(name, weight=ft.FontWeight.W_600 if is_selected else None),
+                    leading=ft.Icon(ft.Icons.CHECK if is_selected else ft.Icons.PERSON_OUTLINE),
+                    selected=is_selected,
+                    on_click=handle_click,
+                )
+            )
+        if total > len(matches):
+            controls.append(
+                ft.Text(f"ほか {total - len(matches)} 人（入力して絞り込み）", color=ft.Colors.BLUE_GREY_500)
+            )
+        return controls
+
+
+def update_if_mounted(control: ft.Control) -> None:
+    try:
+        control.update()
+    except RuntimeError:
+        # Not attached to a page yet; the next full render picks the new controls up.
+        pass
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from typing import Callable, Sequence
+
+import flet as ft
+
+from werewolf_gm.domain import Player, VoteTally
+
+from .player_picker import update_if_mounted
+
+
+class VoteBoard:
+    """Per-voter ballot rows plus a live count per candidate.
+
+    A ballot change is reported through ``on_cast``; the owner applies it with
+    :meth:`cast`, which touches only the count rows of the old and new target and
+    the leader line, leaving the rest of the view as is.
+    """
+
+    def __init__(
+        self,
+        *,
+        tally: VoteTally,
+        voters: Sequence[Player],
+        candidates: Sequence[Player],
+        external_id: Callable[[int], str],
+        on_cast: Callable[[int, int | None], None],
+        on_result_change: Callable[[], None] | None = None,
+        width: int = 340,
+    ) -> None:
+        self.tally = tally
+        self.on_result_change = on_result_change
+        self._names = {player.id: player.name for player in (*voters, *candidates)}
+        self._by_external_id = {external_id(player.id): player.id for player in candidates}
+        self._count_texts: dict[int, ft.Text] = {}
+        self._leader_text = ft.Text(self._leader_label(), weight=ft.FontWeight.W_600)
+
+        count_rows: list[ft.Control] = []
+        for player in candidates:
+            count_text = ft.Text(self._count_label(player.id), width=48, text_align=ft.TextAlign.RIGHT)
+            self._count_texts[player.id] = count_text
+            count_rows.append(
+                ft.Row(
+                    alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
+                    controls=[ft.Text(player.name, expand=True), count_text],
+                )
+            )
+
+        ballot_rows: list[ft.Control] = []
+        for voter in voters:
+            dropdown = ft.Dropdown(
+                label=f"{voter.name} の投票先",
+                width=width,
+                dense=True,
+                value=external_id(tally.votes[voter.id]) if voter.id in tally.votes else None,
+                options=[
+                    ft.dropdown.Option(key=external_id(player.id), text=player.name)
+                    for player in candidates
+                    if player.id != voter.id
+                ],
+            )
+
+            def handle_select(event: ft.ControlEvent, voter_id: int = voter.id) -> None:
+                on_cast(voter_id, self._by_external_id.get(event.control.value or ""))
+
+            dropdown.on_select = handle_select
+            ballot_rows.append(dropdown)
+
+        self.control = ft.Column(
+            width=width,
+            spacing=8,
+            controls=[
+                ft.Text(f"投票 {tally.round} 回目", size=16, weight=ft.FontWeight.W_600),
+                self._leader_text,
+                ft.Column(spacing=2, controls=count_rows),
+                ft.Column(spacing=6, controls=ballot_rows),
+            ],
+        )
+
+    def cast(self, voter_id: int, target_id: int | None) -> None:
+        previous_result = self.tally.result()
+        for changed_id in self.tally.cast(voter_id, target_id):
+            count_text = self._count_texts[changed_id]
+            count_text.value = self._count_label(changed_id)
+            update_if_mounted(count_text)
+
+        self._leader_text.value = self._leader_label()
+        update_if_mounted(self._leader_text)
+        if self.on_result_change is not None and self.tally.result() != previous_result:
+            self.on_result_change()
+
+    def _count_label(self, player_id: int) -> str:
+        return f"{self.tally.count(player_id)} 票"
+
+    def _leader_label(self) -> str:
+        result = self.tally.result()
+        pending = len(self.tally.voter_ids) - len(self.tally)
+        if not result.top_count:
+            return f"最多得票: なし（未投票 {pending} 人）"
+        names = "、".join(self._names[player_id] for player_id in result.leader_ids)
+        return f"最多得票: {names}（{result.top_count} 票・未投票 {pending} 人）"
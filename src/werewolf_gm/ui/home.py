@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from typing import Callable
+
+import flet as ft
+
+
+def build_home_view(on_open_setup: Callable[[ft.ControlEvent], None]) -> ft.View:
+    return ft.View(
+        route="/",
+        controls=[
+            ft.SafeArea(
+                ft.Container(
+                    expand=True,
+                    padding=20,
+                    alignment=ft.Alignment(0, 0),
+                    content=ft.Column(
+                        horizontal_alignment=ft.CrossAxisAlignment.CENTER,
+                        alignment=ft.MainAxisAlignment.CENTER,
+                        controls=[
+                            ft.Text("人狼GMサポート", size=28, weight=ft.FontWeight.BOLD),
+                            ft.Text("ホーム画面です", size=16),
+                            ft.FilledButton("セットアップへ", on_click=on_open_setup),
+                        ],
+                    ),
+                )
+            )
+        ],
+    )
@@ -0,0 +1,189 @@
+from __future__ import annotations
+
+import dataclasses
+import logging
+import os
+import time
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Callable
+
+import flet as ft
+
+logger = logging.getLogger(__name__)
+
+INSTRUMENT_ENV = "WEREWOLF_GM_INSTRUMENT"
+
+MS_BOUNDS = (0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0)
+COUNT_BOUNDS = (0, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000)
+
+
+@dataclass(slots=True)
+class Histogram:
+    """Fixed-bucket histogram; bucket ``i`` holds values up to ``bounds[i]``, the last one the rest."""
+
+    bounds: tuple[float, ...]
+    buckets: list[int] = field(default_factory=list)
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not self.buckets:
+            self.buckets = [0] * (len(self.bounds) + 1)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def record(self, value: float) -> None:
+        self.buckets[bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+
+    def percentile(self, percent: float) -> float:
+        """Upper bound of the bucket holding the given percentile (capped at the max seen)."""
+        if not self.count:
+            return 0.0
+        rank = percent / 100 * self.count
+        seen = 0
+        for idx, bucket in enumerate(self.buckets):
+            seen += bucket
+            if seen >= rank and bucket:
+                return min(self.bounds[idx], self.max) if idx < len(self.bounds) else self.max
+        return self.max
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean": round(self.mean, 3),
+            "max": round(self.max, 3),
+            "buckets": {
+                (str(bound) if idx < len(self.bounds) else "inf"): bucket
+                for idx, (bound, bucket) in enumerate(zip((*self.bounds, None), self.buckets))
+                if bucket
+            },
+        }
+
+
+@lru_cache(maxsize=None)
+def _child_field_names(control_type: type) -> tuple[str, ...]:
+    return tuple(
+        item.name
+        for item in dataclasses.fields(control_type)
+        if not item.name.startswith(("_", "on_"))
+    )
+
+
+def count_controls(root: ft.BaseControl) -> int:
+    count = 0
+    stack = [root]
+    while stack:
+        control = stack.pop()
+        count += 1
+        for name in _child_field_names(type(control)):
+            value = getattr(control, name, None)
+            if isinstance(value, ft.BaseControl):
+                stack.append(value)
+            elif isinstance(value, list):
+                stack.extend(item for item in value if isinstance(item, ft.BaseControl))
+    return count
+
+
+class Instrumentation:
+    """Opt-in timing of app handlers, view builds and page updates (``WEREWOLF_GM_INSTRUMENT=1``).
+
+    Each queued command is timed as ``handler <name>``. When the render that follows it
+    is flushed, the time from the command's start to the end of that render is recorded
+    as ``paint <name>``, along with the page updates it took. If several commands were
+    drained together, the render is attributed to the last one.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self.clock = clock
+        self.timings: dict[str, Histogram] = {}
+        self.counts: dict[str, Histogram] = {}
+        self._command: str | None = None
+        self._command_started_at = 0.0
+        self._updates = 0
+        self._overhead = 0.0
+
+    @classmethod
+    def from_env(cls) -> Instrumentation | None:
+        return cls() if os.environ.get(INSTRUMENT_ENV) else None
+
+    def record_time(self, name: str, seconds: float) -> None:
+        histogram = self.timings.get(name)
+        if histogram is None:
+            histogram = self.timings[name] = Histogram(MS_BOUNDS)
+        histogram.record(seconds * 1000)
+
+    def record_count(self, name: str, value: int) -> None:
+        histogram = self.counts.get(name)
+        if histogram is None:
+            histogram = self.counts[name] = Histogram(COUNT_BOUNDS)
+        histogram.record(value)
+
+    def run_command(self, name: str, command: Callable[[], None]) -> None:
+        if self._command is None:
+            self._command_started_at = self.clock()
+            self._updates = 0
+            self._overhead = 0.0
+        self._command = name
+        started_at = self.clock()
+        overhead = self._overhead
+        try:
+            command()
+        finally:
+            self.record_time(f"handler {name}", self.clock() - started_at - (self._overhead - overhead))
+
+    def timed(self, name: str, call: Callable[[], Any]) -> Any:
+        started_at = self.clock()
+        try:
+            return call()
+        finally:
+            self.record_time(name, self.clock() - started_at)
+
+    def record_view(self, route: str, view: ft.View) -> None:
+        started_at = self.clock()
+        self.record_count(f"controls {route}", count_controls(view))
+        self._overhead += self.clock() - started_at
+
+    def note_update(self) -> None:
+        self._updates += 1
+
+    def finish_paint(self) -> None:
+        if self._command is None:
+            return
+        self.record_time(f"paint {self._command}", self.clock() - self._command_started_at - self._overhead)
+        self.record_count(f"updates {self._command}", self._updates)
+        self._command = None
+
+    def report(self) -> str:
+        lines = [f"{'timing (ms)':<40}{'n':>6}{'mean':>9}{'p50':>9}{'p99':>9}{'max':>9}"]
+        for name, histogram in sorted(self.timings.items()):
+            lines.append(
+                f"{name:<40}{histogram.count:>6}{histogram.mean:>9.2f}{histogram.percentile(50):>9.2f}"
+                f"{histogram.percentile(99):>9.2f}{histogram.max:>9.2f}"
+            )
+        lines.append(f"{'count':<40}{'n':>6}{'mean':>9}{'p50':>9}{'p99':>9}{'max':>9}")
+        for name, histogram in sorted(self.counts.items()):
+            lines.append(
+                f"{name:<40}{histogram.count:>6}{histogram.mean:>9.1f}{histogram.percentile(50):>9.0f}"
+                f"{histogram.percentile(99):>9.0f}{histogram.max:>9.0f}"
+            )
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "timings_ms": {name: histogram.to_dict() for name, histogram in sorted(self.timings.items())},
+            "counts": {name: histogram.to_dict() for name, histogram in sorted(self.counts.items())},
+        }
+
+    def log(self) -> None:
+        logger.info("UI instrumentation\n%s", self.report())
+        if os.environ.get(INSTRUMENT_ENV):
+            print(self.report(), flush=True)
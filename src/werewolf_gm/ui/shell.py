@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import flet as ft
+
+from .home import build_home_view
+from .startup import STARTUP, StartupTimer
+
+if TYPE_CHECKING:
+    from .app import WerewolfApp
+
+
+def configure_page(page: ft.Page) -> None:
+    page.title = "Werewolf GM Support"
+    page.window.width = 390
+    page.window.height = 844
+    page.window.resizable = False
+    page.padding = 0
+    page.theme_mode = ft.ThemeMode.LIGHT
+
+
+class AppShell:
+    """Shows the cached home view right away and loads the rest of the app on first navigation.
+
+    Only Flet and this module are needed for the first frame; ``WerewolfApp`` (and with it
+    the domain, state and view modules) is imported when the user leaves the home screen.
+    """
+
+    def __init__(self, page: ft.Page, *, timer: StartupTimer = STARTUP) -> None:
+        self.page = page
+        self.timer = timer
+        self.home_view = build_home_view(lambda _: page.go("/setup"))
+        self.app: WerewolfApp | None = None
+        timer.mark("app_constructed")
+
+    def start(self) -> None:
+        configure_page(self.page)
+        self.page.on_route_change = self._on_route_change
+        self.page.views.clear()
+        self.page.views.append(self.home_view)
+        self.page.update()
+        self.timer.mark("first_frame")
+        self.timer.log()
+
+    def _on_route_change(self, event: ft.RouteChangeEvent) -> None:
+        if self.page.route in ("", "/") and self.app is None:
+            self.page.views.clear()
+            self.page.views.append(self.home_view)
+            self.page.update()
+            return
+        self.load_app()._on_route_change(event)
+
+    def load_app(self) -> WerewolfApp:
+        if self.app is None:
+            from werewolf_gm.archive import default_directory
+
+            from .app import WerewolfApp
+
+            self.app = WerewolfApp(self.page, home_view=self.home_view, archive_dir=default_directory())
+            self.page.on_route_change = self.app._on_route_change
+            self.timer.mark("game_modules_loaded")
+            self.timer.log()
+        return self.app
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import logging
+import os
+import time
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+STARTUP_LOG_ENV = "WEREWOLF_GM_STARTUP_LOG"
+
+
+class StartupTimer:
+    """Milestones since the first werewolf_gm code ran (imports, app construction, first frame)."""
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter) -> None:
+        self.clock = clock
+        self.started_at = clock()
+        self.marks: list[tuple[str, float]] = []
+
+    def mark(self, name: str) -> float:
+        """Record ``name`` once and return its offset from start in seconds."""
+        for existing, offset in self.marks:
+            if existing == name:
+                return offset
+        offset = self.clock() - self.started_at
+        self.marks.append((name, offset))
+        return offset
+
+    def offsets_ms(self) -> dict[str, float]:
+        return {name: offset * 1000 for name, offset in self.marks}
+
+    def report(self) -> str:
+        parts: list[str] = []
+        previous = 0.0
+        for name, offset in self.marks:
+            parts.append(f"{name}={offset * 1000:.1f}ms (+{(offset - previous) * 1000:.1f})")
+            previous = offset
+        return "startup: " + ", ".join(parts)
+
+    def log(self) -> None:
+        logger.info(self.report())
+        if os.environ.get(STARTUP_LOG_ENV):
+            print(self.report(), flush=True)
+
+
+STARTUP = StartupTimer()
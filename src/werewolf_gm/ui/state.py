@@ -1,12 +1,26 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass, field
 
-from werewolf_gm.domain import FirstDaySeerRule, Game, GamePhase, GameRules
+from werewolf_gm.domain import (
+    Command,
+    FirstDaySeerRule,
+    Game,
+    GamePhase,
+    GameRules,
+    RoleMarginals,
+    VoteTally,
+    infer_roles,
+)
+from werewolf_gm.replay import GameRecord
 
 from .tabs import GameTab
 
 MIN_PLAYERS_TO_START = 4
+PLAYER_TABLE_THRESHOLD = 40
+# Role inference grows steeply with the lobby; above this the dashboard shows no estimate.
+INFERENCE_MAX_PLAYERS = 30
 
 
 @dataclass(slots=True)
@@ -25,8 +39,10 @@ class AppState:
     setup_day_seconds: int = 180
     setup_night_seconds: int = 90
     setup_first_day_seer: FirstDaySeerRule = FirstDaySeerRule.FREE_SELECT
+    night_batch_mode: bool = False
     is_rpp_mode: bool = False
-    rpp_selected_ids: set[str] = field(default_factory=set)
+    rpp_selected_ids: set[int] = field(default_factory=set)
+    vote_tally: VoteTally | None = None
 
     show_result_overlay: bool = False
     last_action_result: bool | None = None
@@ -35,6 +51,9 @@ class AppState:
     timer_running: bool = True
     reveal: RevealState | None = None
     last_morning_result: str | None = None
+    record: GameRecord | None = None
+    # Last dashboard estimate and the (fingerprint, divinations) it was computed for.
+    marginals_cache: tuple[tuple, RoleMarginals] | None = None
 
     def __post_init__(self) -> None:
         self.sync_setup_rules_from_game()
@@ -46,6 +65,7 @@ class AppState:
         self.selected_tab = GameTab.PROGRESS
         self.logs.clear()
         self.reset_rpp_mode()
+        self.vote_tally = None
 
         self.show_result_overlay = False
         self.last_action_result = None
@@ -53,12 +73,37 @@ class AppState:
         self.timer_running = True
         self.reveal = None
         self.last_morning_result = None
+        self.record = None
+        self.marginals_cache = None
         self.reset_timer_for_current_phase()
 
+    def begin_record(self) -> None:
+        """Start recording the GM's commands; call right after ``start_game``."""
+        self.record = GameRecord.from_game(self.game, started_at=time.time())
+
+    def record_commands(self, *commands: Command) -> None:
+        if self.record is not None:
+            self.record.add(commands, at=time.time())
+
+    def role_marginals(self) -> RoleMarginals | None:
+        """Role estimates for the current game, recomputed only after it changes."""
+        game = self.game
+        if len(game.players) > INFERENCE_MAX_PLAYERS:
+            return None
+        # Divinations are not part of the fingerprint, so they key the cache too.
+        key = (game.fingerprint, tuple(game.divinations))
+        if self.marginals_cache is None or self.marginals_cache[0] != key:
+            self.marginals_cache = (key, infer_roles(game))
+        return self.marginals_cache[1]
+
     @property
     def can_start_game(self) -> bool:
         return len(self.game.players) >= MIN_PLAYERS_TO_START
 
+    def prepare_game_backend(self) -> None:
+        if len(self.game.players) >= PLAYER_TABLE_THRESHOLD:
+            self.game.use_player_table()
+
     def reset_timer_for_current_phase(self) -> None:
         self.timer_seconds = self._initial_seconds_for_phase(self.game.phase)
 
@@ -1,38 +1,26 @@
 from __future__ import annotations
 
-from typing import Callable
+from typing import Callable, Sequence
 
 import flet as ft
 
-from werewolf_gm.domain import FirstDaySeerRule, GamePhase, Role, Team
-
-from .components import build_timer_panel
+from werewolf_gm.domain import (
+    FirstDaySeerRule,
+    GamePhase,
+    NightActionKind,
+    Player,
+    Role,
+    RoleMarginals,
+    Team,
+)
+from werewolf_gm.domain.targets import NIGHT_ACTION_PHASES
+from werewolf_gm.ratings import PlayerProfile, RatingIndex
+
+from .components import PlayerPicker, VoteBoard, build_timer_panel, update_if_mounted
 from .state import AppState, MIN_PLAYERS_TO_START
 from .tabs import GameTab
 
-
-def build_home_view(page: ft.Page) -> ft.View:
-    return ft.View(
-        route="/",
-        controls=[
-            ft.SafeArea(
-                ft.Container(
-                    expand=True,
-                    padding=20,
-                    alignment=ft.Alignment(0, 0),
-                    content=ft.Column(
-                        horizontal_alignment=ft.CrossAxisAlignment.CENTER,
-                        alignment=ft.MainAxisAlignment.CENTER,
-                        controls=[
-                            ft.Text("人狼GMサポート", size=28, weight=ft.FontWeight.BOLD),
-                            ft.Text("ホーム画面です", size=16),
-                            ft.FilledButton("セットアップへ", on_click=lambda _: page.go("/setup")),
-                        ],
-                    ),
-                )
-            )
-        ],
-    )
+PICKER_THRESHOLD = 12
 
 
 def build_setup_view(
@@ -40,8 +28,9 @@ def build_setup_view(
     state: AppState,
     *,
     on_add_player: Callable[[str, Role], None],
-    on_remove_player: Callable[[str], None],
+    on_remove_player: Callable[[int], None],
     on_start_game: Callable[[int, int, FirstDaySeerRule], None],
+    ratings: RatingIndex | None = None,
 ) -> ft.View:
     name_input = ft.TextField(
         label="プレイヤー名",
@@ -96,9 +85,18 @@ def build_setup_view(
         if selected:
             state.setup_first_day_seer = FirstDaySeerRule(selected)
 
+    night_batch_switch = ft.Switch(
+        label="夜の行動を1画面でまとめて入力",
+        value=state.night_batch_mode,
+    )
+
+    def handle_night_batch_change(event: ft.ControlEvent) -> None:
+        state.night_batch_mode = bool(event.control.value)
+
     day_seconds_selector.on_change = handle_day_seconds_change
     night_seconds_selector.on_change = handle_night_seconds_change
     first_day_seer_selector.on_change = handle_first_day_seer_change
+    night_batch_switch.on_change = handle_night_batch_change
 
     def handle_start(_: ft.ControlEvent) -> None:
         day_seconds = int(day_seconds_selector.value or state.setup_day_seconds)
@@ -107,7 +105,13 @@ def build_setup_view(
         on_start_game(day_seconds, night_seconds, first_day_seer)
 
     player_rows = [
-        _build_setup_player_row(player_id=player.id, name=player.name, role=player.role, on_remove_player=on_remove_player)
+        _build_setup_player_row(
+            player_id=player.id,
+            name=player.name,
+            role=player.role,
+            on_remove_player=on_remove_player,
+            profile_text=_profile_text(ratings.profile(player.name), player.role) if ratings is not None else None,
+        )
         for player in state.game.players
     ]
 
@@ -148,6 +152,7 @@ def build_setup_view(
                             day_seconds_selector,
                             night_seconds_selector,
                             first_day_seer_selector,
+                            night_batch_switch,
                             ft.FilledButton(
                                 "ゲーム開始",
                                 on_click=handle_start,
@@ -165,14 +170,22 @@ def build_setup_view(
 
 def _build_setup_player_row(
     *,
-    player_id: str,
+    player_id: int,
     name: str,
     role: Role,
-    on_remove_player: Callable[[str], None],
+    on_remove_player: Callable[[int], None],
+    profile_text: str | None = None,
 ) -> ft.Control:
     def handle_remove(_: ft.ControlEvent) -> None:
         on_remove_player(player_id)
 
+    details: list[ft.Control] = [
+        ft.Text(name, weight=ft.FontWeight.W_600),
+        ft.Text(_role_label(role), color=ft.Colors.BLUE_GREY_700),
+    ]
+    if profile_text is not None:
+        details.append(ft.Text(profile_text, size=12, color=ft.Colors.BLUE_GREY_500))
+
     return ft.Container(
         padding=10,
         border_radius=10,
@@ -180,13 +193,7 @@ def _build_setup_player_row(
         content=ft.Row(
             alignment=ft.MainAxisAlignment.SPACE_BETWEEN,
             controls=[
-                ft.Column(
-                    spacing=2,
-                    controls=[
-                        ft.Text(name, weight=ft.FontWeight.W_600),
-                        ft.Text(_role_label(role), color=ft.Colors.BLUE_GREY_700),
-                    ],
-                ),
+                ft.Column(spacing=2, controls=details),
                 ft.IconButton(
                     icon=ft.Icons.DELETE,
                     icon_color=ft.Colors.RED_500,
@@ -198,6 +205,16 @@ def _build_setup_player_row(
     )
 
 
+def _profile_text(profile: PlayerProfile | None, role: Role) -> str:
+    if profile is None or not profile.games:
+        return "初参加"
+    text = f"レート {profile.rating:.0f} ・ {profile.games}戦 勝率 {profile.win_rate:.0%}"
+    role_rate = profile.role_win_rate(role)
+    if role_rate is not None:
+        text += f" ・ {_role_label(role)} {role_rate:.0%}"
+    return text
+
+
 def build_reveal_view(state: AppState, *, on_close_reveal: Callable[[ft.ControlEvent], None]) -> ft.View:
     assert state.reveal is not None
 
@@ -260,22 +277,30 @@ def build_game_tab_content(
     state: AppState,
     *,
     timer_text_ref: ft.Ref[ft.Text] | None,
+    vote_board_ref: ft.Ref[VoteBoard] | None = None,
     on_decrease_timer: Callable[[ft.ControlEvent], None],
     on_increase_timer: Callable[[ft.ControlEvent], None],
     on_toggle_timer: Callable[[ft.ControlEvent], None],
     on_next_phase: Callable[[ft.ControlEvent], None],
     on_previous_phase: Callable[[ft.ControlEvent], None],
     on_toggle_rpp: Callable[[ft.ControlEvent], None],
-    on_toggle_rpp_selection: Callable[[str, bool], None],
+    on_toggle_rpp_selection: Callable[[int, bool], None],
     on_execute_rpp: Callable[[ft.ControlEvent], None],
-    on_confirm_vote: Callable[[str], None],
-    on_confirm_night_action: Callable[[str], None],
+    on_confirm_vote: Callable[[int], None],
+    on_toggle_vote_tally: Callable[[ft.ControlEvent], None],
+    on_start_runoff: Callable[[ft.ControlEvent], None],
+    on_start_tie_rpp: Callable[[ft.ControlEvent], None],
+    on_cast_vote: Callable[[int, int | None], None],
+    on_confirm_night_action: Callable[[int], None],
+    on_submit_night_batch: Callable[[dict[NightActionKind, int | None]], None],
     on_finish_game: Callable[[ft.ControlEvent], None],
+    debug_report: str | None = None,
 ) -> ft.Control:
     if state.selected_tab is GameTab.PROGRESS:
         return _build_progress_content(
             state,
             timer_text_ref=timer_text_ref,
+            vote_board_ref=vote_board_ref,
             on_decrease_timer=on_decrease_timer,
             on_increase_timer=on_increase_timer,
             on_toggle_timer=on_toggle_timer,
@@ -285,7 +310,12 @@ def build_game_tab_content(
             on_toggle_rpp_selection=on_toggle_rpp_selection,
             on_execute_rpp=on_execute_rpp,
             on_confirm_vote=on_confirm_vote,
+            on_toggle_vote_tally=on_toggle_vote_tally,
+            on_start_runoff=on_start_runoff,
+            on_start_tie_rpp=on_start_tie_rpp,
+            on_cast_vote=on_cast_vote,
             on_confirm_night_action=on_confirm_night_action,
+            on_submit_night_batch=on_submit_night_batch,
             on_finish_game=on_finish_game,
         )
 
@@ -306,25 +336,44 @@ def build_game_tab_content(
                     spacing=8,
                     controls=[ft.Text(log) for log in state.logs] or [ft.Text("ログはまだありません")],
                 ),
+                *_build_debug_panel(debug_report),
             ]
         ),
     )
 
 
+def _build_debug_panel(report: str | None) -> list[ft.Control]:
+    # Only shown when UI instrumentation is enabled.
+    if report is None:
+        return []
+    return [
+        ft.ExpansionTile(
+            title=ft.Text("計測 (debug)"),
+            controls=[ft.Text(report, font_family="monospace", size=10, selectable=True)],
+        )
+    ]
+
+
 def _build_progress_content(
     state: AppState,
     *,
     timer_text_ref: ft.Ref[ft.Text] | None,
+    vote_board_ref: ft.Ref[VoteBoard] | None = None,
     on_decrease_timer: Callable[[ft.ControlEvent], None],
     on_increase_timer: Callable[[ft.ControlEvent], None],
     on_toggle_timer: Callable[[ft.ControlEvent], None],
     on_next_phase: Callable[[ft.ControlEvent], None],
     on_previous_phase: Callable[[ft.ControlEvent], None],
     on_toggle_rpp: Callable[[ft.ControlEvent], None],
-    on_toggle_rpp_selection: Callable[[str, bool], None],
+    on_toggle_rpp_selection: Callable[[int, bool], None],
     on_execute_rpp: Callable[[ft.ControlEvent], None],
-    on_confirm_vote: Callable[[str], None],
-    on_confirm_night_action: Callable[[str], None],
+    on_confirm_vote: Callable[[int], None],
+    on_toggle_vote_tally: Callable[[ft.ControlEvent], None],
+    on_start_runoff: Callable[[ft.ControlEvent], None],
+    on_start_tie_rpp: Callable[[ft.ControlEvent], None],
+    on_cast_vote: Callable[[int, int | None], None],
+    on_confirm_night_action: Callable[[int], None],
+    on_submit_night_batch: Callable[[dict[NightActionKind, int | None]], None],
     on_finish_game: Callable[[ft.ControlEvent], None],
 ) -> ft.Control:
     if state.game.phase is GamePhase.FINISHED:
@@ -336,13 +385,19 @@ def _build_progress_content(
     is_expanded_voting = state.game.phase is GamePhase.VOTING and state.is_rpp_mode
     action_panel = _build_phase_action_panel(
         state,
+        vote_board_ref=vote_board_ref,
         on_next_phase=on_next_phase,
         on_previous_phase=on_previous_phase,
         on_toggle_rpp=on_toggle_rpp,
         on_toggle_rpp_selection=on_toggle_rpp_selection,
         on_execute_rpp=on_execute_rpp,
         on_confirm_vote=on_confirm_vote,
+        on_toggle_vote_tally=on_toggle_vote_tally,
+        on_start_runoff=on_start_runoff,
+        on_start_tie_rpp=on_start_tie_rpp,
+        on_cast_vote=on_cast_vote,
         on_confirm_night_action=on_confirm_night_action,
+        on_submit_night_batch=on_submit_night_batch,
     )
 
     phase_header_controls: list[ft.Control] = [
@@ -401,15 +456,21 @@ def _build_progress_content(
 def _build_phase_action_panel(
     state: AppState,
     *,
+    vote_board_ref: ft.Ref[VoteBoard] | None = None,
     on_next_phase: Callable[[ft.ControlEvent], None],
     on_previous_phase: Callable[[ft.ControlEvent], None],
     on_toggle_rpp: Callable[[ft.ControlEvent], None],
-    on_toggle_rpp_selection: Callable[[str, bool], None],
+    on_toggle_rpp_selection: Callable[[int, bool], None],
     on_execute_rpp: Callable[[ft.ControlEvent], None],
-    on_confirm_vote: Callable[[str], None],
-    on_confirm_night_action: Callable[[str], None],
+    on_confirm_vote: Callable[[int], None],
+    on_toggle_vote_tally: Callable[[ft.ControlEvent], None],
+    on_start_runoff: Callable[[ft.ControlEvent], None],
+    on_start_tie_rpp: Callable[[ft.ControlEvent], None],
+    on_cast_vote: Callable[[int, int | None], None],
+    on_confirm_night_action: Callable[[int], None],
+    on_submit_night_batch: Callable[[dict[NightActionKind, int | None]], None],
 ) -> ft.Control:
-    alive_players = state.game.alive_players()
+    candidates = state.game.target_candidates()
 
     def add_previous_phase_button(controls: list[ft.Control]) -> ft.Control:
         if state.game.phase in {GamePhase.NIGHT_MEDIUM, GamePhase.NIGHT_KNIGHT, GamePhase.NIGHT_WEREWOLF}:
@@ -420,7 +481,7 @@ def _build_phase_action_panel(
         return ft.FilledButton("投票フェーズへ進む", on_click=on_next_phase, width=340, height=52)
 
     if state.game.phase is GamePhase.VOTING:
-        if not alive_players:
+        if not candidates:
             return ft.Column(
                 horizontal_alignment=ft.CrossAxisAlignment.CENTER,
                 controls=[
@@ -429,30 +490,39 @@ def _build_phase_action_panel(
                 ],
             )
 
-        target_dropdown = ft.Dropdown(
-            label="処刑対象",
-            width=340,
-            value=alive_players[0].id,
-            options=[ft.dropdown.Option(key=p.id, text=p.name) for p in alive_players],
-        )
+        target_selector, selected_target = _build_target_selector(state, label="処刑対象", players=candidates.players)
 
         def handle_vote(_: ft.ControlEvent) -> None:
-            if target_dropdown.value:
-                on_confirm_vote(target_dropdown.value)
+            player_id = selected_target()
+            if player_id is not None:
+                on_confirm_vote(player_id)
 
         controls: list[ft.Control] = [
-            target_dropdown,
+            target_selector,
             ft.FilledButton("処刑を確定する", on_click=handle_vote, width=340, height=52),
             ft.TextButton("RPP（ランダム処刑）モードを開く/閉じる", on_click=on_toggle_rpp),
+            ft.TextButton("個別の投票を記録する/閉じる", on_click=on_toggle_vote_tally),
         ]
 
+        if state.vote_tally is not None:
+            controls.append(
+                _build_vote_tally_panel(
+                    state,
+                    on_confirm_vote=on_confirm_vote,
+                    on_start_runoff=on_start_runoff,
+                    on_start_tie_rpp=on_start_tie_rpp,
+                    on_cast_vote=on_cast_vote,
+                    vote_board_ref=vote_board_ref,
+                )
+            )
+
         if state.is_rpp_mode:
             controls.append(ft.Text("RPP候補", weight=ft.FontWeight.W_600))
             rpp_checkboxes: list[ft.Control] = []
-            for player in alive_players:
+            for player in candidates.players:
                 checkbox = ft.Checkbox(label=player.name, value=player.id in state.rpp_selected_ids)
 
-                def handle_change(event: ft.ControlEvent, player_id: str = player.id) -> None:
+                def handle_change(event: ft.ControlEvent, player_id: int = player.id) -> None:
                     on_toggle_rpp_selection(player_id, bool(event.control.value))
 
                 checkbox.on_change = handle_change
@@ -495,6 +565,9 @@ def _build_phase_action_panel(
             ]
         )
 
+    if state.night_batch_mode and state.game.phase is GamePhase.NIGHT_SEER:
+        return _build_night_batch_panel(state, on_submit_night_batch=on_submit_night_batch)
+
     night_role, confirm_label = _night_phase_role_and_label(state.game.phase)
     if night_role is not None:
         if (
@@ -521,45 +594,21 @@ def _build_phase_action_panel(
             )
 
         random_white_note: ft.Control | None = None
-        excluded_role = {
-            GamePhase.NIGHT_SEER: Role.SEER,
-            GamePhase.NIGHT_KNIGHT: Role.KNIGHT,
-            GamePhase.NIGHT_WEREWOLF: Role.WEREWOLF,
-        }.get(state.game.phase)
-
-        def with_role_restriction(players: list) -> list:
-            if excluded_role is None:
-                return players
-            return [player for player in players if player.role is not excluded_role]
-
-        if state.game.phase is GamePhase.NIGHT_MEDIUM:
-            executed_player = state.game.get_executed_player_on_day(state.game.day)
-            if executed_player is None:
-                return add_previous_phase_button(
-                    [
-                        ft.Text("本日の処刑者はいません"),
-                        ft.FilledButton("次へ進む", on_click=on_next_phase, width=340, height=52),
-                    ]
-                )
+        if state.game.phase is GamePhase.NIGHT_MEDIUM and not candidates:
+            return add_previous_phase_button(
+                [
+                    ft.Text("本日の処刑者はいません"),
+                    ft.FilledButton("次へ進む", on_click=on_next_phase, width=340, height=52),
+                ]
+            )
+        if (
+            state.game.phase is GamePhase.NIGHT_SEER
+            and state.game.day == 0
+            and state.game.rules.first_day_seer is FirstDaySeerRule.RANDOM_WHITE
+        ):
+            random_white_note = ft.Text("※ランダム白対象（自動選択）", color=ft.Colors.BLUE_GREY_700)
 
-            target_players = [executed_player]
-        elif state.game.phase is GamePhase.NIGHT_SEER and state.game.day == 0:
-            if state.game.rules.first_day_seer is FirstDaySeerRule.RANDOM_WHITE:
-                target_players = []
-                if state.game.first_day_white_target_id is not None:
-                    try:
-                        target_player = state.game.get_player(state.game.first_day_white_target_id)
-                        if target_player.is_alive:
-                            target_players = [target_player]
-                    except ValueError:
-                        target_players = []
-                random_white_note = ft.Text("※ランダム白対象（自動選択）", color=ft.Colors.BLUE_GREY_700)
-            else:
-                target_players = with_role_restriction(alive_players)
-        else:
-            target_players = with_role_restriction(alive_players)
-
-        if not target_players:
+        if not candidates:
             fallback_message = "行動対象がいません"
             if (
                 state.game.phase is GamePhase.NIGHT_SEER
@@ -574,23 +623,19 @@ def _build_phase_action_panel(
                 ]
             )
 
-        target_dropdown = ft.Dropdown(
-            label="行動対象",
-            width=340,
-            value=target_players[0].id,
-            options=[ft.dropdown.Option(key=p.id, text=p.name) for p in target_players],
-        )
+        target_selector, selected_target = _build_target_selector(state, label="行動対象", players=candidates.players)
 
         def handle_night_action(_: ft.ControlEvent) -> None:
-            if target_dropdown.value:
-                on_confirm_night_action(target_dropdown.value)
+            player_id = selected_target()
+            if player_id is not None:
+                on_confirm_night_action(player_id)
 
         action_controls: list[ft.Control] = []
         if random_white_note is not None:
             action_controls.append(random_white_note)
         action_controls.extend(
             [
-                target_dropdown,
+                target_selector,
                 ft.FilledButton(confirm_label, on_click=handle_night_action, width=340, height=52),
             ]
         )
@@ -599,6 +644,134 @@ def _build_phase_action_panel(
     return ft.FilledButton("次のフェーズへ進む", on_click=on_next_phase, width=340, height=52)
 
 
+def _build_vote_tally_panel(
+    state: AppState,
+    *,
+    on_confirm_vote: Callable[[int], None],
+    on_start_runoff: Callable[[ft.ControlEvent], None],
+    on_start_tie_rpp: Callable[[ft.ControlEvent], None],
+    on_cast_vote: Callable[[int, int | None], None],
+    vote_board_ref: ft.Ref[VoteBoard] | None = None,
+) -> ft.Control:
+    tally = state.vote_tally
+    assert tally is not None
+    voters = [state.game.get_player(player_id) for player_id in tally.voter_ids]
+    candidates = [state.game.get_player(player_id) for player_id in tally.candidate_ids]
+    result_actions = ft.Column(horizontal_alignment=ft.CrossAxisAlignment.CENTER)
+
+    def build_result_actions() -> list[ft.Control]:
+        result = tally.result()
+        if result.winner_id is not None:
+            winner_id = result.winner_id
+
+            def handle_execute(_: ft.ControlEvent) -> None:
+                on_confirm_vote(winner_id)
+
+            return [
+                ft.FilledButton(
+                    f"{state.game.get_player(winner_id).name} を処刑する",
+                    on_click=handle_execute,
+                    width=340,
+                    height=52,
+                )
+            ]
+        if result.is_tie:
+            return [
+                ft.Text("同票です", color=ft.Colors.RED_700, weight=ft.FontWeight.W_600),
+                ft.FilledButton("同票者で決選投票", on_click=on_start_runoff, width=340),
+                ft.OutlinedButton("同票者からRPP", on_click=on_start_tie_rpp, width=340),
+            ]
+        return [ft.Text("投票先を入力してください", color=ft.Colors.BLUE_GREY_700)]
+
+    def handle_result_change() -> None:
+        result_actions.controls = build_result_actions()
+        update_if_mounted(result_actions)
+
+    board = VoteBoard(
+        tally=tally,
+        voters=voters,
+        candidates=candidates,
+        external_id=state.game.external_id,
+        on_cast=on_cast_vote,
+        on_result_change=handle_result_change,
+    )
+    if vote_board_ref is not None:
+        vote_board_ref.current = board
+    result_actions.controls = build_result_actions()
+    return ft.Column(horizontal_alignment=ft.CrossAxisAlignment.CENTER, controls=[board.control, result_actions])
+
+
+def _build_night_batch_panel(
+    state: AppState,
+    *,
+    on_submit_night_batch: Callable[[dict[NightActionKind, int | None]], None],
+) -> ft.Control:
+    controls: list[ft.Control] = [ft.Text("夜の行動をまとめて入力", size=18, weight=ft.FontWeight.W_600)]
+    selected_targets: dict[NightActionKind, Callable[[], int | None]] = {}
+
+    for kind, phase in NIGHT_ACTION_PHASES.items():
+        if state.game.day == 0 and phase in {GamePhase.NIGHT_MEDIUM, GamePhase.NIGHT_KNIGHT}:
+            continue
+        label = _night_batch_label(kind)
+        if state.game.day == 0 and kind is NightActionKind.ATTACK:
+            controls.append(ft.Text(f"{label}: 0日目は人狼の顔合わせのみ", color=ft.Colors.BLUE_GREY_700))
+            continue
+
+        candidates = state.game.target_candidates(phase)
+        if not candidates:
+            controls.append(ft.Text(f"{label}: 対象なし", color=ft.Colors.BLUE_GREY_700))
+            continue
+
+        selector, selected_target = _build_target_selector(state, label=label, players=candidates.players)
+        controls.append(selector)
+        selected_targets[kind] = selected_target
+
+    def handle_submit(_: ft.ControlEvent) -> None:
+        on_submit_night_batch({kind: selected() for kind, selected in selected_targets.items()})
+
+    controls.append(ft.FilledButton("夜の行動を確定して朝へ", on_click=handle_submit, width=340, height=52))
+    return ft.Column(horizontal_alignment=ft.CrossAxisAlignment.CENTER, spacing=12, controls=controls)
+
+
+def _night_batch_label(kind: NightActionKind) -> str:
+    labels = {
+        NightActionKind.SEER: "占い先",
+        NightActionKind.MEDIUM: "霊媒先",
+        NightActionKind.GUARD: "護衛先",
+        NightActionKind.ATTACK: "襲撃先",
+    }
+    return labels[kind]
+
+
+def _build_target_selector(
+    state: AppState,
+    *,
+    label: str,
+    players: Sequence[Player],
+) -> tuple[ft.Control, Callable[[], int | None]]:
+    if len(players) > PICKER_THRESHOLD:
+        picker = PlayerPicker(
+            label=label,
+            candidates=[(player.id, player.name) for player in players],
+            selected_id=players[0].id,
+        )
+        return picker.control, lambda: picker.selected_id
+
+    dropdown = ft.Dropdown(
+        label=label,
+        width=340,
+        value=state.game.external_id(players[0].id),
+        options=[ft.dropdown.Option(key=state.game.external_id(p.id), text=p.name) for p in players],
+    )
+
+    def selected() -> int | None:
+        if not dropdown.value:
+            return None
+        return state.game.resolve_external_id(dropdown.value)
+
+    return dropdown, selected
+
+
 def _build_morning_result(state: AppState) -> ft.Control:
     if state.game.phase is not GamePhase.DAY or not state.last_morning_result:
         return ft.Container()
@@ -698,6 +871,7 @@ def _build_dashboard_content(state: AppState) -> ft.Control:
             ),
         )
 
+    marginals = state.role_marginals()
     cards = []
     for player in state.game.players:
         is_alive = player.is_alive
@@ -705,6 +879,14 @@ def _build_dashboard_content(state: AppState) -> ft.Control:
         status_text = "生存" if is_alive else "死亡"
         status_color = ft.Colors.GREEN_700 if is_alive else ft.Colors.GREY_500
         status_icon = ft.Icons.PERSON if is_alive else ft.Icons.PERSON_OFF
+        details: list[ft.Control] = [
+            ft.Text(player.name, size=16, weight=ft.FontWeight.W_600, color=text_color),
+            ft.Text(_role_label(player.role), color=text_color),
+        ]
+        if marginals is not None:
+            details.append(
+                ft.Text(_werewolf_estimate_label(marginals, player.id), size=12, color=ft.Colors.BLUE_GREY_500)
+            )
 
         cards.append(
             ft.Card(
@@ -720,10 +902,7 @@ def _build_dashboard_content(state: AppState) -> ft.Control:
                                     ft.Icon(status_icon, color=text_color),
                                     ft.Column(
                                         spacing=2,
-                                        controls=[
-                                            ft.Text(player.name, size=16, weight=ft.FontWeight.W_600, color=text_color),
-                                            ft.Text(_role_label(player.role), color=text_color),
-                                        ],
+                                        controls=details,
                                     ),
                                 ]
                             ),
@@ -748,6 +927,12 @@ def _build_dashboard_content(state: AppState) -> ft.Control:
     )
 
 
+def _werewolf_estimate_label(marginals: RoleMarginals, player_id: int) -> str:
+    if not marginals.is_consistent:
+        return "人狼推定: 矛盾あり"
+    return f"人狼推定: {marginals.werewolf_probability(player_id):.0%}"
+
+
 def _phase_label(phase: GamePhase) -> str:
     if phase is GamePhase.DAY:
         return "昼の議論"
@@ -777,7 +962,7 @@ def _phase_actor_label(state: AppState) -> str | None:
     if role is None:
         return None
 
-    names = [player.name for player in state.game.alive_players() if player.role is role]
+    names = [player.name for player in state.game.alive_players_by_role(role)]
     suffix = ", ".join(names) if names else "生存者なし"
     return f"行動プレイヤー: {suffix}"
 
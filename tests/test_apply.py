@@ -0,0 +1,164 @@
+import pytest
+
+from werewolf_gm.domain import (
+    AdvancePhase,
+    DeathReason,
+    Game,
+    GamePhase,
+    KillPlayer,
+    NightActionKind,
+    Role,
+    SetTarget,
+    VictoryState,
+    compute_fingerprint,
+)
+
+
+def _build_sample_game() -> Game:
+    game = Game()
+    game.add_player("Wolf", Role.WEREWOLF)
+    game.add_player("Seer", Role.SEER)
+    game.add_player("Knight", Role.KNIGHT)
+    game.add_player("Alice", Role.CITIZEN)
+    game.add_player("Bob", Role.CITIZEN)
+    return game
+
+
+def test_apply_matches_one_call_at_a_time() -> None:
+    batched = _build_sample_game()
+    batched.start_game()
+    sequential = batched.fork()
+    wolf, seer, knight, alice, bob = (p.id for p in batched.players)
+
+    commands = [
+        AdvancePhase(),
+        AdvancePhase(),
+        AdvancePhase(),
+        KillPlayer(bob, DeathReason.EXECUTED),
+        AdvancePhase(),
+        SetTarget(NightActionKind.SEER, wolf),
+        AdvancePhase(),
+        SetTarget(NightActionKind.MEDIUM, bob),
+        AdvancePhase(),
+        SetTarget(NightActionKind.GUARD, seer),
+        AdvancePhase(),
+        SetTarget(NightActionKind.ATTACK, alice),
+        AdvancePhase(),
+    ]
+    phase = batched.apply(commands)
+
+    for _ in range(3):
+        sequential.proceed_to_next_phase()
+    sequential.kill_player(bob, DeathReason.EXECUTED)
+    sequential.proceed_to_next_phase()
+    sequential.set_seer_target(wolf)
+    sequential.proceed_to_next_phase()
+    sequential.set_medium_target(bob)
+    sequential.proceed_to_next_phase()
+    sequential.set_guard_target(seer)
+    sequential.proceed_to_next_phase()
+    sequential.set_attack_target(alice)
+    sequential.proceed_to_next_phase()
+
+    assert phase is GamePhase.DAY
+    assert batched.day == sequential.day == 2
+    assert batched.fingerprint == sequential.fingerprint == compute_fingerprint(batched)
+    assert batched.victory == sequential.victory
+    assert batched.divinations == sequential.divinations
+
+
+def test_apply_defers_victory_until_end_of_batch() -> None:
+    game = _build_sample_game()
+    wolf = game.players[0]
+
+    game.apply([KillPlayer(wolf.id, DeathReason.EXECUTED)])
+
+    assert game.victory.state is VictoryState.VILLAGER_WIN
+    assert game.phase is GamePhase.FINISHED
+
+
+def test_apply_evaluates_victory_before_advancing() -> None:
+    game = _build_sample_game()
+    game.start_game()
+    wolf = game.players[0]
+
+    phase = game.apply([KillPlayer(wolf.id, DeathReason.EXECUTED), AdvancePhase()])
+
+    assert phase is GamePhase.FINISHED
+    assert game.day == 0
+
+
+def test_apply_rejects_unknown_player_before_running_anything() -> None:
+    game = _build_sample_game()
+    game.start_game()
+    before = game.fingerprint
+
+    with pytest.raises(ValueError):
+        game.apply([AdvancePhase(), KillPlayer("missing", DeathReason.OTHER)])
+
+    assert game.phase is GamePhase.NIGHT_SEER
+    assert game.fingerprint == before
+
+
+def test_apply_rolls_back_when_a_command_fails() -> None:
+    game = _build_sample_game()
+    game.start_game()
+    alice = game.players[3]
+    before = game.fingerprint
+
+    with pytest.raises(ValueError):
+        game.apply(
+            [
+                KillPlayer(alice.id, DeathReason.EXECUTED),
+                AdvancePhase(),
+                SetTarget(NightActionKind.ATTACK, alice.id),
+            ]
+        )
+
+    assert game.get_player(alice.id).is_alive is True
+    assert game.phase is GamePhase.NIGHT_SEER
+    assert game.last_executed_player_id is None
+    assert game.fingerprint == before == compute_fingerprint(game)
+
+
+def test_kill_that_decides_the_game_ends_the_batch_there() -> None:
+    game = Game()
+    wolf = game.add_player("Wolf", Role.WEREWOLF)
+    a, b, _ = (game.add_player(name, Role.CITIZEN) for name in "ABC")
+    game.start_game()
+    before = game.fingerprint
+
+    # One at a time the second kill is a werewolf win, so the third one is refused.
+    with pytest.raises(ValueError, match="already finished"):
+        game.apply(
+            [
+                KillPlayer(a.id, DeathReason.EXECUTED),
+                KillPlayer(b.id, DeathReason.EXECUTED),
+                KillPlayer(wolf.id, DeathReason.EXECUTED),
+            ]
+        )
+    assert game.fingerprint == before
+    assert game.victory.state is VictoryState.ONGOING
+
+    phase = game.apply([KillPlayer(a.id, DeathReason.EXECUTED), KillPlayer(b.id, DeathReason.EXECUTED), AdvancePhase()])
+
+    assert phase is GamePhase.FINISHED
+    assert game.victory.state is VictoryState.WEREWOLF_WIN
+
+
+@pytest.mark.parametrize("use_player_table", [False, True])
+def test_held_players_stay_live_across_apply(use_player_table: bool) -> None:
+    game = _build_sample_game()
+    if use_player_table:
+        game.use_player_table()
+    game.start_game()
+    alice, bob = game.players[3], game.players[4]
+
+    game.apply([KillPlayer(alice.id, DeathReason.EXECUTED)])
+    with pytest.raises(ValueError):
+        game.apply([KillPlayer(bob.id, DeathReason.EXECUTED), KillPlayer(alice.id, DeathReason.ATTACKED)])
+
+    assert game.players[3] is alice and game.players[4] is bob
+    assert alice.is_alive is False and alice.death_reason is DeathReason.EXECUTED
+    assert bob.is_alive is True and bob.death_reason is None and bob.death_day is None
+    assert game.fingerprint == compute_fingerprint(game)
@@ -0,0 +1,146 @@
+import random
+import time
+from collections import Counter
+from pathlib import Path
+
+import pytest
+
+from werewolf_gm import archive
+from werewolf_gm.archive import ArchivedGame, ArchiveReader, append_game, archive_stats, open_archives, write_games
+from werewolf_gm.bench.archive import run_archive_bench
+from werewolf_gm.bench.ui import ScenarioDriver, scenario_steps
+from werewolf_gm.domain import DeathReason, Game, GamePhase, Role, VictoryState
+from werewolf_gm.simulation import simulate_game
+
+JANUARY = 1_704_067_200 + 86_400 * 10
+FEBRUARY = JANUARY + 86_400 * 31
+
+
+def _finished_games(count: int) -> list[ArchivedGame]:
+    return [ArchivedGame.of(simulate_game(5 + seed % 8, seed=seed).game, JANUARY + seed) for seed in range(count)]
+
+
+def test_round_trip_through_columns_and_whole_games(tmp_path: Path) -> None:
+    games = _finished_games(30)
+    path = tmp_path / "2024-01.wga"
+
+    write_games(path, games)
+
+    with ArchiveReader(path) as reader:
+        assert reader.games == 30
+        assert list(reader.iter_games()) == games
+        assert list(reader.column("days")) == [game.days for game in games]
+        assert reader.seat_offsets()[-1] == reader.seats == sum(len(game.roles) for game in games)
+        assert reader.seat_names() == [name for game in games for name in game.names]
+
+
+def test_single_appends_refill_the_last_block(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(archive, "BLOCK_GAMES", 4)
+    games = _finished_games(10)
+    path = tmp_path / "2024-01.wga"
+
+    for game in games:
+        write_games(path, [game])
+
+    with ArchiveReader(path) as reader:
+        assert [block.games for block in reader._blocks] == [4, 4, 2]
+        assert list(reader.iter_games()) == games
+
+
+def test_death_order_puts_execution_before_the_nights_attack() -> None:
+    game = Game()
+    game.add_player("Wolf", Role.WEREWOLF)
+    game.add_player("Seer", Role.SEER)
+    for name in "ABCD":
+        game.add_player(name, Role.CITIZEN)
+    game.start_game()
+    game.day = 2
+    game.kill_player(3, DeathReason.ATTACKED)
+    game.day = 1
+    game.kill_player(2, DeathReason.ATTACKED)
+    game.kill_player(1, DeathReason.EXECUTED)
+
+    archived = ArchivedGame.of(game, JANUARY)
+
+    assert archived.order == (0, 1, 2, 3, 0, 0)
+    assert archived.death_days == (None, 1, 1, 2, None, None)
+    assert archived.reasons[1] is DeathReason.EXECUTED
+
+
+def test_stats_match_a_scan_of_decoded_games(tmp_path: Path) -> None:
+    games = _finished_games(40)
+    write_games(archive.archive_path(tmp_path, JANUARY), games[:25])
+    write_games(archive.archive_path(tmp_path, FEBRUARY), games[25:])
+
+    readers = open_archives(tmp_path)
+    stats = archive_stats(readers)
+
+    assert [reader.path.name for reader in readers] == ["2024-01.wga", "2024-02.wga"]
+    assert stats.games == 40
+    assert stats.total_days == sum(game.days for game in games)
+    assert stats.victories == Counter(game.victory for game in games)
+    assert sum(entry[0] for entry in stats.compositions.values()) == 40
+    assert stats.first_deaths == Counter(game.roles[game.order.index(1)] for game in games if 1 in game.order)
+
+
+def test_app_archives_the_finished_game(tmp_path: Path) -> None:
+    driver = ScenarioDriver(7)
+    driver.app.archive_dir = tmp_path
+    for name, action in scenario_steps(driver.app, 7, random.Random(3)):
+        driver.interact(name, action)
+
+    [reader] = open_archives(tmp_path)
+    [game] = reader.iter_games()
+    assert len(game.roles) == 7
+    assert game.victory is not VictoryState.ONGOING
+    assert driver.app.state.game.phase is not GamePhase.FINISHED
+
+
+def test_append_game_picks_the_month_file(tmp_path: Path) -> None:
+    game = simulate_game(6, seed=1).game
+
+    first = append_game(tmp_path, game, JANUARY)
+    second = append_game(tmp_path, game, FEBRUARY)
+
+    assert (first.name, second.name) == ("2024-01.wga", "2024-02.wga")
+
+
+def test_archive_bench_scans_every_game(tmp_path: Path) -> None:
+    result = run_archive_bench(tmp_path, 2_000, months=3)
+
+    assert result.games == 2_000
+    assert result.months >= 3
+    assert sum(result.stats.victories.values()) == 2_000
+
+
+def test_large_lobby_round_trips(tmp_path: Path) -> None:
+    game = Game()
+    game.add_player("Wolf", Role.WEREWOLF)
+    for index in range(299):
+        game.add_player(f"P{index}", Role.CITIZEN)
+    game.start_game()
+    for player in game.players[1:290]:
+        game.kill_player(player.id, DeathReason.EXECUTED)
+    large = ArchivedGame.of(game, JANUARY)
+    path = tmp_path / "2024-01.wga"
+
+    write_games(path, [large])
+
+    with ArchiveReader(path) as reader:
+        assert list(reader.iter_games()) == [large]
+        assert max(reader.column("order")) == 289
+        assert archive_stats([reader]).first_deaths[Role.CITIZEN] >= 1
+
+
+def test_corrupt_archive_does_not_block_finishing(tmp_path: Path) -> None:
+    driver = ScenarioDriver(7)
+    driver.app.archive_dir = tmp_path
+    archive.archive_path(tmp_path, time.time()).write_bytes(b"not an archive")
+
+    for name, action in scenario_steps(driver.app, 7, random.Random(3)):
+        driver.interact(name, action)
+
+    assert driver.app.state.game.players == []
+    assert driver.page.route == "/setup"
+    assert driver.page.snack_bar is not None
+    assert driver.page.snack_bar.content.value.startswith("対戦記録を保存できませんでした")
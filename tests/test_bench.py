@@ -0,0 +1,104 @@
+import asyncio
+from pathlib import Path
+
+from werewolf_gm.bench.domain import DOMAIN_BENCHMARKS, day_one_game, run_domain_benchmarks
+from werewolf_gm.bench.load import LoadResult, format_load, run_sessions, session_limit
+from werewolf_gm.bench.timing import Case, Measurement, compare_results, load_results, measure, save_results
+from werewolf_gm.bench.ui import compare_reports, load_summaries, run_ui_scenario, save_reports
+from werewolf_gm.cli import main
+from werewolf_gm.domain import GamePhase
+
+
+def test_measure_reports_ns_and_retained_blocks() -> None:
+    kept: list[object] = []
+
+    measurement = measure(Case(make_state=lambda: None, op=lambda _: kept.append(object()), max_ops=100), repeat=2)
+
+    assert measurement.ops == 100
+    assert measurement.ns_per_op > 0
+    assert measurement.blocks_per_op >= 1
+
+
+def test_domain_benchmarks_cover_every_size(tmp_path: Path) -> None:
+    results = run_domain_benchmarks((5, 50), min_seconds=0.0, repeat=1)
+
+    assert set(results) == set(DOMAIN_BENCHMARKS)
+    assert all(set(by_size) == {5, 50} for by_size in results.values())
+
+    path = tmp_path / "baseline.json"
+    save_results(results, path)
+    loaded = load_results(path)
+    assert loaded.keys() == results.keys()
+    assert loaded["get_player"][50].ns_per_op == round(results["get_player"][50].ns_per_op, 1)
+
+
+def test_consuming_benchmarks_leave_the_source_game_untouched() -> None:
+    game = day_one_game(9)
+    case = DOMAIN_BENCHMARKS["kill_player"](game)
+
+    measure(case, min_seconds=0.0, repeat=1)
+
+    assert game.phase is GamePhase.DAY
+    assert len(game.alive_players()) == 9
+
+
+def test_compare_flags_only_slowdowns_past_threshold() -> None:
+    baseline = {"op": {5: Measurement(100.0, 100.0, 0.0, 10), 50: Measurement(100.0, 100.0, 0.0, 10)}}
+    current = {"op": {5: Measurement(120.0, 120.0, 0.0, 10), 50: Measurement(300.0, 300.0, 0.0, 10)}}
+
+    assert compare_results(baseline, current) == ["op[50]: 100 -> 300 ns/op (3.00x)"]
+
+
+def test_bench_command_saves_and_compares(tmp_path: Path, capsys) -> None:
+    path = tmp_path / "baseline.json"
+    argv = ["bench", "domain", "--sizes", "5", "--only", "get_player"]
+
+    assert main([*argv, "--save", str(path)]) == 0
+    assert "get_player" in capsys.readouterr().out
+    assert main([*argv, "--compare", str(path), "--threshold", "1000"]) == 0
+
+
+def test_ui_scenario_renders_once_per_interaction() -> None:
+    report = run_ui_scenario(7, seed=1)
+    summary = report.summary()
+
+    assert report.interactions[-1].name == "finish_game"
+    assert summary["add_player"]["count"] == 7
+    for name in ("add_player", "next_phase", "switch_tab", "night_action", "close_reveal"):
+        assert summary[name]["updates"] == 1
+        assert summary[name]["rebuilds"] == 1
+    assert summary["confirm_vote"]["rebuilds"] == 0
+    assert all(interaction.controls > 0 and interaction.bytes > 0 for interaction in report.interactions)
+
+
+def test_ui_compare_flags_extra_updates(tmp_path: Path) -> None:
+    report = run_ui_scenario(5, seed=2)
+    path = tmp_path / "ui.json"
+    save_reports([report], path)
+    baseline = load_summaries(path)
+
+    assert compare_reports(baseline, [report], threshold=100) == []
+
+    baseline[5]["next_phase"]["updates"] = 0.5
+    assert compare_reports(baseline, [report], threshold=100) == ["next_phase[5] updates: 0.5 -> 1.0"]
+
+
+def test_load_sessions_click_and_tick() -> None:
+    result = asyncio.run(run_sessions(3, duration=0.6, players=5, think_seconds=0.005, timer_interval=0.005))
+
+    assert result.interactions > 3
+    assert result.timer_ticks > 0
+    assert result.loop_lag_ms
+    assert result.peak_rss_mb > 0
+
+
+def test_session_limit_is_last_count_within_budget() -> None:
+    results = [
+        LoadResult(sessions=10, response_ms=[5.0], loop_lag_ms=[1.0]),
+        LoadResult(sessions=100, response_ms=[50.0], loop_lag_ms=[20.0]),
+        LoadResult(sessions=200, response_ms=[500.0], loop_lag_ms=[20.0]),
+    ]
+
+    assert session_limit(results, budget_ms=100) == 100
+    assert "about 100 sessions" in format_load(results, budget_ms=100)
+    assert session_limit(results, budget_ms=1) is None
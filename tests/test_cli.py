@@ -0,0 +1,82 @@
+import argparse
+import subprocess
+import sys
+from pathlib import Path
+
+from werewolf_gm.cli import _run_play, main
+from werewolf_gm.domain import GamePhase
+from werewolf_gm.replay import load_record, replay
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+HEADLESS_MODULES = (
+    "werewolf_gm.domain",
+    "werewolf_gm.simulation",
+    "werewolf_gm.replay",
+    "werewolf_gm.cli",
+    "werewolf_gm.ui",
+)
+# Self time of every werewolf_gm module imported above (about 70 ms when added).
+IMPORT_BUDGET_SECONDS = 0.25
+
+
+def _import_headless_modules(*flags: str) -> subprocess.CompletedProcess[str]:
+    code = "".join(f"import {name}\n" for name in HEADLESS_MODULES) + "import sys\nprint('flet' in sys.modules)"
+    return subprocess.run(
+        [sys.executable, *flags, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={"PYTHONPATH": str(SRC)},
+    )
+
+
+def test_headless_modules_do_not_import_flet() -> None:
+    assert _import_headless_modules().stdout.strip() == "False"
+
+
+def test_headless_import_time_budget() -> None:
+    stderr = _import_headless_modules("-X", "importtime").stderr
+    total_us = 0
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, _, name = line.removeprefix("import time:").split("|")
+        if name.strip().startswith("werewolf_gm"):
+            total_us += int(self_us)
+
+    assert total_us > 0
+    assert total_us / 1_000_000 < IMPORT_BUDGET_SECONDS
+
+
+def test_simulate_records_a_replayable_game(tmp_path: Path, capsys) -> None:
+    record_path = tmp_path / "game.json"
+
+    assert main(["simulate", "--games", "3", "--seed", "7", "--record", str(record_path)]) == 0
+
+    output = capsys.readouterr().out
+    assert "average days" in output
+    assert replay(load_record(record_path)).phase is GamePhase.FINISHED
+
+    assert main(["replay", str(record_path)]) == 0
+    assert "alive:" in capsys.readouterr().out
+
+
+def test_play_with_scripted_input(tmp_path: Path) -> None:
+    lines: list[str] = []
+    typos = iter(["nobody"])
+
+    def answer(prompt: str) -> str:
+        if not prompt.startswith("target"):
+            return ""
+        # Mistype once, then always pick the first listed candidate.
+        listed = next(line for line in reversed(lines) if line.startswith("candidates: "))
+        return next(typos, None) or listed.removeprefix("candidates: ").split(", ")[0]
+
+    args = argparse.Namespace(players=5, seed=3, record=str(tmp_path / "play.json"))
+
+    assert _run_play(args, input_fn=answer, output=lines.append) == 0
+
+    assert "unknown candidate: nobody" in lines
+    record = load_record(tmp_path / "play.json")
+    assert record.commands
+    assert replay(record).phase is GamePhase.FINISHED
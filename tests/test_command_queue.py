@@ -0,0 +1,65 @@
+import threading
+
+from werewolf_gm.ui.command_queue import CommandQueue
+
+
+def test_commands_run_in_order_and_render_once_per_drain() -> None:
+    log: list[str] = []
+    queue = CommandQueue(on_drained=lambda: log.append("render"))
+
+    def first() -> None:
+        log.append("first")
+        assert queue.is_draining
+        queue.submit("second", lambda: log.append("second"))
+        log.append("first done")
+
+    queue.submit("first", first)
+
+    assert log == ["first", "first done", "second", "render"]
+    assert not queue.is_draining
+    assert queue.stats["first"].count == 1
+    assert queue.stats["second"].count == 1
+
+
+def test_failing_command_does_not_stop_the_queue() -> None:
+    log: list[str] = []
+    queue = CommandQueue()
+
+    def broken() -> None:
+        queue.submit("after", lambda: log.append("after"))
+        raise RuntimeError("boom")
+
+    queue.submit("broken", broken)
+
+    assert log == ["after"]
+    assert queue.stats["broken"].count == 1
+
+
+def test_concurrent_submitters_never_overlap() -> None:
+    queue = CommandQueue()
+    active = 0
+    overlaps = 0
+    counter = 0
+
+    def increment() -> None:
+        nonlocal active, overlaps, counter
+        active += 1
+        if active > 1:
+            overlaps += 1
+        value = counter
+        counter = value + 1
+        active -= 1
+
+    def worker() -> None:
+        for _ in range(500):
+            queue.submit("increment", increment)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert overlaps == 0
+    assert counter == 4000
+    assert queue.stats["increment"].count == 4000
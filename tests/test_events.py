@@ -0,0 +1,102 @@
+from werewolf_gm.domain import (
+    AdvancePhase,
+    DeathReason,
+    Game,
+    GamePhase,
+    KillEvent,
+    NightActionKind,
+    PhaseChangeEvent,
+    Role,
+    SetTarget,
+    TargetSetEvent,
+)
+
+
+def _build_sample_game() -> Game:
+    game = Game()
+    game.add_player("Wolf", Role.WEREWOLF)
+    game.add_player("Seer", Role.SEER)
+    game.add_player("Knight", Role.KNIGHT)
+    game.add_player("Alice", Role.CITIZEN)
+    game.add_player("Bob", Role.CITIZEN)
+    return game
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, tuple]] = []
+
+    def subscribe(self, game: Game):
+        return game.subscribe(
+            on_kill=lambda events: self.calls.append(("kill", tuple(events))),
+            on_phase_change=lambda events: self.calls.append(("phase", tuple(events))),
+            on_target_set=lambda events: self.calls.append(("target", tuple(events))),
+            on_victory=lambda events: self.calls.append(("victory", tuple(events))),
+        )
+
+
+def test_each_mutation_delivers_its_events() -> None:
+    game = _build_sample_game()
+    recorder = _Recorder()
+    recorder.subscribe(game)
+    wolf, seer, knight, alice, bob = (p.id for p in game.players)
+
+    game.start_game()
+    assert recorder.calls == [("phase", (PhaseChangeEvent(1, GamePhase.DAY, 0, GamePhase.NIGHT_SEER),))]
+
+    recorder.calls.clear()
+    game.set_seer_target(alice)
+    assert recorder.calls == [("target", (TargetSetEvent(NightActionKind.SEER, alice),))]
+
+    recorder.calls.clear()
+    game.kill_player(bob, DeathReason.EXECUTED)
+    assert recorder.calls == [("kill", (KillEvent(bob, DeathReason.EXECUTED, 0),))]
+
+
+def test_batch_delivers_once_per_kind() -> None:
+    game = _build_sample_game()
+    game.start_game()
+    recorder = _Recorder()
+    recorder.subscribe(game)
+    wolf, seer, knight, alice, bob = (p.id for p in game.players)
+
+    with game.batch():
+        game.kill_player(alice, DeathReason.EXECUTED)
+        game.kill_player(bob, DeathReason.EXECUTED)
+        game.kill_player(knight, DeathReason.EXECUTED)
+        assert recorder.calls == []
+
+    kinds = [kind for kind, _ in recorder.calls]
+    assert kinds == ["kill", "phase", "victory"]
+    assert [event.player_id for event in recorder.calls[0][1]] == [alice, bob, knight]
+    assert recorder.calls[1][1] == (PhaseChangeEvent(0, GamePhase.NIGHT_SEER, 0, GamePhase.FINISHED),)
+
+
+def test_failed_apply_delivers_nothing() -> None:
+    game = _build_sample_game()
+    game.start_game()
+    recorder = _Recorder()
+    recorder.subscribe(game)
+    wolf = game.players[0].id
+
+    try:
+        game.apply([SetTarget(NightActionKind.SEER, wolf), AdvancePhase(), SetTarget(NightActionKind.ATTACK, 999)])
+    except ValueError:
+        pass
+
+    assert recorder.calls == []
+
+
+def test_unobserved_games_and_forks_record_nothing() -> None:
+    game = _build_sample_game()
+    recorder = _Recorder()
+    subscription = recorder.subscribe(game)
+    fork = game.fork()
+    fork.start_game()
+    assert recorder.calls == []
+    assert fork._observers is None
+
+    subscription.cancel()
+    assert game._observers is None
+    game.start_game()
+    assert recorder.calls == []
@@ -0,0 +1,68 @@
+import random
+
+from werewolf_gm.domain import DeathReason, Game, GamePhase, Role, compute_fingerprint
+
+
+def _build_sample_game() -> Game:
+    game = Game()
+    game.add_player("Wolf", Role.WEREWOLF)
+    game.add_player("Madman", Role.MADMAN)
+    game.add_player("Seer", Role.SEER)
+    game.add_player("Medium", Role.MEDIUM)
+    game.add_player("Knight", Role.KNIGHT)
+    game.add_player("Citizen1", Role.CITIZEN)
+    game.add_player("Citizen2", Role.CITIZEN)
+    game.add_player("Wolf2", Role.WEREWOLF)
+    return game
+
+
+def test_fingerprint_matches_full_recompute_through_random_play() -> None:
+    rng = random.Random(20240601)
+    for _ in range(50):
+        game = _build_sample_game()
+        game.start_game()
+        assert game.fingerprint == compute_fingerprint(game)
+
+        for _ in range(40):
+            alive = game.alive_players()
+            action = rng.randrange(6)
+            if action == 0 and alive and game.phase is not GamePhase.FINISHED:
+                game.kill_player(rng.choice(alive).id, rng.choice(list(DeathReason)))
+            elif action == 1 and alive:
+                game.set_seer_target(rng.choice(alive).id)
+            elif action == 2 and alive:
+                game.set_guard_target(rng.choice(alive).id)
+            elif action == 3 and alive:
+                game.set_attack_target(rng.choice(alive).id)
+            elif action == 4:
+                game.revert_to_previous_night_phase()
+            else:
+                game.proceed_to_next_phase()
+
+            assert game.fingerprint == compute_fingerprint(game)
+
+
+def test_fingerprint_tracks_direct_field_assignment_and_removal() -> None:
+    game = _build_sample_game()
+    seer = next(p for p in game.players if p.role is Role.SEER)
+
+    game.phase = GamePhase.NIGHT_MEDIUM
+    game.day = 4
+    game.medium_target_id = seer.id
+    assert game.fingerprint == compute_fingerprint(game)
+
+    game.remove_player(seer.id)
+    assert game.medium_target_id is None
+    assert game.fingerprint == compute_fingerprint(game)
+
+
+def test_fingerprint_returns_to_previous_value_when_change_is_undone() -> None:
+    game = _build_sample_game()
+    citizen = next(p for p in game.players if p.name == "Citizen1")
+    before = game.fingerprint
+
+    game.set_attack_target(citizen.id)
+    assert game.fingerprint != before
+
+    game.attacked_player_id = None
+    assert game.fingerprint == before
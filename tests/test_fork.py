@@ -0,0 +1,75 @@
+from werewolf_gm.domain import DeathReason, Game, GameHistory, GamePhase, Role, compute_fingerprint
+
+
+def _build_sample_game() -> Game:
+    game = Game()
+    game.add_player("Wolf", Role.WEREWOLF)
+    game.add_player("Wolf2", Role.WEREWOLF)
+    game.add_player("Seer", Role.SEER)
+    game.add_player("Knight", Role.KNIGHT)
+    game.add_player("Alice", Role.CITIZEN)
+    game.add_player("Bob", Role.CITIZEN)
+    game.add_player("Carol", Role.CITIZEN)
+    return game
+
+
+def test_fork_shares_players_until_one_side_writes() -> None:
+    game = _build_sample_game()
+    fork = game.fork()
+
+    assert all(a is b for a, b in zip(game.players, fork.players))
+
+    alice_id = game.players[4].id
+    fork.kill_player(alice_id, DeathReason.ATTACKED)
+
+    assert game.get_player(alice_id).is_alive is True
+    assert fork.get_player(alice_id).is_alive is False
+    changed = [idx for idx, (a, b) in enumerate(zip(game.players, fork.players)) if a is not b]
+    assert changed == [4]
+
+
+def test_parent_writes_do_not_leak_into_fork() -> None:
+    game = _build_sample_game()
+    game.start_game()
+    fork = game.fork()
+
+    bob_id = game.players[5].id
+    game.kill_player(bob_id, DeathReason.EXECUTED)
+    game.proceed_to_next_phase()
+    game.rules.night_seconds = 10
+
+    assert fork.get_player(bob_id).is_alive is True
+    assert fork.last_executed_player_id is None
+    assert fork.phase is GamePhase.NIGHT_SEER
+    assert fork.rules.night_seconds == 90
+    assert fork.fingerprint == compute_fingerprint(fork)
+    assert game.fingerprint == compute_fingerprint(game)
+
+
+def test_history_branch_replays_what_if_from_any_point() -> None:
+    game = _build_sample_game()
+    game.start_game()
+    history = GameHistory(game)
+    alice_id = game.players[4].id
+    knight_id = game.players[3].id
+
+    for _ in range(6):
+        game.proceed_to_next_phase()
+    assert game.phase is GamePhase.NIGHT_KNIGHT
+    night_index = history.record()
+    game.set_guard_target(knight_id)
+    game.proceed_to_next_phase()
+    game.set_attack_target(alice_id)
+    game.proceed_to_next_phase()
+    assert game.get_player(alice_id).is_alive is False
+
+    what_if = history.branch(night_index)
+    assert what_if.phase is GamePhase.NIGHT_KNIGHT
+    what_if.set_guard_target(alice_id)
+    what_if.proceed_to_next_phase()
+    what_if.set_attack_target(alice_id)
+    what_if.proceed_to_next_phase()
+
+    assert what_if.get_player(alice_id).is_alive is True
+    assert history[night_index].snapshot.guard_target_id is None
+    assert history[0].phase is GamePhase.NIGHT_SEER
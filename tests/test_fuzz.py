@@ -0,0 +1,77 @@
+import pytest
+
+from werewolf_gm import domain, fuzz
+from werewolf_gm.domain import Game
+
+
+def test_fuzz_run_finds_no_violations() -> None:
+    stats = fuzz.fuzz(steps=5_000, seed=11)
+
+    assert stats.failures == []
+    assert stats.steps >= 5_000
+    assert stats.rejected > 0
+    assert stats.finished > 0
+
+
+def test_fuzz_cases_are_reproducible() -> None:
+    first = fuzz.fuzz(steps=2_000, seed=3)
+    second = fuzz.fuzz(steps=2_000, seed=3)
+
+    assert (first.steps, first.rejected, first.finished) == (second.steps, second.rejected, second.finished)
+
+
+def _kill_without_victory_check(game: Game, player_id: int, reason: domain.DeathReason) -> None:
+    # Running counts that never decide the game, as inside an apply() batch.
+    game._batch_alive = [1, 10**9]
+    try:
+        game.kill_player(player_id, reason)
+    finally:
+        game._batch_alive = None
+
+
+def test_injected_bug_is_shrunk_to_a_minimal_reproduction(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setitem(fuzz.OPERATIONS, "kill_player", _kill_without_victory_check)
+
+    stats = fuzz.fuzz(steps=50_000, seed=0)
+
+    [failure] = stats.failures
+    assert failure.invariant == "victory"
+    # Player ids are positional, so the adds before the killed player cannot be dropped.
+    assert len(failure.ops) <= 9 + 2
+    assert failure.ops[-1][0] == "kill_player"
+    with pytest.raises(fuzz.InvariantViolation):
+        fuzz.run_ops(failure.ops)
+    for idx in range(len(failure.ops)):
+        assert not fuzz._fails_with(failure.ops[:idx] + failure.ops[idx + 1 :], "victory")
+
+    monkeypatch.undo()
+    namespace = {name: getattr(domain, name) for name in domain.__all__}
+    exec(failure.reproduction(), namespace)
+    assert namespace["game"].victory.state is not domain.VictoryState.ONGOING
+
+
+def _apply_deciding_victory_at_the_end(game: Game, commands: tuple[domain.Command, ...]) -> None:
+    game._batch_alive = [1, 10**9]
+    try:
+        for command in commands:
+            game._apply_command(command)
+        game._flush_victory()
+    finally:
+        game._batch_alive = None
+
+
+def test_batch_that_differs_from_one_call_at_a_time_is_caught(monkeypatch: pytest.MonkeyPatch) -> None:
+    kills = tuple(domain.KillPlayer(player_id, domain.DeathReason.EXECUTED) for player_id in (1, 2, 0))
+    ops = [
+        ("add_player", ("Wolf", domain.Role.WEREWOLF)),
+        *(("add_player", (name, domain.Role.CITIZEN)) for name in "ABC"),
+        ("start_game", ()),
+        ("apply", (kills,)),
+    ]
+    fuzz.run_ops(ops)
+
+    monkeypatch.setitem(fuzz.OPERATIONS, "apply", _apply_deciding_victory_at_the_end)
+
+    with pytest.raises(fuzz.InvariantViolation) as caught:
+        fuzz.run_ops(ops)
+    assert caught.value.invariant == "apply_sequential"
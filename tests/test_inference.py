@@ -0,0 +1,153 @@
+import time
+from itertools import permutations
+
+from werewolf_gm.domain import (
+    DeathReason,
+    Game,
+    GamePhase,
+    KnownRole,
+    Role,
+    RoleClaim,
+    RoleReport,
+    infer_roles,
+)
+
+
+def _build_sample_game() -> Game:
+    game = Game()
+    game.add_player("Wolf", Role.WEREWOLF)
+    game.add_player("Madman", Role.MADMAN)
+    game.add_player("Seer", Role.SEER)
+    game.add_player("Knight", Role.KNIGHT)
+    game.add_player("Citizen1", Role.CITIZEN)
+    game.add_player("Citizen2", Role.CITIZEN)
+    return game
+
+
+def _brute_force(game: Game, observations: list) -> dict[tuple[str, Role], int]:
+    counts: dict[tuple[str, Role], int] = {}
+    roles = [player.role for player in game.players]
+    for assignment in set(permutations(roles)):
+        by_id = {player.id: role for player, role in zip(game.players, assignment)}
+        alive_wolves = sum(
+            1 for player in game.players if player.is_alive and by_id[player.id] is Role.WEREWOLF
+        )
+        alive_others = len(game.alive_players()) - alive_wolves
+        if not 0 < alive_wolves < alive_others:
+            continue
+        if any(
+            player.death_reason is DeathReason.ATTACKED and by_id[player.id] is Role.WEREWOLF
+            for player in game.players
+        ):
+            continue
+        consistent = True
+        for observation in observations:
+            if isinstance(observation, RoleClaim):
+                consistent = by_id[observation.player_id] in {observation.role, Role.WEREWOLF, Role.MADMAN}
+            elif isinstance(observation, RoleReport) and by_id[observation.speaker_id] is observation.role:
+                consistent = (by_id[observation.target_id] is Role.WEREWOLF) == observation.is_werewolf
+            if not consistent:
+                break
+        if not consistent:
+            continue
+        for player_id, role in by_id.items():
+            counts[(player_id, role)] = counts.get((player_id, role), 0) + 1
+    return counts
+
+
+def test_inference_matches_brute_force_enumeration() -> None:
+    game = _build_sample_game()
+    wolf, madman, seer, knight, citizen1, citizen2 = game.players
+    game.kill_player(citizen2.id, DeathReason.ATTACKED)
+
+    observations = [
+        RoleClaim(seer.id, Role.SEER),
+        RoleClaim(madman.id, Role.SEER),
+        RoleReport(seer.id, Role.SEER, wolf.id, True),
+        RoleReport(madman.id, Role.SEER, citizen1.id, True),
+    ]
+    marginals = infer_roles(game, observations, include_game_records=False)
+    expected = _brute_force(game, observations)
+    total = sum(count for (player_id, _), count in expected.items() if player_id == wolf.id)
+
+    assert marginals.assignments == total
+    for player in game.players:
+        for role in Role:
+            expected_probability = expected.get((player.id, role), 0) / total
+            assert abs(marginals.probability(player.id, role) - expected_probability) < 1e-9
+
+
+def test_inference_uses_recorded_seer_results_and_attacks() -> None:
+    game = _build_sample_game()
+    wolf = game.players[0]
+    citizen = game.players[4]
+    victim = game.players[5]
+
+    game.day = 1
+    game.phase = GamePhase.NIGHT_SEER
+    game.set_seer_target(wolf.id)
+    game.kill_player(victim.id, DeathReason.ATTACKED)
+    marginals = infer_roles(game, [KnownRole(game.players[2].id, Role.SEER)])
+
+    assert marginals.werewolf_probability(wolf.id) == 1.0
+    assert marginals.werewolf_probability(citizen.id) == 0.0
+    assert marginals.werewolf_probability(victim.id) == 0.0
+
+
+def test_inference_reports_inconsistent_observations() -> None:
+    game = _build_sample_game()
+    seer = game.players[2]
+    marginals = infer_roles(
+        game,
+        [KnownRole(seer.id, Role.SEER), RoleReport(seer.id, Role.SEER, seer.id, True)],
+        include_game_records=False,
+    )
+
+    assert marginals.is_consistent is False
+    assert marginals.by_player == {}
+
+
+def test_inference_is_fast_for_fifteen_players() -> None:
+    game = Game()
+    roles = [Role.WEREWOLF] * 3 + [Role.MADMAN, Role.SEER, Role.MEDIUM, Role.KNIGHT] + [Role.CITIZEN] * 8
+    for idx, role in enumerate(roles):
+        game.add_player(f"P{idx}", role)
+    players = game.players
+    observations = [
+        RoleClaim(players[4].id, Role.SEER),
+        RoleClaim(players[3].id, Role.SEER),
+        RoleClaim(players[5].id, Role.MEDIUM),
+        RoleReport(players[4].id, Role.SEER, players[0].id, True),
+        RoleReport(players[4].id, Role.SEER, players[8].id, False),
+        RoleReport(players[3].id, Role.SEER, players[9].id, True),
+        RoleReport(players[5].id, Role.MEDIUM, players[10].id, False),
+    ]
+    game.kill_player(players[10].id, DeathReason.EXECUTED)
+    game.kill_player(players[11].id, DeathReason.ATTACKED)
+
+    started = time.perf_counter()
+    marginals = infer_roles(game, observations)
+    elapsed = time.perf_counter() - started
+
+    assert marginals.is_consistent
+    assert abs(sum(marginals.by_player[players[0].id].values()) - 1.0) < 1e-9
+    assert elapsed < 0.25
+
+
+def test_dashboard_estimates_are_cached_until_the_game_changes(monkeypatch) -> None:
+    from werewolf_gm.simulation import simulate_game
+    from werewolf_gm.ui import state as state_module
+    from werewolf_gm.ui.state import INFERENCE_MAX_PLAYERS, AppState
+
+    calls = []
+    monkeypatch.setattr(state_module, "infer_roles", lambda game: calls.append(game) or infer_roles(game))
+    app_state = AppState(game=simulate_game(9, seed=1, max_days=1).game)
+
+    first = app_state.role_marginals()
+    assert app_state.role_marginals() is first
+    app_state.game.set_seer_target(app_state.game.alive_players()[0].id)
+    assert app_state.role_marginals() is not first
+    assert len(calls) == 2
+
+    app_state.game = simulate_game(INFERENCE_MAX_PLAYERS + 1, seed=1, max_days=1).game
+    assert app_state.role_marginals() is None
@@ -0,0 +1,47 @@
+import random
+from types import SimpleNamespace
+
+from werewolf_gm.bench.ui import FakePage, scenario_steps
+from werewolf_gm.ui.app import WerewolfApp
+from werewolf_gm.ui.instrumentation import MS_BOUNDS, Histogram, Instrumentation
+from werewolf_gm.ui.tabs import GameTab
+
+
+def test_histogram_buckets_and_percentiles() -> None:
+    histogram = Histogram(MS_BOUNDS)
+    for value in (0.05, 0.3, 0.3, 4.0, 2000.0):
+        histogram.record(value)
+
+    assert histogram.count == 5
+    assert histogram.max == 2000.0
+    assert histogram.percentile(50) == 0.5
+    assert histogram.percentile(99) == 2000.0
+    assert histogram.to_dict()["buckets"] == {"0.1": 1, "0.5": 2, "5.0": 1, "inf": 1}
+
+
+def test_instrumentation_is_off_by_default(monkeypatch) -> None:
+    monkeypatch.delenv("WEREWOLF_GM_INSTRUMENT", raising=False)
+
+    assert WerewolfApp(FakePage()).instrumentation is None
+
+
+def test_instrumented_game_records_handlers_paints_and_views() -> None:
+    instrumentation = Instrumentation()
+    page = FakePage()
+    app = WerewolfApp(page, instrumentation=instrumentation)
+    steps = scenario_steps(app, 5, random.Random(0))
+    for name, action in steps:
+        action()
+        if name == "start_game":
+            break
+
+    app._on_next_phase(None)
+
+    assert instrumentation.timings["handler _on_add_player"].count == 5
+    assert instrumentation.timings["paint _on_next_phase"].count == 1
+    assert instrumentation.counts["updates _on_next_phase"].max == 1
+    assert instrumentation.counts["controls /game"].mean > 10
+    assert instrumentation.timings["page.update"].count == page.update_count
+
+    app._on_navigation_change(SimpleNamespace(control=SimpleNamespace(selected_index=GameTab.LOG.value)))
+    assert "handler _on_next_phase" in app._debug_report()
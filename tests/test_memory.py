@@ -0,0 +1,29 @@
+from werewolf_gm.bench.memory import profile_session_memory
+from werewolf_gm.ui.state import AppState
+
+_kept_games: list = []
+
+
+def test_session_memory_is_flat_after_reset_game() -> None:
+    report = profile_session_memory(8, players=5, warmup_games=3, seed=4)
+
+    assert len(report.retained_kib) == 8
+    assert report.session_kib > 0
+    assert not report.is_leaking(), report.format()
+
+
+def test_leak_is_detected_and_located(monkeypatch) -> None:
+    reset_game = AppState.reset_game
+
+    def leaky_reset_game(self: AppState) -> None:
+        _kept_games.append(self.game)
+        reset_game(self)
+
+    monkeypatch.setattr(AppState, "reset_game", leaky_reset_game)
+    try:
+        report = profile_session_memory(8, players=5, warmup_games=3, seed=4)
+    finally:
+        _kept_games.clear()
+
+    assert report.is_leaking(), report.format()
+    assert any("domain" in site for site in report.top_sites)
@@ -0,0 +1,111 @@
+import pytest
+
+from werewolf_gm.domain import (
+    Game,
+    GamePhase,
+    NightAction,
+    NightActionKind,
+    Role,
+    compute_fingerprint,
+    resolve_night,
+)
+
+GUARD = NightActionKind.GUARD
+ATTACK = NightActionKind.ATTACK
+
+
+def _build_sample_game() -> Game:
+    game = Game()
+    game.add_player("Wolf1", Role.WEREWOLF)
+    game.add_player("Wolf2", Role.WEREWOLF)
+    game.add_player("Wolf3", Role.WEREWOLF)
+    game.add_player("Knight1", Role.KNIGHT)
+    game.add_player("Knight2", Role.KNIGHT)
+    for idx in range(6):
+        game.add_player(f"Citizen{idx}", Role.CITIZEN)
+    return game
+
+
+def _game_at_werewolf_phase() -> Game:
+    game = _build_sample_game()
+    game.start_game()
+    while (game.day, game.phase) != (1, GamePhase.NIGHT_WEREWOLF):
+        game.proceed_to_next_phase()
+    return game
+
+
+def test_resolve_night_is_independent_of_submission_order() -> None:
+    actions = [
+        NightAction(ATTACK, 7, actor_id=0),
+        NightAction(ATTACK, 6, actor_id=1),
+        NightAction(GUARD, 5, actor_id=3),
+        NightAction(ATTACK, 6, actor_id=2),
+        NightAction(ATTACK, 7, actor_id=9),
+    ]
+    expected = resolve_night(actions, is_alive=lambda _: True)
+
+    assert expected.attack_target_id == 6
+    assert expected.victim_ids == (6,)
+    assert resolve_night(reversed(actions), is_alive=lambda _: True) == expected
+
+
+def test_guard_before_attack_and_pack_decision_wins() -> None:
+    actions = [
+        NightAction(ATTACK, 6, actor_id=0),
+        NightAction(ATTACK, 6, actor_id=1),
+        NightAction(ATTACK, 7),
+        NightAction(GUARD, 7, actor_id=3),
+    ]
+    result = resolve_night(actions, is_alive=lambda _: True)
+
+    assert result.attack_target_id == 7
+    assert result.victim_ids == ()
+    assert result.protected_ids == (7,)
+
+
+def test_game_resolves_multiple_wolves_and_knights() -> None:
+    game = _game_at_werewolf_phase()
+    wolf1, wolf2, wolf3, knight1, knight2, c0, c1, *_ = (p.id for p in game.players)
+
+    game.submit_night_action(GUARD, knight1, c0)
+    game.submit_night_action(GUARD, knight2, c1)
+    game.submit_night_action(ATTACK, wolf1, c0)
+    game.submit_night_action(ATTACK, wolf2, c1)
+    game.submit_night_action(ATTACK, wolf3, c1)
+    game.submit_night_action(ATTACK, wolf1, c1)
+    assert game.fingerprint == compute_fingerprint(game)
+
+    game.proceed_to_next_phase()
+
+    assert game.last_night_resolution.guarded_ids == {c0, c1}
+    assert game.last_attack_target_id == c1
+    assert game.last_night_victim_id is None
+    assert game.night_actions == {}
+    assert game.fingerprint == compute_fingerprint(game)
+
+
+def test_submit_night_action_validates_actor_and_target() -> None:
+    game = _game_at_werewolf_phase()
+    wolf1, wolf2, wolf3, knight1, knight2, c0, *_ = (p.id for p in game.players)
+
+    with pytest.raises(ValueError):
+        game.submit_night_action(ATTACK, c0, knight1)
+    with pytest.raises(ValueError):
+        game.submit_night_action(ATTACK, wolf1, wolf2)
+    with pytest.raises(ValueError):
+        game.submit_night_action(GUARD, knight1, knight2)
+    with pytest.raises(ValueError):
+        game.submit_night_action(NightActionKind.SEER, knight1, c0)
+
+
+def test_revert_discards_submitted_attacks() -> None:
+    game = _game_at_werewolf_phase()
+    wolf1, *_ = (p.id for p in game.players)
+    before = game.fingerprint
+
+    game.submit_night_action(ATTACK, wolf1, game.players[5].id)
+    game.revert_to_previous_night_phase()
+    game.proceed_to_next_phase()
+
+    assert game.night_actions == {}
+    assert game.fingerprint == before
@@ -0,0 +1,90 @@
+import pytest
+
+from werewolf_gm.domain import DeathReason, Game, GamePhase, NightActionKind, Role
+
+
+def _build_sample_game() -> Game:
+    game = Game()
+    game.add_player("Wolf", Role.WEREWOLF)
+    game.add_player("Seer", Role.SEER)
+    game.add_player("Medium", Role.MEDIUM)
+    game.add_player("Knight", Role.KNIGHT)
+    game.add_player("Alice", Role.CITIZEN)
+    game.add_player("Bob", Role.CITIZEN)
+    game.add_player("Carol", Role.CITIZEN)
+    return game
+
+
+def _game_at_day_one_night() -> Game:
+    game = _build_sample_game()
+    game.start_game()
+    while game.phase is not GamePhase.VOTING:
+        game.proceed_to_next_phase()
+    game.kill_player(game.players[5].id, DeathReason.EXECUTED)
+    game.proceed_to_next_phase()
+    assert (game.day, game.phase) == (1, GamePhase.NIGHT_SEER)
+    return game
+
+
+def test_night_batch_matches_sequential_entry() -> None:
+    batched = _game_at_day_one_night()
+    sequential = batched.fork()
+    wolf, seer, medium, knight, alice, bob, carol = (p.id for p in batched.players)
+
+    batched.resolve_night_batch(
+        {
+            NightActionKind.SEER: wolf,
+            NightActionKind.MEDIUM: bob,
+            NightActionKind.GUARD: alice,
+            NightActionKind.ATTACK: carol,
+        }
+    )
+
+    sequential.set_seer_target(wolf)
+    sequential.proceed_to_next_phase()
+    sequential.set_medium_target(bob)
+    sequential.proceed_to_next_phase()
+    sequential.set_guard_target(alice)
+    sequential.proceed_to_next_phase()
+    sequential.set_attack_target(carol)
+    sequential.proceed_to_next_phase()
+
+    assert (batched.day, batched.phase) == (2, GamePhase.DAY)
+    assert batched.last_night_victim_id == carol
+    assert batched.fingerprint == sequential.fingerprint
+    assert batched.divinations == sequential.divinations
+
+
+def test_night_batch_rejects_illegal_target_without_changes() -> None:
+    game = _game_at_day_one_night()
+    wolf, seer, medium, knight, alice, bob, carol = (p.id for p in game.players)
+    before = game.fingerprint
+
+    with pytest.raises(ValueError, match="medium"):
+        game.resolve_night_batch({NightActionKind.SEER: wolf, NightActionKind.MEDIUM: alice})
+
+    assert game.fingerprint == before
+    assert game.divinations == []
+    assert game.phase is GamePhase.NIGHT_SEER
+
+
+def test_night_batch_on_day_zero_only_uses_seer() -> None:
+    game = _build_sample_game()
+    game.start_game()
+    wolf = game.players[0].id
+
+    with pytest.raises(ValueError, match="attack"):
+        game.resolve_night_batch({NightActionKind.SEER: wolf, NightActionKind.ATTACK: wolf})
+    game.resolve_night_batch({NightActionKind.SEER: wolf})
+
+    assert (game.day, game.phase) == (1, GamePhase.DAY)
+    assert [d.target_id for d in game.divinations] == [wolf]
+    assert all(player.is_alive for player in game.players)
+
+
+def test_night_batch_requires_start_of_night() -> None:
+    game = _game_at_day_one_night()
+    game.proceed_to_next_phase()
+
+    with pytest.raises(ValueError):
+        game.resolve_night_batch({})
@@ -0,0 +1,54 @@
+import pytest
+
+from werewolf_gm.domain import Game, GamePhase, Player, Role
+
+
+def test_add_player_assigns_dense_integer_ids() -> None:
+    game = Game()
+    ids = [game.add_player(name, Role.CITIZEN).id for name in ("A", "B", "C")]
+
+    assert ids == [0, 1, 2]
+
+
+def test_removed_ids_are_not_reused() -> None:
+    game = Game()
+    a = game.add_player("A", Role.CITIZEN)
+    game.add_player("B", Role.CITIZEN)
+    game.remove_player(a.id)
+
+    assert game.add_player("C", Role.CITIZEN).id == 2
+
+
+def test_players_passed_to_constructor_get_ids() -> None:
+    game = Game(players=[Player("A", Role.CITIZEN), Player("B", Role.WEREWOLF, id=5)])
+
+    assert [p.id for p in game.players] == [6, 5]
+    assert game.add_player("C", Role.CITIZEN).id == 7
+
+
+def test_external_id_round_trip() -> None:
+    game = Game()
+    player = game.add_player("A", Role.CITIZEN)
+
+    assert game.external_id(player.id) == "p0"
+    assert game.resolve_external_id("p0") == player.id
+    with pytest.raises(ValueError):
+        game.resolve_external_id("p9")
+    with pytest.raises(ValueError):
+        game.resolve_external_id("0")
+
+
+def test_player_with_id_zero_can_be_attacked() -> None:
+    game = Game()
+    first = game.add_player("First", Role.CITIZEN)
+    game.add_player("Wolf", Role.WEREWOLF)
+    game.add_player("Second", Role.CITIZEN)
+    game.add_player("Third", Role.CITIZEN)
+    game.phase = GamePhase.NIGHT_WEREWOLF
+
+    game.set_attack_target(first.id)
+    game.proceed_to_next_phase()
+
+    assert first.id == 0
+    assert game.last_night_victim_id == 0
+    assert game.get_player(0).is_alive is False
@@ -0,0 +1,37 @@
+from werewolf_gm.ui.components import PlayerNameIndex, PlayerPicker
+
+
+def test_name_index_returns_prefix_matches_in_name_order() -> None:
+    index = PlayerNameIndex([(0, "bob"), (1, "Alice"), (2, "alfred"), (3, "Carol")])
+
+    matches, total = index.search("AL", limit=10)
+
+    assert matches == [(2, "alfred"), (1, "Alice")]
+    assert total == 2
+
+
+def test_name_index_caps_results_but_reports_total() -> None:
+    index = PlayerNameIndex([(idx, f"Player{idx:03d}") for idx in range(500)])
+
+    matches, total = index.search("player1", limit=8)
+
+    assert len(matches) == 8
+    assert matches[0] == (100, "Player100")
+    assert total == 100
+    assert index.search("", limit=3)[1] == 500
+    assert index.search("zzz", limit=3) == ([], 0)
+
+
+def test_picker_filters_without_page_and_selects_unique_match() -> None:
+    picker = PlayerPicker(
+        label="対象",
+        candidates=[(idx, f"P{idx}") for idx in range(60)],
+        selected_id=0,
+        max_results=5,
+    )
+    assert len(picker._results.controls) == 1 + 5 + 1
+
+    picker.filter("P59")
+
+    assert picker.selected_id == 59
+    assert len(picker._results.controls) == 2
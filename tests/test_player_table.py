@@ -0,0 +1,89 @@
+import random
+
+from werewolf_gm.domain import DeathReason, Game, GamePhase, Role, compute_fingerprint
+from werewolf_gm.ui.state import PLAYER_TABLE_THRESHOLD, AppState
+
+ROLES = [Role.WEREWOLF, Role.MADMAN, Role.SEER, Role.MEDIUM, Role.KNIGHT, Role.CITIZEN]
+
+
+def _build_large_game(count: int) -> Game:
+    game = Game()
+    for idx in range(count):
+        role = Role.WEREWOLF if idx % 6 == 0 else ROLES[1 + idx % 5]
+        game.add_player(f"P{idx}", role)
+    return game
+
+
+def _snapshot(game: Game) -> list[tuple]:
+    return [(p.id, p.name, p.role, p.is_alive, p.death_reason, p.death_day) for p in game.players]
+
+
+def test_player_table_behaves_like_player_list() -> None:
+    rng = random.Random(7)
+    listed = _build_large_game(120)
+    tabled = listed.fork()
+    tabled.use_player_table()
+    assert tabled.uses_player_table
+    assert tabled.fingerprint == listed.fingerprint == compute_fingerprint(tabled)
+
+    for game in (listed, tabled):
+        game.start_game()
+
+    for _ in range(300):
+        alive = listed.alive_players()
+        choice = rng.randrange(4)
+        if choice == 0 and len(alive) > 2:
+            target = rng.choice(alive).id
+            reason = rng.choice(list(DeathReason))
+            listed.kill_player(target, reason)
+            tabled.kill_player(target, reason)
+        elif choice == 1 and alive:
+            target = rng.choice(alive).id
+            listed.set_attack_target(target)
+            tabled.set_attack_target(target)
+        else:
+            listed.proceed_to_next_phase()
+            tabled.proceed_to_next_phase()
+
+        assert _snapshot(tabled) == _snapshot(listed)
+        assert tabled.fingerprint == listed.fingerprint == compute_fingerprint(tabled)
+        assert tabled.victory == listed.victory
+        for role in Role:
+            assert [p.id for p in tabled.alive_players_by_role(role)] == [
+                p.id for p in listed.alive_players_by_role(role)
+            ]
+            assert [p.id for p in tabled.alive_players_except_role(role)] == [
+                p.id for p in listed.alive_players_except_role(role)
+            ]
+            assert tabled.has_alive_role(role) == listed.has_alive_role(role)
+        if listed.phase is GamePhase.FINISHED:
+            break
+
+
+def test_player_table_add_remove_and_fork() -> None:
+    game = _build_large_game(5)
+    game.use_player_table()
+    removed = game.players[1]
+    removed_id = removed.id
+    game.remove_player(removed_id)
+    added = game.add_player("Late", Role.CITIZEN)
+
+    assert [p.name for p in game.players] == ["P0", "P2", "P3", "P4", "Late"]
+    assert game.get_player(added.id).name == "Late"
+    assert game.fingerprint == compute_fingerprint(game)
+
+    fork = game.fork()
+    fork.kill_player(added.id, DeathReason.OTHER)
+
+    assert game.get_player(added.id).is_alive is True
+    assert fork.get_player(added.id).is_alive is False
+    assert len(fork.alive_players()) == len(game.alive_players()) - 1
+
+
+def test_app_state_switches_large_lobbies_to_player_table() -> None:
+    state = AppState()
+    state.game = _build_large_game(PLAYER_TABLE_THRESHOLD)
+
+    state.prepare_game_backend()
+
+    assert state.game.uses_player_table
@@ -0,0 +1,168 @@
+import random
+from dataclasses import replace
+from pathlib import Path
+
+import flet as ft
+
+from werewolf_gm import ratings
+from werewolf_gm.archive import ArchivedGame, archive_path, write_games
+from werewolf_gm.bench.ui import ScenarioDriver, scenario_steps
+from werewolf_gm.cli import main
+from werewolf_gm.domain import Role, Team, VictoryState
+from werewolf_gm.ratings import INITIAL_RATING, RatingIndex, load_index, rebuild_index, refresh_index
+from werewolf_gm.simulation import simulate_game
+
+JANUARY = 1_704_067_200 + 86_400 * 10
+FEBRUARY = JANUARY + 86_400 * 31
+
+
+def _finished_games(count: int, start: int = 0) -> list[ArchivedGame]:
+    return [
+        ArchivedGame.of(simulate_game(5 + seed % 6, seed=seed).game, JANUARY + seed)
+        for seed in range(start, start + count)
+    ]
+
+
+def _game(victory: VictoryState) -> ArchivedGame:
+    return replace(
+        ArchivedGame.of(simulate_game(5, seed=0).game, JANUARY),
+        names=("Wolf", "Seer", "A", "B", "C"),
+        roles=(Role.WEREWOLF, Role.SEER, Role.CITIZEN, Role.CITIZEN, Role.CITIZEN),
+        victory=victory,
+    )
+
+
+def test_winners_gain_and_records_split_by_role_and_team() -> None:
+    index = RatingIndex()
+
+    index.add_game(_game(VictoryState.WEREWOLF_WIN))
+    index.add_game(_game(VictoryState.VILLAGER_WIN))
+    index.add_game(_game(VictoryState.WEREWOLF_WIN))
+
+    wolf = index.profile(" wolf ")
+    seer = index.profile("Seer")
+    assert wolf is not None and seer is not None
+    assert (wolf.games, wolf.wins) == (3, 2)
+    assert wolf.rating > INITIAL_RATING > seer.rating
+    assert wolf.team_win_rate(Team.WEREWOLF) == 2 / 3
+    assert seer.roles == {Role.SEER: [3, 1]}
+    assert seer.team_win_rate(Team.WEREWOLF) is None
+    assert index.leaderboard(1) == [wolf]
+
+
+def test_ongoing_games_are_not_rated() -> None:
+    index = RatingIndex()
+
+    index.add_game(_game(VictoryState.ONGOING))
+
+    assert index.players == {}
+    assert index.games == 0
+
+
+def test_incremental_refresh_matches_a_full_rebuild(tmp_path: Path) -> None:
+    games = _finished_games(40)
+    write_games(archive_path(tmp_path, JANUARY), games[:15])
+    refresh_index(tmp_path)
+    write_games(archive_path(tmp_path, JANUARY), games[15:30])
+    write_games(archive_path(tmp_path, FEBRUARY), games[30:])
+
+    refreshed = refresh_index(tmp_path)
+
+    assert refreshed.sources == {"2024-01.wga": 30, "2024-02.wga": 10}
+    assert load_index(tmp_path) == refreshed
+    assert rebuild_index(tmp_path) == refreshed
+
+
+def test_replaced_archive_file_triggers_a_rebuild(tmp_path: Path) -> None:
+    path = archive_path(tmp_path, JANUARY)
+    write_games(path, _finished_games(20))
+    refresh_index(tmp_path)
+    path.unlink()
+    write_games(path, _finished_games(5, start=100))
+
+    index = refresh_index(tmp_path)
+
+    assert index.games == 5
+    assert index.sources == {"2024-01.wga": 5}
+
+
+def test_setup_rows_show_archived_profiles(tmp_path: Path) -> None:
+    first = ScenarioDriver(7)
+    first.app.archive_dir = tmp_path
+    for name, action in scenario_steps(first.app, 7, random.Random(3)):
+        first.interact(name, action)
+    assert load_index(tmp_path).games == 1
+
+    second = ScenarioDriver(7)
+    second.app.archive_dir = tmp_path
+    for name, action in scenario_steps(second.app, 7, random.Random(3)):
+        if name == "start_game":
+            break
+        second.interact(name, action)
+
+    texts = [control.value for control in _walk(second.page.views[-1]) if isinstance(control, ft.Text)]
+    assert sum(str(text).startswith("レート 1") for text in texts) == 7
+
+
+def _walk(control: ft.Control):
+    yield control
+    for attribute in ("controls", "content"):
+        children = getattr(control, attribute, None)
+        if isinstance(children, ft.Control):
+            yield from _walk(children)
+        elif isinstance(children, list):
+            for child in children:
+                yield from _walk(child)
+
+
+def test_ratings_command_prints_leaderboard_and_profile(tmp_path: Path, capsys) -> None:
+    write_games(archive_path(tmp_path, JANUARY), [_game(VictoryState.WEREWOLF_WIN)])
+
+    assert main(["ratings", "--dir", str(tmp_path), "--top", "3"]) == 0
+    assert main(["ratings", "--dir", str(tmp_path), "--player", "wolf"]) == 0
+    assert main(["ratings", "--dir", str(tmp_path), "--player", "Nobody"]) == 1
+
+    out = capsys.readouterr().out
+    assert "1 rated games, 5 players" in out
+    assert "  1. Wolf" in out
+    assert "role werewolf: 1/1 (100%)" in out
+
+
+def _play_one_game(archive_dir: Path, seed: int) -> ScenarioDriver:
+    driver = ScenarioDriver(7)
+    driver.app.archive_dir = archive_dir
+    for name, action in scenario_steps(driver.app, 7, random.Random(seed)):
+        driver.interact(name, action)
+    return driver
+
+
+def test_app_counts_finished_games_without_rereading_the_archive(tmp_path: Path, monkeypatch) -> None:
+    _play_one_game(tmp_path, 1)
+    driver = ScenarioDriver(7)
+    driver.app.archive_dir = tmp_path
+    steps = scenario_steps(driver.app, 7, random.Random(2))
+    for name, action in steps:
+        driver.interact(name, action)
+        if name == "start_game":
+            break
+
+    def fail(*_):
+        raise AssertionError("archive reread after a game")
+
+    monkeypatch.setattr(ratings, "open_archives", fail)
+    for name, action in steps:
+        driver.interact(name, action)
+    monkeypatch.undo()
+
+    assert load_index(tmp_path) == rebuild_index(tmp_path)
+    assert load_index(tmp_path).sources == {path.name: 2 for path in tmp_path.glob("*.wga")}
+
+
+def test_corrupt_index_is_rebuilt_from_the_archive(tmp_path: Path) -> None:
+    _play_one_game(tmp_path, 1)
+    (tmp_path / "ratings.json").write_text("{not json", encoding="utf-8")
+
+    driver = _play_one_game(tmp_path, 2)
+
+    assert driver.page.route == "/setup"
+    assert load_index(tmp_path).games == 2
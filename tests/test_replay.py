@@ -0,0 +1,108 @@
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from werewolf_gm.bench.corpus import replay_corpus
+from werewolf_gm.bench.ui import run_ui_scenario
+from werewolf_gm.cli import main
+from werewolf_gm.domain import AdvancePhase, Game, GamePhase, NightActionKind, RevertPhase, Role, SetTarget
+from werewolf_gm.replay import (
+    CORPUS_ENV,
+    GameOutcome,
+    GameRecord,
+    append_to_corpus,
+    load_corpus,
+    replay,
+)
+from werewolf_gm.simulation import simulate_game
+
+CORPUS = Path(__file__).resolve().parents[1] / "benchmarks" / "corpus.jsonl"
+
+
+def test_committed_corpus_replays_to_recorded_outcomes() -> None:
+    records = list(load_corpus(CORPUS))
+
+    for use_player_table in (False, True):
+        report = replay_corpus(records, use_player_table=use_player_table)
+        assert report.mismatches == []
+        assert report.unchecked == 0
+        assert report.games == len(records)
+
+
+def test_record_round_trip_keeps_seed_times_outcome_and_reverts(tmp_path: Path) -> None:
+    record = GameRecord(
+        players=[("Wolf", Role.WEREWOLF), ("Seer", Role.SEER), ("A", Role.CITIZEN), ("B", Role.CITIZEN)],
+        seed=5,
+        started_at=1_000.0,
+    )
+    record.add([SetTarget(NightActionKind.SEER, 0), RevertPhase()], at=1_001.25)
+    record.add([SetTarget(NightActionKind.SEER, 2), AdvancePhase()], at=1_002.5)
+    record.finish(replay(record))
+    path = tmp_path / "corpus.jsonl"
+
+    append_to_corpus(record, path)
+    append_to_corpus(record, path)
+
+    loaded = list(load_corpus(path))
+    assert loaded == [record, record]
+    assert loaded[0].times == [1.25, 1.25, 2.5, 2.5]
+    assert replay(loaded[0]).divinations[-1].target_id == 2
+
+
+def test_changed_outcome_is_reported_as_a_mismatch() -> None:
+    record = simulate_game(7, seed=2).record
+    assert record.outcome is not None
+    changed = replace(record, outcome=replace(record.outcome, day=record.outcome.day + 1))
+    unchecked = replace(record, outcome=None)
+
+    report = replay_corpus([record, changed, unchecked])
+
+    assert report.unchecked == 1
+    [mismatch] = report.mismatches
+    assert mismatch.startswith("#1 (seed 2)")
+    assert GameOutcome.of(replay(record)) == record.outcome
+
+
+def test_ui_games_are_recorded_to_the_env_corpus(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "ui.jsonl"
+    monkeypatch.setenv(CORPUS_ENV, str(path))
+
+    run_ui_scenario(9, seed=1)
+
+    [record] = load_corpus(path)
+    assert record.started_at is not None
+    assert len(record.times) == len(record.commands)
+    assert record.outcome is not None and record.outcome.phase is GamePhase.FINISHED
+    assert replay_corpus([record]).mismatches == []
+
+
+def test_simulate_corpus_command_round_trip(tmp_path: Path, capsys) -> None:
+    path = tmp_path / "sim.jsonl"
+
+    assert main(["simulate", "--games", "4", "--seed", "1", "--corpus", str(path)]) == 0
+    capsys.readouterr()
+    assert main(["bench", "corpus", str(path)]) == 0
+
+    assert "games: 4" in capsys.readouterr().out
+    assert [record.seed for record in load_corpus(path)] == [1, 2, 3, 4]
+
+
+def test_game_recorded_after_a_removal_replays_with_its_player_ids() -> None:
+    game = Game()
+    for name, role in zip("ABCDEF", [Role.WEREWOLF, Role.CITIZEN, Role.SEER, Role.CITIZEN, Role.KNIGHT, Role.CITIZEN]):
+        game.add_player(name, role)
+    game.remove_player(1)
+    game.start_game()
+    record = GameRecord.from_game(game)
+    commands = [SetTarget(NightActionKind.SEER, 5), AdvancePhase()]
+    game.apply(commands)
+    record.add(commands)
+    record.finish(game)
+
+    loaded = GameRecord.from_dict(record.to_dict())
+
+    assert loaded.player_ids == [0, 2, 3, 4, 5]
+    replayed = replay(loaded)
+    assert replayed.divinations[-1].target_id == 5
+    assert GameOutcome.of(replayed) == record.outcome
@@ -0,0 +1,71 @@
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+from werewolf_gm.ui.shell import AppShell
+from werewolf_gm.ui.startup import StartupTimer
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+
+
+class _FakePage:
+    def __init__(self) -> None:
+        self.window = SimpleNamespace()
+        self.views: list = []
+        self.route = "/"
+        self.on_route_change = None
+        self.update_count = 0
+
+    def update(self) -> None:
+        self.update_count += 1
+
+    def go(self, route: str) -> None:
+        self.route = route
+        self.on_route_change(SimpleNamespace(route=route))
+
+
+def test_startup_timer_keeps_first_mark() -> None:
+    now = iter([0.0, 0.010, 0.025, 0.030])
+    timer = StartupTimer(clock=lambda: next(now))
+
+    assert timer.mark("imports") == 0.010
+    assert timer.mark("first_frame") == 0.025
+    assert timer.mark("imports") == 0.010
+
+    assert list(timer.offsets_ms()) == ["imports", "first_frame"]
+    assert "first_frame=25.0ms (+15.0)" in timer.report()
+
+
+def test_shell_first_frame_does_not_load_game_modules() -> None:
+    code = (
+        "import sys\n"
+        "import werewolf_gm.ui.shell\n"
+        "print(any(name.startswith(('werewolf_gm.domain', 'werewolf_gm.ui.views', 'werewolf_gm.ui.app'))"
+        " for name in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, env={"PYTHONPATH": str(SRC)}
+    )
+    assert result.stdout.strip() == "False"
+
+
+def test_shell_loads_app_on_first_navigation() -> None:
+    page = _FakePage()
+    timer = StartupTimer()
+    shell = AppShell(page, timer=timer)
+    shell.start()
+
+    assert page.views == [shell.home_view]
+    assert page.title == "Werewolf GM Support"
+    assert shell.app is None
+    assert "first_frame" in timer.offsets_ms()
+
+    page.go("/setup")
+
+    assert shell.app is not None
+    assert page.views[-1].route == "/setup"
+    assert "game_modules_loaded" in timer.offsets_ms()
+
+    page.go("/")
+    assert page.views == [shell.home_view]
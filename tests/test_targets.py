@@ -0,0 +1,81 @@
+from werewolf_gm.domain import DeathReason, FirstDaySeerRule, Game, GamePhase, Role
+
+
+def _build_sample_game() -> Game:
+    game = Game()
+    game.add_player("Wolf", Role.WEREWOLF)
+    game.add_player("Seer", Role.SEER)
+    game.add_player("Medium", Role.MEDIUM)
+    game.add_player("Knight", Role.KNIGHT)
+    game.add_player("Alice", Role.CITIZEN)
+    game.add_player("Bob", Role.CITIZEN)
+    return game
+
+
+def _names(game: Game) -> list[str]:
+    return [player.name for player in game.target_candidates().players]
+
+
+def test_candidates_exclude_acting_role_and_dead_players() -> None:
+    game = _build_sample_game()
+    game.day = 1
+    game.phase = GamePhase.NIGHT_KNIGHT
+    assert _names(game) == ["Wolf", "Seer", "Medium", "Alice", "Bob"]
+
+    bob = game.players[5]
+    game.kill_player(bob.id, DeathReason.EXECUTED)
+    assert _names(game) == ["Wolf", "Seer", "Medium", "Alice"]
+    assert game.is_legal_target(bob.id) is False
+
+    game.phase = GamePhase.NIGHT_WEREWOLF
+    assert _names(game) == ["Seer", "Medium", "Knight", "Alice"]
+
+
+def test_medium_candidates_are_todays_executed_player() -> None:
+    game = _build_sample_game()
+    game.day = 2
+    game.phase = GamePhase.NIGHT_MEDIUM
+    assert _names(game) == []
+
+    alice = game.players[4]
+    game.kill_player(alice.id, DeathReason.EXECUTED)
+
+    assert _names(game) == ["Alice"]
+    assert game.is_legal_target(alice.id)
+
+
+def test_day_zero_rules() -> None:
+    game = _build_sample_game()
+    game.rules.first_day_seer = FirstDaySeerRule.NONE
+    game.start_game()
+    assert _names(game) == []
+
+    game.rules.first_day_seer = FirstDaySeerRule.FREE_SELECT
+    assert _names(game) == ["Wolf", "Medium", "Knight", "Alice", "Bob"]
+
+    game.proceed_to_next_phase()
+    assert game.phase is GamePhase.NIGHT_WEREWOLF
+    assert _names(game) == []
+
+
+def test_candidates_are_cached_until_state_changes() -> None:
+    game = _build_sample_game()
+    game.day = 1
+    game.phase = GamePhase.VOTING
+
+    first = game.target_candidates()
+    game.set_attack_target(game.players[4].id)
+    assert game.target_candidates() is first
+
+    game.kill_player(game.players[4].id, DeathReason.EXECUTED)
+    assert game.target_candidates() is not first
+    assert len(game.target_candidates()) == 5
+
+
+def test_no_candidates_when_acting_role_is_dead() -> None:
+    game = _build_sample_game()
+    game.day = 1
+    game.phase = GamePhase.NIGHT_KNIGHT
+    game.kill_player(game.players[3].id, DeathReason.ATTACKED)
+
+    assert _names(game) == []
@@ -0,0 +1,87 @@
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from werewolf_gm import tracing
+from werewolf_gm.bench.ui import FakePage, scenario_steps
+from werewolf_gm.cli import main
+from werewolf_gm.domain import Game, Role
+from werewolf_gm.ui.app import WerewolfApp
+
+
+@pytest.fixture
+def tracer():
+    tracer = tracing.enable()
+    yield tracer
+    tracing.disable()
+
+
+def _build_sample_game() -> Game:
+    game = Game()
+    game.add_player("Wolf", Role.WEREWOLF)
+    game.add_player("Seer", Role.SEER)
+    game.add_player("Alice", Role.CITIZEN)
+    game.add_player("Bob", Role.CITIZEN)
+    return game
+
+
+def test_spans_nest_in_chrome_trace(tracer) -> None:
+    with tracing.span("outer", "test"):
+        with tracing.span("inner", "test"):
+            pass
+
+    events = [event for event in tracer.to_chrome_trace()["traceEvents"] if event["ph"] == "X"]
+    inner, outer = events
+    assert (inner["name"], outer["name"]) == ("inner", "outer")
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+
+
+def test_domain_mutators_are_traced_only_while_enabled() -> None:
+    game = _build_sample_game()
+    game.start_game()
+    assert tracing.ACTIVE is None
+
+    tracer = tracing.enable()
+    try:
+        game.proceed_to_next_phase()
+    finally:
+        tracing.disable()
+
+    assert [event[0] for event in tracer.events] == ["Game.proceed_to_next_phase"]
+
+
+def test_buffer_keeps_newest_spans() -> None:
+    tracer = tracing.Tracer(max_events=2)
+    for name in ("a", "b", "c"):
+        with tracer.span(name):
+            pass
+
+    assert [event[0] for event in tracer.events] == ["b", "c"]
+
+
+def test_app_session_trace_covers_every_layer(tracer, tmp_path: Path) -> None:
+    app = WerewolfApp(FakePage())
+    for name, action in scenario_steps(app, 5, random.Random(0)):
+        action()
+        if name == "start_game":
+            break
+    app._on_next_phase(None)
+
+    path = tmp_path / "trace.json"
+    tracer.write(path)
+    events = json.loads(path.read_text(encoding="utf-8"))["traceEvents"]
+    assert {"handler", "domain", "view", "render", "update"} <= {event.get("cat") for event in events}
+    assert any(event["name"] == "_on_next_phase" for event in events)
+
+
+def test_simulate_writes_trace(tmp_path: Path, capsys) -> None:
+    path = tmp_path / "sim.json"
+
+    assert main(["simulate", "--games", "1", "--trace", str(path)]) == 0
+
+    assert tracing.ACTIVE is None
+    names = {event["name"] for event in json.loads(path.read_text(encoding="utf-8"))["traceEvents"]}
+    assert "Game.apply" in names
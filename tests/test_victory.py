@@ -1,3 +1,5 @@
+import pytest
+
 from werewolf_gm.domain import DeathReason, Game, Role, Team, VictoryState
 
 
@@ -40,3 +42,16 @@ def test_game_ongoing_when_no_victory_condition_met() -> None:
 
     assert game.victory.state is VictoryState.ONGOING
     assert game.victory.winner is None
+
+
+def test_kill_after_game_finished_is_rejected() -> None:
+    game = _build_sample_game()
+    werewolf = next(p for p in game.players if p.role is Role.WEREWOLF)
+    game.kill_player(werewolf.id, DeathReason.EXECUTED)
+    carol = next(p for p in game.players if p.name == "Carol")
+
+    with pytest.raises(ValueError):
+        game.kill_player(carol.id, DeathReason.OTHER)
+
+    assert carol.is_alive
+    assert game.victory.state is VictoryState.VILLAGER_WIN
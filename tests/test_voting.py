@@ -0,0 +1,137 @@
+from types import SimpleNamespace
+
+import flet as ft
+import pytest
+
+from werewolf_gm.bench.ui import FakePage
+from werewolf_gm.domain import DeathReason, FirstDaySeerRule, Game, GamePhase, Role, VoteTally
+from werewolf_gm.ui.app import WerewolfApp
+
+
+def _build_sample_game() -> Game:
+    game = Game()
+    game.add_player("Wolf", Role.WEREWOLF)
+    game.add_player("Seer", Role.SEER)
+    game.add_player("Knight", Role.KNIGHT)
+    game.add_player("Alice", Role.CITIZEN)
+    game.add_player("Bob", Role.CITIZEN)
+    return game
+
+
+def _tally_at_voting() -> tuple[Game, VoteTally]:
+    game = _build_sample_game()
+    game.start_game()
+    while game.phase is not GamePhase.VOTING:
+        game.proceed_to_next_phase()
+    return game, VoteTally.for_game(game)
+
+
+def test_tally_tracks_changed_votes() -> None:
+    game, tally = _tally_at_voting()
+    wolf, seer, knight, alice, bob = (p.id for p in game.players)
+
+    assert tally.cast(seer, wolf) == (wolf,)
+    assert tally.cast(knight, wolf) == (wolf,)
+    assert tally.cast(wolf, alice) == (alice,)
+    assert tally.result().winner_id == wolf
+
+    assert tally.cast(knight, alice) == (wolf, alice)
+    assert (tally.count(wolf), tally.count(alice)) == (1, 2)
+    assert tally.result().winner_id == alice
+
+    assert tally.cast(knight, None) == (alice,)
+    result = tally.result()
+    assert result.is_tie
+    assert result.leader_ids == (wolf, alice)
+    assert tally.pending_voter_ids() == [knight, alice, bob]
+
+
+def test_tally_rejects_invalid_votes() -> None:
+    game, tally = _tally_at_voting()
+    wolf, seer, knight, alice, bob = (p.id for p in game.players)
+
+    with pytest.raises(ValueError):
+        tally.cast(seer, seer)
+    with pytest.raises(ValueError):
+        tally.cast(seer, 999)
+    with pytest.raises(ValueError):
+        tally.cast(999, seer)
+
+
+def test_runoff_between_tied_leaders() -> None:
+    game, tally = _tally_at_voting()
+    wolf, seer, knight, alice, bob = (p.id for p in game.players)
+    tally.cast(seer, wolf)
+    tally.cast(wolf, alice)
+
+    runoff = tally.runoff()
+    assert runoff.round == 2
+    assert runoff.candidate_ids == (wolf, alice)
+    assert len(runoff) == 0
+    with pytest.raises(ValueError):
+        runoff.cast(seer, knight)
+
+    runoff.cast(seer, wolf)
+    game.kill_player(runoff.result().winner_id, DeathReason.EXECUTED)
+    assert not game.get_player(wolf).is_alive
+
+
+def test_runoff_requires_tie() -> None:
+    game, tally = _tally_at_voting()
+    wolf, seer, *_ = (p.id for p in game.players)
+    tally.cast(seer, wolf)
+
+    with pytest.raises(ValueError):
+        tally.runoff()
+    assert tally.revote().candidate_ids == tally.candidate_ids
+
+
+def test_top_count_follows_withdrawn_votes() -> None:
+    tally = VoteTally(range(10), range(10))
+    for voter in range(1, 6):
+        tally.cast(voter, 0)
+    tally.cast(0, 1)
+    assert tally.top_count == 5
+
+    for voter in range(1, 6):
+        tally.cast(voter, None)
+    assert tally.top_count == 1
+    assert tally.result().winner_id == 1
+
+
+def _controls(control):
+    yield control
+    for attribute in ("controls", "content"):
+        children = getattr(control, attribute, None)
+        if isinstance(children, list):
+            for child in children:
+                yield from _controls(child)
+        elif children is not None:
+            yield from _controls(children)
+
+
+def test_ballots_go_through_the_command_queue() -> None:
+    page = FakePage()
+    app = WerewolfApp(page)  # type: ignore[arg-type]
+    app.start()
+    page.go("/setup")
+    for name, role in (("Wolf", Role.WEREWOLF), ("Seer", Role.SEER), ("A", Role.CITIZEN), ("B", Role.CITIZEN)):
+        app._on_add_player(name, role)
+    app._on_start_game(180, 90, FirstDaySeerRule.FREE_SELECT)
+    game = app.state.game
+    while game.phase is not GamePhase.VOTING:
+        game.proceed_to_next_phase()
+    app._on_toggle_vote_tally(None)
+    wolf, seer = game.players[0].id, game.players[1].id
+    [ballot] = [
+        control
+        for control in _controls(page.views[-1])
+        if isinstance(control, ft.Dropdown) and control.label == "Seer の投票先"
+    ]
+
+    ballot.value = game.external_id(wolf)
+    ballot.on_select(SimpleNamespace(control=ballot))
+
+    assert app.commands.stats["_on_cast_vote"].count == 1
+    assert app.state.vote_tally is not None and app.state.vote_tally.votes == {seer: wolf}
+    assert app.vote_board_ref.current.tally is app.state.vote_tally